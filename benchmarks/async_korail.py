@@ -0,0 +1,94 @@
+"""Sync vs. asyncio Korail clients on N concurrent watch jobs.
+
+Each job polls ``search_train`` ``--polls`` times against a local stand-in
+server that answers every request after ``--latency`` seconds. The last
+mode runs the Korail jobs next to as many AsyncSRT jobs in the same loop.
+
+    python -m benchmarks.async_korail --jobs 50 --polls 5 --latency 0.1
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from srtgo.ktx import AsyncKorail, Korail
+from srtgo.srt import AsyncSRT
+from srtgo.standin import StandIn
+from srtgo.transport import Transport
+
+SEARCH = {"dep": "서울", "arr": "부산", "date": "20301231", "include_no_seats": True}
+SRT_SEARCH = {"dep": "수서", "arr": "부산", "date": "20301231", "available_only": False}
+
+
+def run_sync_sequential(jobs: int, polls: int) -> None:
+    korail = Korail("standin", "standin", auto_login=False)
+    for _ in range(polls):
+        for _ in range(jobs):
+            korail.search_train(**SEARCH)
+
+
+def run_sync_threads(jobs: int, polls: int) -> None:
+    def job():
+        korail = Korail("standin", "standin", auto_login=False)
+        for _ in range(polls):
+            korail.search_train(**SEARCH)
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        for future in [pool.submit(job) for _ in range(jobs)]:
+            future.result()
+
+
+async def run_async(jobs: int, polls: int, with_srt: bool = False) -> None:
+    # The async session multiplexes all jobs; size its pool to match
+    korail = AsyncKorail("standin", "standin", transport=Transport(max_connections=jobs))
+    srt = AsyncSRT("standin", "standin", transport=Transport(max_connections=jobs))
+
+    async def job():
+        for _ in range(polls):
+            await korail.search_train(**SEARCH)
+
+    async def srt_job():
+        for _ in range(polls):
+            await srt.search_train(**SRT_SEARCH)
+
+    tasks = [job() for _ in range(jobs)]
+    if with_srt:
+        tasks += [srt_job() for _ in range(jobs)]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        await korail.close()
+        await srt.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=20)
+    parser.add_argument("--polls", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.1)
+    args = parser.parse_args()
+
+    modes = {
+        "sync (1 thread)": (1, lambda: run_sync_sequential(args.jobs, args.polls)),
+        f"sync ({args.jobs} threads)": (
+            1, lambda: run_sync_threads(args.jobs, args.polls)
+        ),
+        "async (1 loop)": (1, lambda: asyncio.run(run_async(args.jobs, args.polls))),
+        "async + SRT jobs": (
+            2, lambda: asyncio.run(run_async(args.jobs, args.polls, with_srt=True))
+        ),
+    }
+
+    print(f"{args.jobs} jobs x {args.polls} polls, {args.latency * 1000:.0f} ms latency")
+    with StandIn(latency=args.latency) as standin, standin.patch():
+        for name, (services, run) in modes.items():
+            total = args.jobs * args.polls * services
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+            print(f"{name:<20s} {elapsed:8.2f} s {total / elapsed:8.1f} polls/s")
+
+
+if __name__ == "__main__":
+    main()
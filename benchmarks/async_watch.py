@@ -0,0 +1,77 @@
+"""Sync vs. asyncio SRT clients on N concurrent watch jobs.
+
+Each job polls ``search_train`` ``--polls`` times against a local stand-in
+server that answers every request after ``--latency`` seconds.
+
+    python -m benchmarks.async_watch --jobs 50 --polls 5 --latency 0.1
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from srtgo.srt import SRT, AsyncSRT
+from srtgo.standin import StandIn
+from srtgo.transport import Transport
+
+SEARCH = {"dep": "수서", "arr": "부산", "date": "20301231", "available_only": False}
+
+
+def run_sync_sequential(jobs: int, polls: int) -> None:
+    srt = SRT("standin", "standin", auto_login=False)
+    for _ in range(polls):
+        for _ in range(jobs):
+            srt.search_train(**SEARCH)
+
+
+def run_sync_threads(jobs: int, polls: int) -> None:
+    def job():
+        srt = SRT("standin", "standin", auto_login=False)
+        for _ in range(polls):
+            srt.search_train(**SEARCH)
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        for future in [pool.submit(job) for _ in range(jobs)]:
+            future.result()
+
+
+async def run_async(jobs: int, polls: int) -> None:
+    # The async session multiplexes all jobs; size its pool to match
+    srt = AsyncSRT("standin", "standin", transport=Transport(max_connections=jobs))
+
+    async def job():
+        for _ in range(polls):
+            await srt.search_train(**SEARCH)
+
+    try:
+        await asyncio.gather(*(job() for _ in range(jobs)))
+    finally:
+        await srt.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=20)
+    parser.add_argument("--polls", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.1)
+    args = parser.parse_args()
+
+    modes = {
+        "sync (1 thread)": lambda: run_sync_sequential(args.jobs, args.polls),
+        f"sync ({args.jobs} threads)": lambda: run_sync_threads(args.jobs, args.polls),
+        "async (1 loop)": lambda: asyncio.run(run_async(args.jobs, args.polls)),
+    }
+
+    total = args.jobs * args.polls
+    print(f"{args.jobs} jobs x {args.polls} polls, {args.latency * 1000:.0f} ms latency")
+    with StandIn(latency=args.latency) as standin, standin.patch():
+        for name, run in modes.items():
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+            print(f"{name:<20s} {elapsed:8.2f} s {total / elapsed:8.1f} polls/s")
+
+
+if __name__ == "__main__":
+    main()
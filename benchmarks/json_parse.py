@@ -0,0 +1,79 @@
+"""Per-response JSON parse time of the stdlib and orjson backends.
+
+Payloads are stand-in responses of realistic size: a search returns 10 to
+40 trains, a reservation list a handful of entries. ``text`` is what the
+clients used to do (decode the body, then ``json.loads``); ``bytes`` parses
+``r.content`` directly, as srtgo.jsonlib does.
+
+    python -m benchmarks.json_parse --rows 10 --rows 40
+"""
+
+import argparse
+import json
+
+from srtgo import srt
+from srtgo.bench import korail_search_response, measure, srt_search_response
+from srtgo.standin import reservation_rows, train_row
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def srt_reservations_response(rows: int) -> str:
+    pairs = [reservation_rows(f"PNR{i:04d}", train_row(i), 2) for i in range(rows)]
+    body = {
+        "resultMap": [{"strResult": "SUCC", "msgTxt": ""}],
+        "trainListMap": [train for train, _ in pairs],
+        "payListMap": [pay for _, pay in pairs],
+    }
+    return json.dumps(body, ensure_ascii=False)
+
+
+PAYLOADS = {
+    "srt search": srt_search_response,
+    "korail search": korail_search_response,
+    "srt reservations": srt_reservations_response,
+}
+
+
+def cases(body: bytes) -> dict:
+    parsers = {
+        "json.loads(text)": lambda: json.loads(body.decode("utf-8")),
+        "json.loads(bytes)": lambda: json.loads(body),
+    }
+    if orjson is not None:
+        parsers["orjson.loads(bytes)"] = lambda: orjson.loads(body)
+    return parsers
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, action="append")
+    args = parser.parse_args()
+
+    for rows in args.rows or [10, 40]:
+        for name, build in PAYLOADS.items():
+            body = build(rows).encode("utf-8")
+            print(f"{name}, {rows} rows ({len(body) / 1024:.1f} KiB)")
+            base = None
+            for case, fn in cases(body).items():
+                seconds = measure(fn)
+                base = base or seconds
+                print(f"  {case:<22s} {seconds * 1e6:8.1f} us  x{base / seconds:4.1f}")
+
+        # Old access pattern: parse the text, then copy the document per lookup
+        body = srt_search_response(rows).encode("utf-8")
+        old = measure(
+            lambda: srt.SRTResponseData(body.decode("utf-8")).get_all()["outDataSets"]
+        )
+        new = measure(lambda: srt.SRTResponseData(body)["outDataSets"])
+        print(
+            f"SRTResponseData, {rows} rows: get_all() on text {old * 1e6:.1f} us, "
+            f"indexing on bytes {new * 1e6:.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
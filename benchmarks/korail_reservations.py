@@ -0,0 +1,47 @@
+"""Round trips and latency of listing Korail reservations and of reserve().
+
+    python -m benchmarks.korail_reservations --reservations 10 --latency 0.1
+"""
+
+import argparse
+import time
+
+from srtgo.ktx import Korail, Train
+from srtgo.standin import StandIn, korail_train_row
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reservations", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.1)
+    args = parser.parse_args()
+
+    last = f"{args.reservations:014d}"
+    cases = {
+        "list view (lazy)": lambda korail: [str(r) for r in korail.reservations()],
+        "list + seats, sequential": lambda korail: [
+            r.tickets for r in korail.reservations()
+        ],
+        "list + seats, concurrent": lambda korail: korail.reservations(
+            with_tickets=True
+        ),
+        "reservations(rsv_id)": lambda korail: korail.reservations(last),
+        "reserve()": lambda korail: korail.reserve(
+            Train(korail_train_row(0, available=True))
+        ),
+    }
+
+    print(f"{args.reservations} reservations, {args.latency * 1000:.0f} ms latency")
+    with StandIn(args.latency, reservations=args.reservations) as standin, standin.patch():
+        korail = Korail("standin", "standin", auto_login=False)
+        for name, case in cases.items():
+            standin.hits.clear()
+            start = time.perf_counter()
+            case(korail)
+            elapsed = time.perf_counter() - start
+            trips = sum(standin.hits.values())
+            print(f"{name:<26s} {trips:3d} requests {elapsed:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Round trips and latency of listing Korail tickets.
+
+    python -m benchmarks.korail_tickets --tickets 25 --latency 0.1
+"""
+
+import argparse
+import asyncio
+import time
+
+from srtgo.ktx import AsyncKorail, Korail
+from srtgo.standin import StandIn
+
+
+async def _async_tickets() -> list:
+    korail = AsyncKorail("standin", "standin")
+    try:
+        return await korail.tickets()
+    finally:
+        await korail.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tickets", type=int, default=25)
+    parser.add_argument("--latency", type=float, default=0.1)
+    args = parser.parse_args()
+
+    cases = {
+        "list only (lazy seats)": lambda korail: korail.tickets(with_seats=False),
+        "list + seats, sequential": lambda korail: korail.tickets(concurrency=1),
+        "list + seats, concurrent": lambda korail: korail.tickets(),
+        "list + seats, async": lambda korail: asyncio.run(_async_tickets()),
+    }
+
+    print(f"{args.tickets} tickets, {args.latency * 1000:.0f} ms latency")
+    with StandIn(args.latency, tickets=args.tickets) as standin, standin.patch():
+        korail = Korail("standin", "standin", auto_login=False)
+        for name, case in cases.items():
+            standin.hits.clear()
+            start = time.perf_counter()
+            tickets = case(korail)
+            elapsed = time.perf_counter() - start
+            trips = sum(standin.hits.values())
+            print(f"{name:<26s} {len(tickets):3d} tickets {trips:3d} requests {elapsed:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""Wasted requests and detection latency of the reserve-loop poll spacing.
+
+A virtual-time simulation, so it runs in well under a second. The server
+is healthy most of the time and has overload episodes during which it
+answers slowly, mostly with "사용자가 많아 접속이 원활하지 않습니다", and
+queues NetFunnel keys. Seats open at random times and are taken again
+after ``window`` seconds.
+
+``fixed`` is the old ``_sleep()``: the same jittered 1.25 s delay after
+every poll, whatever the answer. ``adaptive`` is PollScheduler fed the way
+the reserve loop feeds it, and ``fixed N s`` a fixed delay sending as many
+requests as ``adaptive`` does. A request is wasted when the server answers it
+with an error; a seat is detected by the first answered poll after it
+opened, and missed when no answered poll falls inside its window.
+
+    python -m benchmarks.poll_scheduler --hours 24 --seed 1
+
+A single run has only a few hundred overload openings, so misses vary a lot
+between seeds; ``--seeds 30`` sums 30 runs for a steadier comparison.
+"""
+
+import argparse
+import bisect
+import random
+import statistics
+from random import gammavariate
+
+from srtgo.scheduler import POLL_CEILING, POLL_INTERVAL, PollScheduler
+
+HEALTHY_LATENCY = 0.15  # 정상 응답 시간 (초)
+BUSY_LATENCY = 2.0  # 과부하 응답 시간 (초)
+BUSY_RATE = 0.7  # 과부하 중 오류 응답 비율
+BUSY_NWAIT = 400  # 과부하 중 NetFunnel 대기 인원
+KEY_TTL = 60  # NetFunnel 키 재발급 주기 (초)
+
+
+class Server:
+    """Overload episodes and seat openings over ``duration`` seconds."""
+
+    def __init__(
+        self,
+        rng: random.Random,
+        duration: float,
+        overload_share: float,
+        episode: float,
+        openings: int,
+        window: float,
+        busy_rate: float = BUSY_RATE,
+    ) -> None:
+        self.rng = rng
+        self.busy_rate = busy_rate
+        self.episodes = []
+        count = int(duration * overload_share / episode)
+        for start in sorted(rng.uniform(0, duration - episode) for _ in range(count)):
+            if self.episodes and start < self.episodes[-1][1]:
+                start = self.episodes[-1][1]
+            self.episodes.append((start, start + episode))
+        self.starts = [start for start, _ in self.episodes]
+        self.opened = sorted(rng.uniform(0, duration) for _ in range(openings))
+        self.window = window
+
+    def overloaded(self, t: float) -> bool:
+        i = bisect.bisect_right(self.starts, t) - 1
+        return i >= 0 and t < self.episodes[i][1]
+
+    def open_at(self, t: float) -> range:
+        """Indices of the openings whose seat is available at ``t``."""
+        return range(
+            bisect.bisect_right(self.opened, t - self.window),
+            bisect.bisect_right(self.opened, t),
+        )
+
+    def answer(self, t: float) -> tuple[float, bool]:
+        """(latency, busy) of a request sent at ``t``."""
+        if self.overloaded(t):
+            return self.rng.expovariate(1 / BUSY_LATENCY), self.rng.random() < self.busy_rate
+        return self.rng.expovariate(1 / HEALTHY_LATENCY), False
+
+
+def fixed(interval: float = POLL_INTERVAL):
+    floor = interval / 5
+
+    def delay(latency, busy, nwait):
+        return gammavariate(4, floor) + floor
+
+    return delay
+
+
+def adaptive(ceiling: float):
+    scheduler = PollScheduler(ceiling=ceiling)
+
+    def delay(latency, busy, nwait):
+        if busy:
+            scheduler.failure(busy=True)
+        else:
+            scheduler.success(latency)
+            if nwait is not None:
+                scheduler.queue(nwait)
+        return scheduler.delay()
+
+    return delay
+
+
+def simulate(server: Server, policy, duration: float) -> dict:
+    requests = wasted = 0
+    detected = {}  # opening index -> detection latency
+    next_key = 0.0
+    t = 0.0
+    while t < duration:
+        latency, busy = server.answer(t)
+        requests += 1
+        wasted += busy
+
+        nwait = None
+        if t >= next_key:
+            nwait = BUSY_NWAIT if server.overloaded(t) else 0
+            next_key = t + KEY_TTL
+
+        if not busy:
+            for i in server.open_at(t):
+                if i not in detected:
+                    detected[i] = t + latency - server.opened[i]
+        t += latency + policy(latency, busy, nwait)
+
+    result = {"requests": requests, "wasted": wasted}
+    for label, overloaded in (("healthy", False), ("overload", True)):
+        openings = [
+            i for i, opened in enumerate(server.opened)
+            if server.overloaded(opened) == overloaded
+        ]
+        result[label] = {
+            "openings": len(openings),
+            "latencies": [detected[i] for i in openings if i in detected],
+        }
+    return result
+
+
+def merge(results: list[dict]) -> dict:
+    """Totals of several runs, with detection latency median/p90 and misses."""
+    merged = {
+        "requests": sum(r["requests"] for r in results),
+        "wasted": sum(r["wasted"] for r in results),
+    }
+    for label in ("healthy", "overload"):
+        openings = sum(r[label]["openings"] for r in results)
+        latencies = [t for r in results for t in r[label]["latencies"]]
+        merged[label] = {
+            "openings": openings,
+            "missed": openings - len(latencies),
+            "median": statistics.median(latencies) if latencies else None,
+            "p90": (
+                statistics.quantiles(latencies, n=10)[-1] if len(latencies) > 1 else None
+            ),
+        }
+    return merged
+
+
+def _seconds(value) -> str:
+    return "     -" if value is None else f"{value:6.2f}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hours", type=float, default=24)
+    parser.add_argument("--overload", type=float, default=0.2, help="share of time overloaded")
+    parser.add_argument("--episode", type=float, default=300, help="overload episode (s)")
+    parser.add_argument("--busy-rate", type=float, default=BUSY_RATE)
+    parser.add_argument("--openings", type=int, default=2000)
+    parser.add_argument("--window", type=float, default=30, help="seconds a seat stays open")
+    parser.add_argument("--ceiling", type=float, default=POLL_CEILING)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--seeds", type=int, default=1, help="sum this many runs from --seed on"
+    )
+    args = parser.parse_args()
+
+    duration = args.hours * 3600
+
+    def run(make_policy) -> dict:
+        results = []
+        for seed in range(args.seed, args.seed + args.seeds):
+            rng = random.Random(seed)
+            server = Server(
+                rng, duration, args.overload, args.episode, args.openings,
+                args.window, args.busy_rate,
+            )
+            random.seed(seed)  # 간격 지터
+            results.append(simulate(server, make_policy(), duration))
+        return merge(results)
+
+    results = {
+        "fixed": run(fixed),
+        "adaptive": run(lambda: adaptive(args.ceiling)),
+    }
+    # 같은 요청 수를 쓰는 고정 간격과도 비교
+    interval = POLL_INTERVAL * results["fixed"]["requests"] / results["adaptive"]["requests"]
+    results[f"fixed {interval:.2f}s"] = run(lambda: fixed(interval))
+
+    runs = f" x {args.seeds} runs" if args.seeds > 1 else ""
+    print(
+        f"{args.hours:g} h{runs}, {args.overload:.0%} overloaded in {args.episode:g} s "
+        f"episodes ({args.busy_rate:.0%} busy), {args.openings} openings of "
+        f"{args.window:g} s"
+    )
+    print(
+        f"{'policy':<12s} {'requests':>9s} {'wasted':>7s}"
+        f"  {'healthy median/p90/missed':>27s}  {'overload median/p90/missed':>28s}"
+    )
+    for name, r in results.items():
+        cells = [
+            f"{_seconds(r[k]['median'])} {_seconds(r[k]['p90'])} "
+            f"{r[k]['missed']:4d}/{r[k]['openings']:<5d}"
+            for k in ("healthy", "overload")
+        ]
+        print(f"{name:<12s} {r['requests']:9d} {r['wasted']:7d}  {cells[0]:>27s}  {cells[1]:>28s}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Recovery latency after a dropped login, against a stand-in server.
+
+"Recovery" is the time from the "로그인 후 사용하십시오" error to the next
+successful search. ``new_client`` is what the reserve loop used to do (build
+a fresh SRT, which logs in on a new connection and has to queue at NetFunnel
+again); ``relogin`` re-authenticates on the existing client. ``korail``
+is Korail.relogin(), which reuses the cached password encryption key.
+
+The stand-in speaks plain HTTP, so the TLS handshake a new client pays
+against the real servers is not included; the real gap is larger.
+
+    python -m benchmarks.relogin_latency --latency 0.05 --rounds 20
+"""
+
+import argparse
+import statistics
+import time
+
+from srtgo.ktx import Korail
+from srtgo.srt import SRT
+from srtgo.standin import StandIn
+from srtgo.throttle import ReloginThrottle
+
+SEARCH = dict(dep="수서", arr="부산", date="20301231", time="000000", available_only=False)
+
+
+def new_client(srt: SRT) -> SRT:
+    srt = SRT(srt.srt_id, srt.srt_pw)
+    srt.search_train(**SEARCH)
+    return srt
+
+
+def relogin(srt: SRT) -> SRT:
+    srt._relogin_throttle = ReloginThrottle(base=0)  # measure the request path only
+    srt.relogin()
+    srt.search_train(**SEARCH)
+    return srt
+
+
+def korail_relogin(latency: float, rounds: int) -> tuple[float, list[float]]:
+    with StandIn(latency) as standin, standin.patch():
+        korail = Korail("standin", "standin")
+        korail._relogin_throttle = ReloginThrottle(base=0)
+        standin.hits.clear()
+
+        samples = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            korail.relogin()
+            samples.append(time.perf_counter() - start)
+    return sum(standin.hits.values()) / rounds, samples
+
+
+def _report(name: str, trips: float, samples: list[float]) -> None:
+    print(
+        f"{name:<10s} {trips:4.1f} requests "
+        f"median {statistics.median(samples) * 1000:6.0f} ms "
+        f"max {max(samples) * 1000:6.0f} ms"
+    )
+
+
+def storm(errors: int, spacing: float) -> int:
+    """Logins started by ``errors`` failures ``spacing`` seconds apart in a minute."""
+    throttle = ReloginThrottle()
+    now, logins, window = 0.0, 0, 60.0
+    for _ in range(errors):
+        start = now + throttle.delay(now)
+        if start >= window:
+            break
+        logins += 1
+        now = start + spacing
+    return logins
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{args.latency * 1000:.0f} ms latency, {args.rounds} rounds")
+    for case in (new_client, relogin):
+        with StandIn(args.latency) as standin, standin.patch():
+            srt = SRT("standin", "standin")
+            srt.search_train(**SEARCH)
+            standin.hits.clear()
+
+            samples = []
+            for _ in range(args.rounds):
+                start = time.perf_counter()
+                srt = case(srt)
+                samples.append(time.perf_counter() - start)
+
+        _report(case.__name__, sum(standin.hits.values()) / args.rounds, samples)
+    _report("korail", *korail_relogin(args.latency, args.rounds))
+
+    print(f"login storm: 1000 errors 50 ms apart -> {storm(1000, 0.05)} logins/min")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Round trips and latency of listing SRT reservations.
+
+    python -m benchmarks.reservations --reservations 10 --latency 0.1
+"""
+
+import argparse
+import time
+
+from srtgo.srt import SRT
+from srtgo.standin import StandIn
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reservations", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.1)
+    args = parser.parse_args()
+
+    cases = {
+        "list only (lazy)": lambda srt: srt.get_reservations(),
+        "list + tickets, sequential": lambda srt: [
+            r.tickets for r in srt.get_reservations()
+        ],
+        "list + tickets, concurrent": lambda srt: srt.get_reservations(
+            with_tickets=True
+        ),
+    }
+
+    print(f"{args.reservations} reservations, {args.latency * 1000:.0f} ms latency")
+    with StandIn(args.latency, reservations=args.reservations) as standin, standin.patch():
+        srt = SRT("standin", "standin", auto_login=False)
+        srt.is_login = True
+        for name, case in cases.items():
+            standin.hits.clear()
+            start = time.perf_counter()
+            case(srt)
+            elapsed = time.perf_counter() - start
+            trips = sum(standin.hits.values())
+            print(f"{name:<28s} {trips:3d} requests {elapsed:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
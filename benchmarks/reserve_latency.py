@@ -0,0 +1,75 @@
+"""Reserve-to-pay-ready latency of SRT._reserve against a stand-in server.
+
+"Pay-ready" means holding an SRTReservation with the total cost, seat count
+and tickets that pay_with_card needs.
+
+    python -m benchmarks.reserve_latency --reservations 10 --latency 0.1
+"""
+
+import argparse
+import time
+
+from srtgo.srt import API_ENDPOINTS, RESERVE_JOBID, SRT, SRTTrain, SeatType
+from srtgo.standin import StandIn, train_row
+
+
+def _post_reserve(srt: SRT, train: SRTTrain) -> str:
+    data = srt._reserve_data(
+        RESERVE_JOBID["PERSONAL"], train, None, SeatType.GENERAL_FIRST, None, None
+    )
+    data["netfunnelKey"] = srt._netfunnel.run()
+    r = srt._session.post(url=API_ENDPOINTS["reserve"], data=data)
+    return srt._parse_reserve(r.text)["pnrNo"]
+
+
+def full_scan(srt: SRT, train: SRTTrain):
+    """Reserve, then list every reservation with every ticket list."""
+    pnr_no = _post_reserve(srt, train)
+    reservations = srt.get_reservations()
+    for reservation in reservations:
+        reservation.tickets
+    return next(r for r in reservations if r.reservation_number == pnr_no)
+
+
+def list_scan(srt: SRT, train: SRTTrain):
+    """Reserve, then find the reservation in the (lazily loaded) list."""
+    reservation = srt._find_reservation(_post_reserve(srt, train))
+    reservation.tickets
+    return reservation
+
+
+def direct(srt: SRT, train: SRTTrain):
+    """SRT.reserve: reserve response plus one ticket_info lookup."""
+    return srt.reserve(train)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reservations", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.1)
+    args = parser.parse_args()
+
+    train = SRTTrain(train_row(0, available=True))
+    print(
+        f"{args.reservations} existing reservations, "
+        f"{args.latency * 1000:.0f} ms latency"
+    )
+    for case in (full_scan, list_scan, direct):
+        with StandIn(args.latency, reservations=args.reservations) as standin:
+            with standin.patch():
+                srt = SRT("standin", "standin", auto_login=False)
+                srt.is_login = True
+                srt._netfunnel.run()
+                standin.hits.clear()
+
+                start = time.perf_counter()
+                reservation = case(srt, train)
+                elapsed = time.perf_counter() - start
+
+        assert reservation.total_cost and reservation.tickets
+        trips = sum(standin.hits.values())
+        print(f"{case.__name__:<10s} {trips:3d} requests {elapsed * 1000:8.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
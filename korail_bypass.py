@@ -10,22 +10,16 @@ srtgo/ktx.py의 Korail 클래스를 상속하여
 """
 
 import asyncio
-import json
 import re
+import threading
 import time
 from datetime import datetime, timedelta
-from json.decoder import JSONDecodeError
-from random import gammavariate
 
 from Crypto.PublicKey import RSA
 from Crypto.Cipher import PKCS1_v1_5
 
-try:
-    from curl_cffi.requests.exceptions import ConnectionError as CurlConnectionError
-except ImportError:
-    from requests.exceptions import ConnectionError as CurlConnectionError
-
 import srtgo.ktx as ktx
+from srtgo import jsonlib
 from srtgo.ktx import (
     Korail,
     KorailError,
@@ -37,6 +31,7 @@ from srtgo.ktx import (
     Disability1To3Passenger,
     Disability4To6Passenger,
 )
+from srtgo.retry import Action, ErrorKind, RetryPolicy
 
 # ── KorailBypass 클래스 ─────────────────────────────────────────────
 
@@ -50,14 +45,82 @@ _PATCHED_ENDPOINTS = {
 }
 
 MAX_LOGIN_RETRIES = 5
+LOGIN_RETRY_BASE = 0.5  # 로그인 재시도 첫 대기 (초), 시도마다 두 배
+LOGIN_RETRY_CAP = 8.0  # 로그인 재시도 대기 상한 (초)
+RSA_KEY_ERROR_WORDS = ("복호화", "암호화", "공개키", "RSA")  # 공개키 문제로 보는 로그인 실패 메시지
+
+
+class RsaKeyCache:
+    """PKCS#1 v1.5 ciphers of the pblk public keys, by keyname.
+
+    The current key is reused for every login, by every client of the
+    process, until the server rejects a login encrypted with it. Clients
+    may log in from several threads, so every access takes the lock.
+    """
+
+    def __init__(self):
+        self._ciphers = {}
+        self._current = None
+        self._lock = threading.Lock()
+
+    def current(self):
+        """(keyname, cipher) of the current key, or None."""
+        with self._lock:
+            if self._current is None:
+                return None
+            return self._current, self._ciphers[self._current]
+
+    def put(self, keyname, modulus, exponent):
+        """Make a fetched key current; the cipher is built once per keyname."""
+        with self._lock:
+            if keyname not in self._ciphers:
+                rsa_key = RSA.construct((int(modulus, 16), int(exponent, 16)))
+                self._ciphers[keyname] = PKCS1_v1_5.new(rsa_key)
+            self._current = keyname
+            return keyname, self._ciphers[keyname]
+
+    def reject(self, keyname):
+        with self._lock:
+            self._ciphers.pop(keyname, None)
+            if self._current == keyname:
+                self._current = None
+
+
+def _is_key_error(j):
+    """Whether a failed login blames the public key rather than the account.
+
+    Failures without a message code, or whose message mentions the key or
+    its encryption, count; account errors such as a wrong password keep
+    the key for the next attempt.
+    """
+    message = j.get("h_msg_txt", "")
+    return not j.get("h_msg_cd") or any(word in message for word in RSA_KEY_ERROR_WORDS)
+
+
+_RSA_KEYS = RsaKeyCache()
 
 
 class KorailBypass(Korail):
     """MACRO 우회 Korail 클라이언트. Korail과 동일한 인터페이스."""
 
-    def __init__(self, korail_id, korail_pw, auto_login=True, verbose=False):
+    def __init__(
+        self,
+        korail_id,
+        korail_pw,
+        auto_login=True,
+        verbose=False,
+        timeouts=None,
+        transport=None,
+    ):
         self._patch_endpoints()
-        super().__init__(korail_id, korail_pw, auto_login=False, verbose=verbose)
+        super().__init__(
+            korail_id,
+            korail_pw,
+            auto_login=False,
+            verbose=verbose,
+            timeouts=timeouts,
+            transport=transport,
+        )
         self._session.headers["Host"] = "www.korail.com"
         if auto_login:
             self.login(korail_id, korail_pw)
@@ -67,17 +130,20 @@ class KorailBypass(Korail):
         ktx.API_ENDPOINTS.update(_PATCHED_ENDPOINTS)
 
     def _get_rsa_key(self):
-        r = self._session.get(PBLK_URL)
-        j = json.loads(r.text)
+        """(keyname, cipher) of the current public key, fetched if none is cached."""
+        cached = _RSA_KEYS.current()
+        if cached:
+            return cached
+        r = self._get("pblk", url=PBLK_URL)
+        j = jsonlib.loads(r.content)
         if j.get("strResult") != "SUCC" or not j.get("publicKeyModulus"):
             raise KorailError("RSA 공개키 획득 실패")
-        modulus = int(j["publicKeyModulus"], 16)
-        exponent = int(j["publicKeyExponent"], 16)
-        return RSA.construct((modulus, exponent)), j["keyname"]
+        return _RSA_KEYS.put(
+            j["keyname"], j["publicKeyModulus"], j["publicKeyExponent"]
+        )
 
     def _enc_password_rsa(self, password):
-        rsa_key, keyname = self._get_rsa_key()
-        cipher = PKCS1_v1_5.new(rsa_key)
+        keyname, cipher = self._get_rsa_key()
         return keyname, cipher.encrypt(password.encode("utf-8")).hex()
 
     def login(self, korail_id=None, korail_pw=None):
@@ -93,6 +159,8 @@ class KorailBypass(Korail):
         )
 
         for attempt in range(MAX_LOGIN_RETRIES):
+            if attempt:
+                time.sleep(min(LOGIN_RETRY_CAP, LOGIN_RETRY_BASE * 2 ** (attempt - 1)))
             keyname, enc_pw = self._enc_password_rsa(self.korail_pw)
             data = {
                 "Device": self._device,
@@ -103,9 +171,9 @@ class KorailBypass(Korail):
                 "txtInputFlg": txt_input_flg,
                 "idx": keyname,
             }
-            r = self._session.post(ktx.API_ENDPOINTS["login"], data=data)
-            self._log(r.text)
-            j = json.loads(r.text)
+            r = self._post("login", data=data)
+            self._log(r.content)
+            j = jsonlib.loads(r.content)
 
             if j.get("strResult") == "SUCC" and j.get("strMbCrdNo"):
                 self.membership_number = j["strMbCrdNo"]
@@ -121,6 +189,8 @@ class KorailBypass(Korail):
                 raise KorailError(j.get("h_msg_txt", "MACRO ERROR"), h_msg_cd)
             if h_msg_cd == "WRC000390":
                 raise KorailError(j.get("h_msg_txt", "계정 잠김"), h_msg_cd)
+            if _is_key_error(j):
+                _RSA_KEYS.reject(keyname)  # 다음 시도는 새 공개키로
             self._log(f"로그인 시도 {attempt + 1}/{MAX_LOGIN_RETRIES} 실패: {h_msg_cd}")
 
         self.logined = False
@@ -146,9 +216,6 @@ if __name__ == "__main__":
     ]
     DEFAULT_STATIONS = ["서울", "대전", "동대구", "부산"]
     WAITING_BAR = ["|", "/", "-", "\\"]
-    RESERVE_INTERVAL_SHAPE = 4
-    RESERVE_INTERVAL_SCALE = 0.25
-    RESERVE_INTERVAL_MIN = 0.25
 
     PASSENGER_CLASSES = {
         "adult": AdultPassenger,
@@ -167,9 +234,6 @@ if __name__ == "__main__":
 
     # ── helpers ──
 
-    def _sleep():
-        time.sleep(gammavariate(RESERVE_INTERVAL_SHAPE, RESERVE_INTERVAL_SCALE) + RESERVE_INTERVAL_MIN)
-
     def get_telegram():
         token = keyring.get_password("telegram", "token")
         chat_id = keyring.get_password("telegram", "chat_id")
@@ -197,6 +261,14 @@ if __name__ == "__main__":
         asyncio.run(tgprintf(msg))
         return inquirer.confirm(message="계속할까요", default=True)
 
+    def _relogin(rail):
+        """같은 클라이언트로 다시 로그인 (세션과 캐시 유지). 실패는 출력만 하고 다음 조회에서 재시도."""
+        try:
+            return rail.relogin()
+        except (KorailError, jsonlib.JSONDecodeError, OSError) as ex:
+            print(f"\n재로그인 실패: {ex}")
+            return False
+
     def _is_seat_available(train, seat_type):
         if not train.has_seat():
             return train.has_waiting_list()
@@ -445,6 +517,7 @@ if __name__ == "__main__":
                 msg += "\n결제 완료"
             asyncio.run(get_telegram()(msg))
 
+        policy = RetryPolicy()
         i_try = 0
         start_time = time.time()
         while True:
@@ -454,34 +527,28 @@ if __name__ == "__main__":
                 h, m, s = elapsed // 3600, elapsed % 3600 // 60, elapsed % 60
                 print(f"\r예매 대기 중... {WAITING_BAR[i_try & 3]} {i_try:4d} ({h:02d}:{m:02d}:{s:02d}) ", end="", flush=True)
 
+                started = time.monotonic()
                 trains = rail.search_train(**search_params)
+                policy.success(time.monotonic() - started)
                 for i in choice["trains"]:
                     if _is_seat_available(trains[i], opts["type"]):
                         _reserve(trains[i])
                         return
-                _sleep()
+                policy.wait()
 
-            except KorailError as ex:
-                msg = ex.msg
-                if "Need to Login" in msg:
-                    rail = do_login(debug)
-                    if not rail.logined and not _handle_error(ex):
+            except Exception as ex:
+                decision = policy.decide(ex)
+                if policy.tripped:
+                    print(f"\n오류가 계속되어 {policy.breaker.cooldown:.0f}초 동안 조회를 멈춥니다")
+                if decision.action is Action.RELOGIN:
+                    if not _relogin(rail) and decision.kind is ErrorKind.LOGIN and not _handle_error(ex):
                         return
-                elif not any(err in msg for err in ("Sold out", "잔여석없음", "예약대기자한도수초과")):
+                elif decision.action is Action.RAISE:
                     if not _handle_error(ex):
                         return
-                _sleep()
-            except JSONDecodeError:
-                _sleep()
-                rail = do_login(debug)
-            except CurlConnectionError as ex:
-                if not _handle_error(ex, "연결이 끊겼습니다"):
-                    return
-                rail = do_login(debug)
-            except Exception as ex:
-                if not _handle_error(ex):
-                    return
-                rail = do_login(debug)
+                    if not isinstance(ex, KorailError):
+                        _relogin(rail)
+                policy.wait()
 
     # ── 예매 확인/결제/취소 ──
 
@@ -0,0 +1,209 @@
+"""Availability transitions between consecutive search results.
+
+``AvailabilityDiff`` keeps a hash of each train's raw search row, keyed by
+train number. Only rows that changed since the previous poll are decoded,
+and only the changes are reported, e.g. "일반실 매진 → 예약가능" or
+"예약대기 열림":
+
+    diff = AvailabilityDiff()
+    while True:
+        for transition in diff.update(srt.search_rows(search)):
+            print(transition)
+"""
+
+from enum import Enum
+from typing import Callable, Iterable, NamedTuple
+
+
+class Seats(NamedTuple):
+    general: bool
+    special: bool
+    standby: bool
+
+    def reservable(self, option=None) -> bool:
+        """Whether a reservation with ``option`` can go through.
+
+        Args:
+            option: SeatType or ReserveOption (default: any seat class).
+                A sold-out train is reservable when its standby list is open.
+        """
+        if not (self.general or self.special):
+            return self.standby
+        name = getattr(option, "name", option)
+        if name == "GENERAL_ONLY":
+            return self.general
+        if name == "SPECIAL_ONLY":
+            return self.special
+        return True
+
+
+SOLD_OUT = Seats(False, False, False)
+
+
+def srt_seats(row: dict) -> Seats:
+    """Seats of an SRT ``dsOutput1`` row."""
+    return Seats(
+        "예약가능" in row["gnrmRsvPsbStr"],
+        "예약가능" in row["sprmRsvPsbStr"],
+        int(row["rsvWaitPsbCd"]) == 9,  # 9: 예약대기 가능
+    )
+
+
+def korail_seats(row: dict) -> Seats:
+    """Seats of a Korail ``trn_info`` row."""
+    return Seats(
+        row.get("h_gen_rsv_cd") == "11",
+        row.get("h_spe_rsv_cd") == "11",
+        int(row.get("h_wait_rsv_flg") or -1) == 9,
+    )
+
+
+class Change(Enum):
+    GENERAL_OPENED = "일반실 매진 → 예약가능"
+    GENERAL_CLOSED = "일반실 예약가능 → 매진"
+    SPECIAL_OPENED = "특실 매진 → 예약가능"
+    SPECIAL_CLOSED = "특실 예약가능 → 매진"
+    STANDBY_OPENED = "예약대기 열림"
+    STANDBY_CLOSED = "예약대기 닫힘"
+    RESERVABLE = "예약가능"  # 다른 좌석이 닫혀 예약대기로 예약할 수 있게 됨
+    GONE = "조회 결과에서 사라짐"
+
+
+_OPENED = {
+    Change.GENERAL_OPENED,
+    Change.SPECIAL_OPENED,
+    Change.STANDBY_OPENED,
+    Change.RESERVABLE,
+}
+
+# Seats 필드별 (열림, 닫힘)
+_FIELD_CHANGES = (
+    (Change.GENERAL_OPENED, Change.GENERAL_CLOSED),
+    (Change.SPECIAL_OPENED, Change.SPECIAL_CLOSED),
+    (Change.STANDBY_OPENED, Change.STANDBY_CLOSED),
+)
+
+
+class Transition(NamedTuple):
+    """An availability change of one train.
+
+    Attributes:
+        train_number: Train number
+        change: What changed
+        row: Latest raw search row of the train (None for Change.GONE)
+    """
+
+    train_number: str
+    change: Change
+    row: dict | None
+
+    @property
+    def opened(self) -> bool:
+        return self.change in _OPENED
+
+    def __str__(self) -> str:
+        return f"[{self.train_number}] {self.change.value}"
+
+
+def _row_hash(row: dict) -> int:
+    try:
+        return hash(tuple(row.values()))
+    except TypeError:  # 중첩된 값이 있는 행
+        return hash(repr(row))
+
+
+class AvailabilityDiff:
+    """Turns successive search results into availability transitions.
+
+    A train seen for the first time is compared with SOLD_OUT, so the first
+    update() reports everything that is already open.
+
+    Args:
+        seats: Decodes a raw row into Seats (srt_seats or korail_seats)
+        key: Row field holding the train number
+    """
+
+    def __init__(
+        self, seats: Callable[[dict], Seats] = srt_seats, key: str = "trnNo"
+    ) -> None:
+        self._seats = seats
+        self._key = key
+        self._hashes = {}
+        self._states = {}
+
+    def update(self, rows: Iterable[dict]) -> list[Transition]:
+        """Record a new search result and return what changed since the last one."""
+        transitions = []
+        hashes = {}
+        for row in rows:
+            number = row[self._key]
+            hashes[number] = row_hash = _row_hash(row)
+            if self._hashes.get(number) == row_hash:
+                continue
+
+            before = self._states.get(number, SOLD_OUT)
+            after = self._states[number] = self._seats(row)
+            for was, now, (opened, closed) in zip(before, after, _FIELD_CHANGES):
+                if was != now:
+                    transitions.append(Transition(number, opened if now else closed, row))
+
+        for number in self._hashes.keys() - hashes.keys():
+            self._states.pop(number, None)
+            transitions.append(Transition(number, Change.GONE, None))
+
+        self._hashes = hashes
+        return transitions
+
+    def state(self, train_number: str) -> Seats | None:
+        """Seats of a train as of the last update, or None if it was not seen."""
+        return self._states.get(train_number)
+
+    def states(self) -> dict[str, Seats]:
+        """Snapshot of every train's seats as of the last update."""
+        return dict(self._states)
+
+    def forget(self, train_number: str) -> None:
+        """Drop a train's state, so the next update reports it again.
+
+        Call this when acting on a transition failed (e.g. the seat was
+        taken before the reservation went through) to retry on the next poll.
+        """
+        self._hashes.pop(train_number, None)
+        self._states.pop(train_number, None)
+
+
+def watch_events(
+    diff: AvailabilityDiff, rows: Iterable[dict], option=None, repeat: bool = False
+) -> list[Transition]:
+    """One watch() step: the transitions of ``rows`` worth reporting.
+
+    Openings are reported only when the train is reservable with ``option``
+    (see Seats.reservable). A train can also become reservable when a seat
+    class closes (the last open class sells out while standby is open); that
+    is reported as Change.RESERVABLE. With ``repeat`` the reported trains
+    are forgotten, so they are reported again on every poll while they stay
+    open.
+    """
+    before = diff.states()
+    events = []
+    reported = set()
+    for t in diff.update(rows):
+        if t.opened:
+            if not diff.state(t.train_number).reservable(option):
+                continue
+            reported.add(t.train_number)
+        events.append(t)
+
+    for t in list(events):
+        number = t.train_number
+        if t.row is None or number in reported:
+            continue
+        was = before.get(number, SOLD_OUT)
+        if diff.state(number).reservable(option) and not was.reservable(option):
+            reported.add(number)
+            events.append(Transition(number, Change.RESERVABLE, t.row))
+    if repeat:
+        for t in events:
+            if t.opened:
+                diff.forget(t.train_number)
+    return events
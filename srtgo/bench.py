@@ -0,0 +1,283 @@
+"""Micro-benchmarks for the per-poll hot paths of the SRT and Korail clients.
+
+Every ``search_train`` poll in the reserve loop parses the JSON response,
+copies it, builds train objects and (when reserving) combines passengers.
+These cases time those steps on synthetic responses of 10 to 10,000 rows
+built from srtgo.standin, so per-poll CPU regressions show up as numbers.
+
+    srtgo bench --output bench.json
+    srtgo bench --baseline bench.json        # compare, exit 1 on regression
+"""
+
+import json
+import platform
+import sys
+import time
+from datetime import datetime
+from importlib.metadata import PackageNotFoundError, version
+
+from . import ktx, srt
+from .standin import korail_train_row, train_row
+
+DEFAULT_ROWS = (10, 100, 1000, 10000)
+TARGET_TIME = 0.05  # 한 번의 측정에 쓸 시간 (초)
+REPEAT = 5
+REGRESSION_THRESHOLD = 0.10  # 기준보다 10% 이상 느리면 회귀
+
+
+# Synthetic responses
+def srt_search_response(rows: int) -> str:
+    """search_schedule body with ``rows`` trains, every third one bookable."""
+    body = {
+        "resultMap": [{"strResult": "SUCC", "msgTxt": ""}],
+        "outDataSets": {
+            "dsOutput1": [train_row(i % 100, available=i % 3 == 0) for i in range(rows)]
+        },
+    }
+    return json.dumps(body, ensure_ascii=False)
+
+
+def korail_search_response(rows: int) -> str:
+    body = {
+        "strResult": "SUCC",
+        "trn_infos": {
+            "trn_info": [
+                korail_train_row(i % 100, available=i % 3 == 0) for i in range(rows)
+            ]
+        },
+    }
+    return json.dumps(body, ensure_ascii=False)
+
+
+SRT_PASSENGERS = [srt.Adult(2), srt.Child(1), srt.Adult(1), srt.Senior(1)]
+KORAIL_PASSENGERS = [
+    ktx.AdultPassenger(2),
+    ktx.ChildPassenger(1),
+    ktx.AdultPassenger(1),
+    ktx.SeniorPassenger(1),
+]
+
+
+def _srt_client() -> srt.SRT:
+    from .transport import FakeTransport
+
+    return srt.SRT("bench", "bench", auto_login=False, transport=FakeTransport(str))
+
+
+# Cases: name -> (setup(rows) -> callable, depends on rows)
+def _srt_response_data(rows):
+    text = srt_search_response(rows)
+    return lambda: srt.SRTResponseData(text)
+
+
+def _srt_get_all(rows):
+    parser = srt.SRTResponseData(srt_search_response(rows))
+    return parser.get_all
+
+
+def _srt_trains(rows):
+    data = json.loads(srt_search_response(rows))["outDataSets"]["dsOutput1"]
+    return lambda: [srt.SRTTrain(row) for row in data]
+
+
+def _srt_train_table(rows):
+    data = json.loads(srt_search_response(rows))["outDataSets"]["dsOutput1"]
+    return lambda: srt.TrainTable.from_rows(data)
+
+
+def _srt_search_poll(rows):
+    client = _srt_client()
+    text = srt_search_response(rows)
+    return lambda: client._parse_trains(text, False, None)
+
+
+def _srt_search_poll_keyed(rows):
+    client = _srt_client()
+    text = srt_search_response(rows)
+    search = client.prepare_search(
+        "수서",
+        "부산",
+        "20301231",
+        train_numbers={"00305", "00320", "00377"},
+        seat_type=srt.SeatType.GENERAL_FIRST,
+    )
+    return lambda: {
+        row["trnNo"]: srt.SRTTrain(row) for row in client._parse_prepared(text, search)
+    }
+
+
+def _srt_search_poll_table(rows):
+    client = _srt_client()
+    text = srt_search_response(rows)
+    return lambda: client._parse_trains(text, True, "120000", as_table=True)
+
+
+def _korail_search_poll(rows):
+    text = korail_search_response(rows)
+
+    def run():
+        j = json.loads(text)
+        return [ktx.Train(info) for info in j["trn_infos"]["trn_info"]]
+
+    return run
+
+
+def _srt_search_form(rows):
+    client = _srt_client()
+
+    def run():
+        data = client._search_data("수서", "부산", "20301231", None, SRT_PASSENGERS)
+        data["netfunnelKey"] = "key"
+        return data
+
+    return run
+
+
+def _srt_prepared_form(rows):
+    search = _srt_client().prepare_search(
+        "수서", "부산", "20301231", passengers=SRT_PASSENGERS
+    )
+    return lambda: search.form("key")
+
+
+def _srt_passenger_combine(rows):
+    return lambda: srt.Passenger.combine(SRT_PASSENGERS)
+
+
+def _srt_passenger_dict(rows):
+    return lambda: srt.Passenger.get_passenger_dict(SRT_PASSENGERS)
+
+
+def _korail_passenger_reduce(rows):
+    return lambda: ktx.Passenger.reduce(KORAIL_PASSENGERS)
+
+
+CASES = {
+    "srt.response_data": (_srt_response_data, True),
+    "srt.get_all": (_srt_get_all, True),
+    "srt.trains": (_srt_trains, True),
+    "srt.train_table": (_srt_train_table, True),
+    "srt.search_poll": (_srt_search_poll, True),
+    "srt.search_poll_keyed": (_srt_search_poll_keyed, True),
+    "srt.search_poll_table": (_srt_search_poll_table, True),
+    "korail.search_poll": (_korail_search_poll, True),
+    "srt.search_form": (_srt_search_form, False),
+    "srt.prepared_form": (_srt_prepared_form, False),
+    "srt.passenger_combine": (_srt_passenger_combine, False),
+    "srt.passenger_dict": (_srt_passenger_dict, False),
+    "korail.passenger_reduce": (_korail_passenger_reduce, False),
+}
+
+
+def measure(fn, target: float = TARGET_TIME, repeat: int = REPEAT) -> float:
+    """Best seconds per call over ``repeat`` runs of about ``target`` seconds."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= target / 10:
+            break
+        number *= 10
+    number = max(1, int(number * target / max(elapsed, 1e-9)))
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def run(
+    rows=DEFAULT_ROWS, select: str | None = None, target: float = TARGET_TIME
+) -> dict:
+    """Run the cases and return the results document."""
+    results = {}
+    for name, (setup, by_rows) in CASES.items():
+        if select and select not in name:
+            continue
+        for n in rows if by_rows else (None,):
+            key = name if n is None else f"{name}[{n}]"
+            seconds = measure(setup(n), target)
+            results[key] = {"seconds": seconds}
+            if n:
+                results[key]["per_row"] = seconds / n
+    return {"meta": _meta(), "results": results}
+
+
+def _meta() -> dict:
+    try:
+        srtgo_version = version("srtgo")
+    except PackageNotFoundError:
+        srtgo_version = None
+    return {
+        "srtgo": srtgo_version,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def compare(
+    current: dict, baseline: dict, threshold: float = REGRESSION_THRESHOLD
+) -> list[tuple[str, float, float, float]]:
+    """(case, baseline s, current s, ratio) for every case in both documents."""
+    rows = []
+    for key, result in current["results"].items():
+        base = baseline["results"].get(key)
+        if base:
+            rows.append(
+                (key, base["seconds"], result["seconds"], result["seconds"] / base["seconds"])
+            )
+    return rows
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:7.2f} {unit}"
+    return f"{seconds / 1e-9:7.0f} ns"
+
+
+def report(
+    current: dict,
+    baseline: dict | None = None,
+    threshold: float = REGRESSION_THRESHOLD,
+    out=sys.stdout,
+) -> int:
+    """Print the results (and the comparison); return the number of regressions."""
+    if baseline is None:
+        for key, result in current["results"].items():
+            per_row = result.get("per_row")
+            extra = f"  {_format_time(per_row)}/row" if per_row else ""
+            print(f"{key:<32s} {_format_time(result['seconds'])}{extra}", file=out)
+        return 0
+
+    regressions = 0
+    for key, base, now, ratio in compare(current, baseline, threshold):
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        elif ratio < 1 - threshold:
+            flag = "  faster"
+        print(
+            f"{key:<32s} {_format_time(base)} -> {_format_time(now)}  x{ratio:5.2f}{flag}",
+            file=out,
+        )
+    return regressions
+
+
+def load(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save(document: dict, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2)
+        f.write("\n")
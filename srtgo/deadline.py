@@ -0,0 +1,77 @@
+"""Request timeouts and deadlines shared by the SRT and Korail clients.
+
+Every request has a per-endpoint timeout. A ``deadline`` block additionally
+bounds a whole operation, e.g. reserve-then-pay: each request made inside it
+gets at most the time left until the deadline, so a stalled connection can
+never hold the caller longer than asked. The deadline lives in a context
+variable, so asyncio tasks inherit it; worker threads do not, and calls
+handed to a thread pool are wrapped with ``bind_context`` to carry it along.
+"""
+
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Callable
+
+try:
+    from curl_cffi.requests.exceptions import Timeout as _CurlTimeout
+except ImportError:
+    _CurlTimeout = None
+try:
+    from requests.exceptions import Timeout as _RequestsTimeout
+except ImportError:
+    _RequestsTimeout = None
+
+TIMEOUT_ERRORS = tuple(t for t in (_CurlTimeout, _RequestsTimeout) if t)
+
+_deadline = contextvars.ContextVar("srtgo_deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: float):
+    """Bound every request made inside the block to finish within ``seconds``.
+
+    Nested blocks can only shorten the outer deadline.
+
+    Examples:
+        >>> with deadline(20):
+        ...     reservation = srt.reserve(train)
+        ...     srt.pay_with_card(reservation, ...)
+    """
+    end = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(end if current is None else min(current, end))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> float | None:
+    """Seconds left until the active deadline, or None outside a deadline."""
+    end = _deadline.get()
+    return None if end is None else end - time.monotonic()
+
+
+def clip(timeout: float) -> float:
+    """Per-request timeout clipped to the active deadline (0 if it has passed)."""
+    left = remaining()
+    if left is None:
+        return timeout
+    return max(0.0, min(timeout, left))
+
+
+def bind_context(fn: Callable) -> Callable:
+    """``fn`` running in the caller's context (and deadline) from any thread.
+
+    Examples:
+        >>> with deadline(20), ThreadPoolExecutor() as pool:
+        ...     infos = list(pool.map(bind_context(srt.ticket_info), reservations))
+    """
+    context = contextvars.copy_context()
+
+    def run(*args, **kwargs):
+        # 각 호출마다 복사본에서 실행 (같은 Context는 동시에 두 번 진입할 수 없음)
+        return context.copy().run(fn, *args, **kwargs)
+
+    return run
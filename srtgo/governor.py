@@ -0,0 +1,199 @@
+"""Request budgets shared by every client in the process.
+
+Long-running reserve loops, several jobs of one account and their NetFunnel
+helpers all send requests to the same few hosts. ``RequestGovernor`` keeps a
+token bucket per host, per endpoint of a host and per account, and makes a
+request wait until every bucket it draws from has a token, so the process as
+a whole stays within a safe request rate without any caller tracking it.
+
+Only hosts with a budget are governed; requests to other hosts (a local
+stand-in server, for instance) pass straight through.
+
+    governor = RequestGovernor(hosts={"app.srail.or.kr": Budget(60, 10)})
+    srt = SRT(srt_id, srt_pw, transport=Transport(governor=governor))
+    srt.budget_stats()
+"""
+
+import asyncio
+import threading
+import time
+from typing import NamedTuple
+
+from .deadline import remaining
+
+
+class Budget(NamedTuple):
+    """Sustained requests per minute, and how many may go out back to back."""
+
+    per_minute: float
+    burst: int
+
+
+# 호스트별 예산
+HOST_BUDGETS = {
+    "app.srail.or.kr:443": Budget(120, 20),  # SRT
+    "smart.letskorail.com:443": Budget(120, 20),  # Korail
+    "www.korail.com": Budget(120, 20),  # Korail (korail_bypass)
+    "nf.letskorail.com": Budget(120, 30),  # NetFunnel (대기열 확인은 1초마다)
+}
+# 엔드포인트별 예산 (예산이 있는 호스트마다 따로 적용)
+ENDPOINT_BUDGETS = {
+    "login": Budget(6, 3),
+    "reserve": Budget(20, 5),
+    "search_schedule": Budget(90, 10),
+}
+ACCOUNT_BUDGET = Budget(150, 30)  # 계정별 예산 (호스트마다 따로 적용)
+
+
+class TokenBucket:
+    """Token bucket refilled at ``budget.per_minute`` up to ``budget.burst``.
+
+    take() reserves a token even when none is left, so the bucket can go
+    negative: the deficit is the queue of callers already waiting.
+    """
+
+    def __init__(self, budget: Budget, now: float | None = None) -> None:
+        self.budget = budget
+        self.rate = budget.per_minute / 60
+        self.tokens = float(budget.burst)
+        self.stamp = time.monotonic() if now is None else now
+        self.throttled = 0
+        self.throttled_time = 0.0
+
+    def _refill(self, now: float) -> None:
+        if now > self.stamp:
+            self.tokens = min(
+                self.budget.burst, self.tokens + (now - self.stamp) * self.rate
+            )
+            self.stamp = now
+
+    def take(self, now: float) -> float:
+        """Reserve a token; return seconds until it is available."""
+        self._refill(now)
+        self.tokens -= 1
+        return max(0.0, -self.tokens / self.rate) if self.rate else float("inf")
+
+    def remaining(self, now: float) -> float:
+        self._refill(now)
+        return self.tokens
+
+
+class RequestGovernor:
+    """Token buckets per host, per endpoint and per account.
+
+    Args:
+        hosts: Host (``netloc``) -> Budget; hosts not listed are not governed
+        endpoints: Endpoint name -> Budget, applied per governed host
+        account: Budget of each account on each governed host (None: no limit)
+    """
+
+    def __init__(
+        self,
+        hosts: dict[str, Budget] | None = None,
+        endpoints: dict[str, Budget] | None = None,
+        account: Budget | None = ACCOUNT_BUDGET,
+    ) -> None:
+        self.hosts = dict(HOST_BUDGETS if hosts is None else hosts)
+        self.endpoints = dict(ENDPOINT_BUDGETS if endpoints is None else endpoints)
+        self.account = account
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self.throttled = 0
+        self.throttled_time = 0.0
+
+    def _bucket(self, key: tuple, budget: Budget, now: float) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(budget, now)
+        return bucket
+
+    def _buckets_for(self, host: str, endpoint: str | None, account: str | None, now):
+        yield self._bucket(("host", host), self.hosts[host], now)
+        if endpoint in self.endpoints:
+            yield self._bucket(("endpoint", host, endpoint), self.endpoints[endpoint], now)
+        if account and self.account:
+            yield self._bucket(("account", host, account), self.account, now)
+
+    def delay(
+        self,
+        host: str,
+        endpoint: str | None = None,
+        account: str | None = None,
+        now: float | None = None,
+    ) -> float:
+        """Reserve a request slot and return how long to wait for it."""
+        if host not in self.hosts:
+            return 0.0
+        with self._lock:
+            now = time.monotonic() if now is None else now
+            wait = 0.0
+            for bucket in self._buckets_for(host, endpoint, account, now):
+                bucket_wait = bucket.take(now)
+                if bucket_wait:
+                    bucket.throttled += 1
+                    bucket.throttled_time += bucket_wait
+                wait = max(wait, bucket_wait)
+            if wait:
+                self.throttled += 1
+                self.throttled_time += wait
+            return wait
+
+    def wait(self, host: str, endpoint: str | None = None, account: str | None = None) -> None:
+        """Block until the request may go out (or the active deadline passes)."""
+        delay = self._bounded(self.delay(host, endpoint, account))
+        if delay:
+            time.sleep(delay)
+
+    async def async_wait(
+        self, host: str, endpoint: str | None = None, account: str | None = None
+    ) -> None:
+        delay = self._bounded(self.delay(host, endpoint, account))
+        if delay:
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _bounded(delay: float) -> float:
+        # 데드라인을 넘겨 기다리지 않음: 이후 요청이 시간 초과로 끝남
+        left = remaining()
+        return delay if left is None else max(0.0, min(delay, left))
+
+    def stats(self, now: float | None = None) -> dict:
+        """Remaining tokens and throttling per bucket, plus process totals.
+
+        Bucket names are ``host``, ``host endpoint`` or ``host @account``.
+        """
+        with self._lock:
+            now = time.monotonic() if now is None else now
+            buckets = {}
+            for key, bucket in self._buckets.items():
+                kind, host, *rest = key
+                name = host
+                if kind == "endpoint":
+                    name = f"{host} {rest[0]}"
+                elif kind == "account":
+                    name = f"{host} @{rest[0]}"
+                buckets[name] = {
+                    "remaining": bucket.remaining(now),
+                    "per_minute": bucket.budget.per_minute,
+                    "burst": bucket.budget.burst,
+                    "throttled": bucket.throttled,
+                    "throttled_time": bucket.throttled_time,
+                }
+            return {
+                "throttled": self.throttled,
+                "throttled_time": self.throttled_time,
+                "buckets": buckets,
+            }
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_governor() -> RequestGovernor:
+    """The governor every Transport uses unless given its own."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = RequestGovernor()
+        return _default
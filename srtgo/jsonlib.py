@@ -0,0 +1,32 @@
+"""JSON backend for parsing API responses.
+
+Uses orjson when it is installed (``pip install srtgo[fast]``) and the
+standard library otherwise. Both parse response bytes directly, so callers
+pass ``r.content`` and skip decoding the body into a str first.
+"""
+
+import json
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# orjson.JSONDecodeError도 json.JSONDecodeError의 하위 클래스
+JSONDecodeError = json.JSONDecodeError
+
+BACKEND = "orjson" if HAS_ORJSON else "json"
+
+
+def loads(data: bytes | str):
+    """Parse a JSON document from response bytes (or text)."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj) -> str:
+    if HAS_ORJSON:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False)
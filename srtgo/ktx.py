@@ -6,21 +6,27 @@ korail2.korail2
 :license: BSD, see LICENSE for more details.
 """
 
+import asyncio
 import base64
-try:
-    import curl_cffi
-    HAS_CURL_CFFI = True
-except ImportError:
-    import requests
-    HAS_CURL_CFFI = False
 import itertools
-import json
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from Crypto.Cipher import AES
 from Crypto.Util.Padding import pad
 from datetime import datetime, timedelta
-from functools import reduce
+from functools import partial, reduce
+from typing import NamedTuple
+
+from . import jsonlib
+from .availability import AvailabilityDiff, korail_seats, watch_events
+from .deadline import TIMEOUT_ERRORS, bind_context, clip
+from .netfunnel import KeyCache, KeyRefresher, SingleFlight
+from .retry import Action, ErrorKind, RetryPolicy
+from .scheduler import POLL_INTERVAL, PollScheduler
+from .session_cache import export_cookies, import_cookies
+from .throttle import ReloginThrottle
+from .transport import Transport, host_of
 
 
 # Constants
@@ -53,6 +59,22 @@ API_ENDPOINTS = {
     "code": f"{KORAIL_MOBILE}.common.code.do",
 }
 
+# 요청 제한시간 (초), 엔드포인트별
+REQUEST_TIMEOUTS = {
+    "default": 10.0,
+    "search_schedule": 5.0,  # 조회는 짧게 끊고 다시 시도
+    "myticketlist": 5.0,
+    "myticketseat": 5.0,
+    "myreservationview": 5.0,
+    "myreservationlist": 5.0,
+    "pay": 30.0,  # 결제는 카드사 승인까지 기다림
+    "refund": 20.0,
+}
+NETFUNNEL_TIMEOUT = 5.0
+LOGIN_KEY_TTL = 5 * 60  # 비밀번호 암호화 키 재사용 시간 (초)
+TICKET_INFO_CONCURRENCY = 4  # 동시에 조회할 승차권 상세 요청 수
+MAX_TICKET_PAGES = 20  # 승차권 목록을 넘겨 볼 최대 페이지 수
+
 
 # Schedule classes
 class Schedule:
@@ -143,12 +165,20 @@ class Train(Schedule):
 
 
 class Ticket(Train):
-    """Train ticket information"""
+    """Train ticket information
 
-    def __init__(self, data):
+    ``seat`` holds the ticket's ``myticketseat`` details; when it is given
+    a loader function they are fetched on first access of ``seat``,
+    ``seat_no`` or ``seat_no_end``. Until they are loaded ``seat`` is None
+    and the seat numbers come from the ticket list.
+    """
+
+    def __init__(self, data, seat=None):
         raw_data = data["ticket_list"][0]["train_info"][0]
         super().__init__(raw_data)
-        self.seat_no_end = raw_data.get("h_seat_no_end")
+        self._seat = seat
+        self._seat_loaded = seat is not None and not callable(seat)
+        self._seat_no_end = raw_data.get("h_seat_no_end")
         self.seat_no_count = int(raw_data.get("h_seat_cnt"))
         self.buyer_name = raw_data.get("h_buy_ps_nm")
         self.sale_date = raw_data.get("h_orgtk_sale_dt")
@@ -159,7 +189,31 @@ class Ticket(Train):
         self.sale_info4 = raw_data.get("h_orgtk_ret_pwd")
         self.price = int(raw_data.get("h_rcvd_amt"))
         self.car_no = raw_data.get("h_srcar_no")
-        self.seat_no = raw_data.get("h_seat_no")
+        self._seat_no = raw_data.get("h_seat_no")
+
+    @property
+    def seat(self):
+        if callable(self._seat):
+            self.seat = self._seat()
+        return self._seat
+
+    @seat.setter
+    def seat(self, seat):
+        self._seat = seat
+        self._seat_loaded = not callable(seat)
+
+    @property
+    def seat_loaded(self):
+        return self._seat_loaded
+
+    @property
+    def seat_no(self):
+        seat = self.seat
+        return self._seat_no if seat is None else seat.get("h_seat_no")
+
+    @property
+    def seat_no_end(self):
+        return self._seat_no_end if self.seat is None else None
 
     def __repr__(self):
         repr_str = super(Train, self).__repr__()
@@ -180,11 +234,59 @@ class Ticket(Train):
         )
 
 
+class LoginKey(NamedTuple):
+    """Password encryption key of the ``code`` endpoint and what it encrypted."""
+
+    idx: str
+    key: str
+    fetched_at: float
+    password: str
+    encrypted: str
+
+
+class TicketPage(NamedTuple):
+    """One page of the ticket list.
+
+    ``more`` is the server's next-page flag, or None if it sent none.
+    """
+
+    tickets: list
+    more: bool | None
+
+
+def _join_pages(pages):
+    """Tickets of consecutive list pages, and whether the list may go on.
+
+    Without a next-page flag the list ends at an empty page, a page shorter
+    than the first, or a repeat of the first (a server ignoring the page
+    number).
+    """
+    first = pages[0].tickets
+    tickets = list(first)
+    more = pages[0].more
+    for page in pages[1:]:
+        if more is False or not page.tickets:
+            return tickets, False
+        if page.tickets[0].get_ticket_no() == first[0].get_ticket_no():
+            return tickets, False
+        tickets.extend(page.tickets)
+        more = page.more
+        if more is None and len(page.tickets) < len(first):
+            return tickets, False
+    return tickets, bool(first) and more is not False
+
+
 class Reservation(Train):
-    """Train reservation information"""
+    """Train reservation information
 
-    def __init__(self, data):
+    ``details`` holds the reservation's seats and ``wct_no`` from
+    ``myreservationlist``; when it is given a loader function they are
+    fetched on first access of ``details``, ``tickets`` or ``wct_no``.
+    """
+
+    def __init__(self, data, details=None):
         super().__init__(data)
+        self._details = details
         self.dep_date = data.get("h_run_dt")
         self.arr_date = data.get("h_run_dt")
         self.rsv_id = data.get("h_pnr_no")
@@ -199,6 +301,30 @@ class Reservation(Train):
             self.buy_limit_date == "00000000" or self.buy_limit_time == "235959"
         )
 
+    @property
+    def details(self):
+        if callable(self._details):
+            self._details = self._details() or ([], None)
+        return self._details
+
+    @details.setter
+    def details(self, details):
+        self._details = details
+
+    @property
+    def details_loaded(self):
+        return self._details is not None and not callable(self._details)
+
+    @property
+    def tickets(self):
+        details = self.details
+        return None if details is None else details[0]
+
+    @property
+    def wct_no(self):
+        details = self.details
+        return None if details is None else details[1]
+
     def __repr__(self):
         repr_str = super().__repr__()
         repr_str += f", {self.price}원({self.seat_no_count}석)"
@@ -362,6 +488,8 @@ class ReserveOption:
 class KorailError(Exception):
     """Base class for Korail errors"""
 
+    kind = ErrorKind.FATAL
+
     def __init__(self, msg, code=None):
         self.msg = msg
         self.code = code
@@ -371,6 +499,7 @@ class KorailError(Exception):
 
 
 class NeedToLoginError(KorailError):
+    kind = ErrorKind.LOGIN
     codes = {"P058"}
 
     def __init__(self, code=None):
@@ -378,6 +507,7 @@ class NeedToLoginError(KorailError):
 
 
 class NoResultsError(KorailError):
+    kind = ErrorKind.EMPTY
     codes = {"P100", "WRG000000", "WRD000061", "WRT300005"}
 
     def __init__(self, code=None):
@@ -385,13 +515,57 @@ class NoResultsError(KorailError):
 
 
 class SoldOutError(KorailError):
+    kind = ErrorKind.SOLD_OUT
     codes = {"IRT010110", "ERR211161"}
+    messages = ("잔여석없음", "예약대기자한도수초과")
 
     def __init__(self, code=None):
         super().__init__("Sold out", code)
 
 
+class KorailTimeoutError(KorailError):
+    """A request did not finish within its timeout or the active deadline.
+
+    Safe to retry for lookups. A timed out reservation or payment may still
+    have been processed by the server, so check the reservations first.
+    """
+
+    kind = ErrorKind.TIMEOUT
+    retryable = True
+
+    def __init__(self, endpoint, timeout):
+        super().__init__(
+            f"{endpoint} 요청 시간 초과 ({timeout:.3g}초)"
+            if timeout
+            else f"{endpoint} 요청 전 기한 초과"
+        )
+        self.endpoint = endpoint
+        self.timeout = timeout
+
+    def __str__(self):
+        return self.msg
+
+
+def response_error(msg, code=None):
+    """The typed exception for a failure code and message of the server."""
+    for error in (NoResultsError, NeedToLoginError, SoldOutError):
+        if code in error.codes:
+            return error(code)
+    if msg and any(text in msg for text in SoldOutError.messages):
+        return SoldOutError(code)
+    return KorailError(msg, code)
+
+
+def _timeout_for(endpoint, timeout):
+    timeout = clip(timeout)
+    if not timeout:
+        raise KorailTimeoutError(endpoint, 0)
+    return timeout
+
+
 class NetFunnelError(Exception):
+    kind = ErrorKind.NETFUNNEL
+
     def __init__(self, msg):
         self.msg = msg
 
@@ -406,6 +580,7 @@ class NetFunnelHelper:
     WAIT_STATUS_PASS = "200"
     WAIT_STATUS_FAIL = "201"
     ALREADY_COMPLETED = "502"
+    WAIT_INTERVAL = 1  # 대기열 재확인 간격 (초)
 
     OP_CODE = {
         "getTidchkEnter": "5101",
@@ -419,60 +594,103 @@ class NetFunnelHelper:
         "User-Agent": "Apache-HttpClient/UNAVAILABLE (java 1.4)",
     }
 
-    def __init__(self):
-        if HAS_CURL_CFFI:
-            self._session = curl_cffi.Session(impersonate="chrome131_android")
-        else:
-            self._session = requests.session()
+    def __init__(self, timeout=NETFUNNEL_TIMEOUT, transport=None):
+        self._transport = transport or Transport()
+        self._session = self._transport.session(
+            host_of(self.NETFUNNEL_URL), impersonate="chrome131_android"
+        )
         self._session.headers.update(self.DEFAULT_HEADERS)
-        self._cached_key = None
-        self._last_fetch_time = 0
-        self._cache_ttl = 50  # 50 seconds
+        self.timeout = timeout
+        self._cache = KeyCache(ttl=50)  # 50 seconds at most
+        self._flight = SingleFlight()
+        self._refresher = None
 
     def run(self):
-        current_time = time.time()
-        if self._is_cache_valid(current_time):
-            return self._cached_key
+        """Return a valid NetFunnel key, queueing for a new one if needed.
 
+        A still-valid key is returned without locking. Otherwise concurrent
+        callers share a single queue sequence.
+        """
+        return self._cache.get() or self._flight.do(self._acquire_missing)
+
+    def _acquire_missing(self):
+        return self._cache.peek() or self._acquire()
+
+    def _refresh(self):
+        return self._flight.do(partial(self._acquire, background=True))
+
+    def _acquire(self, background=False):
+        started = time.time()
         try:
-            status, self._cached_key, nwait = self._start()
-            self._last_fetch_time = current_time
+            status, key, nwait = self._start()
+            queued = nwait
 
             while status == self.WAIT_STATUS_FAIL:
-                print(f"\r현재 {nwait}명 대기중...", end="", flush=True)
-                time.sleep(1)
-                status, self._cached_key, nwait = self._check()
+                if not background:
+                    print(f"\r현재 {nwait}명 대기중...", end="", flush=True)
+                time.sleep(self.WAIT_INTERVAL)
+                status, key, nwait = self._check(key)
 
             # Try completing once
-            status, _, _ = self._complete()
+            status, _, _ = self._complete(key)
             if status == self.WAIT_STATUS_PASS or status == self.ALREADY_COMPLETED:
-                return self._cached_key
+                self._cache.put(
+                    key, started, time.time() - started, background, queued
+                )
+                return key
 
-            self.clear()
             raise NetFunnelError("Failed to complete NetFunnel")
 
+        except (KorailTimeoutError, NetFunnelError):
+            self._cache.fail()
+            raise  # 시간 초과는 TIMEOUT으로 분류되도록 그대로
         except Exception as ex:
-            self.clear()
+            self._cache.fail()
             raise NetFunnelError(str(ex))
 
     def clear(self):
-        self._cached_key = None
-        self._last_fetch_time = 0
+        self._cache.clear()
+
+    def invalidate(self):
+        """Drop the key after the server rejected it, shortening the learned TTL."""
+        self._cache.invalidate()
+
+    def start_refresher(self):
+        """Renew the key in a background thread shortly before it expires."""
+        if self._refresher is None:
+            self._refresher = KeyRefresher(self._cache, self._refresh)
+            self._refresher.start()
+
+    def stop_refresher(self):
+        if self._refresher is not None:
+            self._refresher.stop()
+            self._refresher = None
+
+    def stats(self):
+        """Key hit/miss counters, learned TTL and acquisition latency."""
+        return self._cache.stats()
 
     def _start(self):
         return self._make_request("getTidchkEnter")
 
-    def _check(self):
-        return self._make_request("chkEnter")
+    def _check(self, key=None):
+        return self._make_request("chkEnter", key)
 
-    def _complete(self):
-        return self._make_request("setComplete")
+    def _complete(self, key=None):
+        return self._make_request("setComplete", key)
 
-    def _make_request(self, opcode: str):
-        params = self._build_params(self.OP_CODE[opcode])
-        response = self._parse(
-            self._session.get(self.NETFUNNEL_URL, params=params).text
-        )
+    def _make_request(self, opcode: str, key: str = None):
+        params = self._build_params(self.OP_CODE[opcode], key)
+        self._transport.governor.wait(host_of(self.NETFUNNEL_URL), "netfunnel")
+        timeout = _timeout_for("netfunnel", self.timeout)
+        try:
+            r = self._session.get(self.NETFUNNEL_URL, params=params, timeout=timeout)
+        except TIMEOUT_ERRORS as ex:
+            raise KorailTimeoutError("netfunnel", timeout) from ex
+        return self._handle_response(r.text)
+
+    def _handle_response(self, text):
+        response = self._parse(text)
         return response.get("status"), response.get("key"), response.get("nwait")
 
     def _build_params(self, opcode: str, key: str = None) -> dict:
@@ -481,9 +699,9 @@ class NetFunnelHelper:
         if opcode in (self.OP_CODE["getTidchkEnter"], self.OP_CODE["chkEnter"]):
             params.update({"sid": "service_1", "aid": "act_8"})
             if opcode == self.OP_CODE["chkEnter"]:
-                params.update({"key": key or self._cached_key, "ttl": "1"})
+                params.update({"key": key, "ttl": "1"})
         elif opcode == self.OP_CODE["setComplete"]:
-            params["key"] = key or self._cached_key
+            params["key"] = key
 
         return params
 
@@ -498,26 +716,29 @@ class NetFunnelHelper:
         params["status"] = status
         return params
 
-    def _is_cache_valid(self, current_time: float) -> bool:
-        return bool(
-            self._cached_key
-            and (current_time - self._last_fetch_time) < self._cache_ttl
-        )
-
 
 class Korail:
     """Main Korail API interface"""
 
-    def __init__(self, korail_id, korail_pw, auto_login=True, verbose=False):
-        if HAS_CURL_CFFI:
-            self._session = curl_cffi.Session(impersonate="chrome131_android")
-        else:
-            self._session = requests.session()
+    def __init__(
+        self,
+        korail_id,
+        korail_pw,
+        auto_login=True,
+        verbose=False,
+        timeouts=None,
+        transport=None,
+    ):
+        self._transport = transport or Transport()
+        self._session = self._new_session()
         self._session.headers.update(DEFAULT_HEADERS)
         self._device = "AD"
         self._version = "260225001"
         self._key = "korail1234567890"
         self._idx = None
+        self._login_key = None
+        self._relogin_throttle = ReloginThrottle()
+        self.timeouts = {**REQUEST_TIMEOUTS, **(timeouts or {})}
         self.korail_id = korail_id
         self.korail_pw = korail_pw
         self.verbose = verbose
@@ -529,34 +750,113 @@ class Korail:
         if auto_login:
             self.login(korail_id, korail_pw)
 
-    def _log(self, msg: str) -> None:
+    def _new_session(self):
+        return self._transport.session(
+            host_of(KORAIL_MOBILE), impersonate="chrome131_android"
+        )
+
+    def _log(self, msg: str | bytes) -> None:
         if self.verbose:
+            if isinstance(msg, bytes):
+                msg = msg.decode("utf-8", "replace")
             print(f"[*] {msg}")
 
+    def _get(self, endpoint, url=None, **kwargs):
+        return self._request("get", endpoint, url, **kwargs)
+
+    def _post(self, endpoint, url=None, **kwargs):
+        return self._request("post", endpoint, url, **kwargs)
+
+    def _request(self, method, endpoint, url=None, **kwargs):
+        """Call an API endpoint within its timeout and the active deadline.
+
+        Waits for the transport's request budget first. Raises
+        KorailTimeoutError if the request timed out or the deadline passed.
+        """
+        url = url or API_ENDPOINTS[endpoint]
+        self._transport.governor.wait(host_of(url), endpoint, self.korail_id)
+        timeout = _timeout_for(
+            endpoint, self.timeouts.get(endpoint, self.timeouts["default"])
+        )
+        try:
+            return getattr(self._session, method)(url, timeout=timeout, **kwargs)
+        except TIMEOUT_ERRORS as ex:
+            raise KorailTimeoutError(endpoint, timeout) from ex
+
     def __enc_password(self, password):
-        url = API_ENDPOINTS["code"]
-        data = {"code": "app.login.cphd"}
-        r = self._session.post(url, data=data)
-        j = json.loads(r.text)
+        encrypted = self._cached_password(password)
+        if encrypted:
+            return encrypted
+        r = self._post("code", data={"code": "app.login.cphd"})
+        return self._encrypt_password(r.content, password)
+
+    def _cached_password(self, password):
+        """Password encrypted with the cached key (None once it is too old)."""
+        key = self._login_key
+        if key is None or time.monotonic() - key.fetched_at >= LOGIN_KEY_TTL:
+            return None
+        if key.password != password:
+            key = self._login_key = key._replace(
+                password=password, encrypted=self._aes_encrypt(key.key, password)
+            )
+        self._idx = key.idx
+        return key.encrypted
+
+    def _encrypt_password(self, text, password):
+        """Encrypt the password with the key of a ``code`` response (False if none)."""
+        j = jsonlib.loads(text)
 
         if j["strResult"] == "SUCC" and j.get("app.login.cphd"):
             self._idx = j["app.login.cphd"]["idx"]
             key = j["app.login.cphd"]["key"]
-            encrypt_key = key.encode("utf-8")
-            iv = key[:16].encode("utf-8")
-            cipher = AES.new(encrypt_key, AES.MODE_CBC, iv)
-            padded_data = pad(password.encode("utf-8"), AES.block_size)
-            return base64.b64encode(
-                base64.b64encode(cipher.encrypt(padded_data))
-            ).decode("utf-8")
+            encrypted = self._aes_encrypt(key, password)
+            self._login_key = LoginKey(
+                self._idx, key, time.monotonic(), password, encrypted
+            )
+            return encrypted
         return False
 
+    @staticmethod
+    def _aes_encrypt(key, password):
+        encrypt_key = key.encode("utf-8")
+        iv = key[:16].encode("utf-8")
+        cipher = AES.new(encrypt_key, AES.MODE_CBC, iv)
+        padded_data = pad(password.encode("utf-8"), AES.block_size)
+        return base64.b64encode(
+            base64.b64encode(cipher.encrypt(padded_data))
+        ).decode("utf-8")
+
     def login(self, korail_id=None, korail_pw=None):
+        """Log in, reusing the password encryption key for LOGIN_KEY_TTL seconds.
+
+        A rejected login drops the key; if the key was reused for an
+        unchanged password, the login is retried once with a new one.
+        """
+        self._set_credentials(korail_id, korail_pw)
+        retry = self._reuses_login_key()
+        data = self._login_data(self.__enc_password(self.korail_pw))
+        r = self._post("login", data=data)
+        if self._on_login(r.content) or not retry:
+            return self.logined
+        data = self._login_data(self.__enc_password(self.korail_pw))
+        r = self._post("login", data=data)
+        return self._on_login(r.content)
+
+    def _reuses_login_key(self):
+        key = self._login_key
+        return (
+            key is not None
+            and key.password == self.korail_pw
+            and time.monotonic() - key.fetched_at < LOGIN_KEY_TTL
+        )
+
+    def _set_credentials(self, korail_id, korail_pw):
         if korail_id:
             self.korail_id = korail_id
         if korail_pw:
             self.korail_pw = korail_pw
 
+    def _login_data(self, encrypted_pw):
         txt_input_flg = (
             "5"
             if EMAIL_REGEX.match(self.korail_id)
@@ -565,19 +865,19 @@ class Korail:
             else "2"
         )
 
-        data = {
+        return {
             "Device": self._device,
             "Version": self._version,
             "Key": self._key,
             "txtMemberNo": self.korail_id,
-            "txtPwd": self.__enc_password(self.korail_pw),
+            "txtPwd": encrypted_pw,
             "txtInputFlg": txt_input_flg,
             "idx": self._idx,
         }
 
-        r = self._session.post(API_ENDPOINTS["login"], data=data)
-        self._log(r.text)
-        j = json.loads(r.text)
+    def _on_login(self, text):
+        self._log(text)
+        j = jsonlib.loads(text)
 
         if j["strResult"] == "SUCC" and j.get("strMbCrdNo"):
             # self._key = j['Key']
@@ -590,22 +890,82 @@ class Korail:
             )
             self.logined = True
             return True
+        self._login_key = None  # 거절된 키는 다시 쓰지 않음
         self.logined = False
         return False
 
+    def relogin(self):
+        """Log in again on the current session after the server dropped it.
+
+        Keeps the open connections; consecutive calls are spaced out by a
+        ReloginThrottle so a flapping network cannot cause a login storm.
+        """
+        time.sleep(self._relogin_throttle.delay())
+        self.logined = False
+        return self.login()
+
+    def budget_stats(self):
+        """Remaining request budget and throttle time of the transport's governor."""
+        return self._transport.governor.stats()
+
+    def export_session(self):
+        """Snapshot of the logged-in session (cookies and member info).
+
+        Feed it to resume_session in another process to skip the login.
+        """
+        return {
+            "cookies": export_cookies(self._session.cookies),
+            "membership_number": self.membership_number,
+            "name": self.name,
+            "email": self.email,
+            "phone_number": self.phone_number,
+        }
+
+    def resume_session(self, state):
+        """Restore a session from export_session and validate it with one request.
+
+        Returns False (and stays logged out) if the server no longer accepts it.
+        """
+        self._restore_session(state)
+        r = self._get("myreservationview", params=self._base_data())
+        return self._on_resume(r.content)
+
+    def _restore_session(self, state):
+        import_cookies(self._session.cookies, state.get("cookies", []))
+        self.membership_number = state.get("membership_number")
+        self.name = state.get("name")
+        self.email = state.get("email")
+        self.phone_number = state.get("phone_number")
+
+    def _on_resume(self, text):
+        self._log(text)
+        try:
+            self._result_check(jsonlib.loads(text))
+        except NoResultsError:
+            pass
+        except (KorailError, ValueError):
+            self.logined = False
+            self.membership_number = None
+            self._session.cookies.clear()
+            return False
+        self.logined = True
+        return True
+
     def logout(self):
-        r = self._session.get(API_ENDPOINTS["logout"])
-        self._log(r.text)
+        r = self._get("logout")
+        self._log(r.content)
         self.logined = False
 
+    def _base_data(self):
+        return {
+            "Device": self._device,
+            "Version": self._version,
+            "Key": self._key,
+        }
+
     def _result_check(self, j):
         if j.get("strResult") == "FAIL":
-            h_msg_cd = j.get("h_msg_cd")
-            h_msg_txt = j.get("h_msg_txt")
-            for error in (NoResultsError, NeedToLoginError, SoldOutError):
-                if h_msg_cd in error.codes:
-                    raise error(h_msg_cd)
-            raise KorailError(h_msg_txt, h_msg_cd)
+            raise response_error(j.get("h_msg_txt"), j.get("h_msg_cd"))
         return True
 
     def search_train(
@@ -618,6 +978,31 @@ class Korail:
         passengers=None,
         include_no_seats=False,
         include_waiting_list=False,
+    ):
+        params = self._search_params(dep, arr, date, time, train_type, passengers)
+        return self._filter_trains(
+            self._search_rows(params), include_no_seats, include_waiting_list
+        )
+
+    @staticmethod
+    def _filter_trains(rows, include_no_seats, include_waiting_list):
+        trains = [Train(info) for info in rows]
+        filter_fns = [lambda x: x.has_seat()]
+
+        if include_no_seats:
+            filter_fns.append(lambda x: not x.has_seat())
+        if include_waiting_list:
+            filter_fns.append(lambda x: x.has_waiting_list())
+
+        trains = [t for t in trains if any(f(t) for f in filter_fns)]
+
+        if not trains:
+            raise NoResultsError()
+
+        return trains
+
+    def _search_params(
+        self, dep, arr, date=None, time=None, train_type=TrainType.ALL, passengers=None
     ):
         kst_now = datetime.now() + timedelta(hours=9)
         date = date or kst_now.strftime("%Y%m%d")
@@ -668,30 +1053,97 @@ class Korail:
             "adjStnScdlOfrFlg": "N",  # 인접역 보기
             "mbCrdNo": self.membership_number,
         }
-
-        r = self._session.get(API_ENDPOINTS["search_schedule"], params=data)
-        self._log(r.text)
-        j = json.loads(r.text)
-
-        if self._result_check(j):
-            trains = [
-                Train(info) for info in j.get("trn_infos", {}).get("trn_info", [])
-            ]
-            filter_fns = [lambda x: x.has_seat()]
-
-            if include_no_seats:
-                filter_fns.append(lambda x: not x.has_seat())
-            if include_waiting_list:
-                filter_fns.append(lambda x: x.has_waiting_list())
-
-            trains = [t for t in trains if any(f(t) for f in filter_fns)]
-
-            if not trains:
-                raise NoResultsError()
-
-            return trains
+        return data
+
+    def _search_rows(self, params):
+        """Raw ``trn_info`` rows of a search ([] if there are none)."""
+        r = self._get("search_schedule", params=params)
+        return self._parse_search(r.content)
+
+    def _parse_search(self, text):
+        self._log(text)
+        j = jsonlib.loads(text)
+        if j.get("strResult") == "FAIL" and j.get("h_msg_cd") in NoResultsError.codes:
+            return []  # 흔한 결과라 예외를 만들지 않음
+        self._result_check(j)
+        return j.get("trn_infos", {}).get("trn_info", [])
+
+    def watch(
+        self,
+        query,
+        train_numbers=None,
+        seat_type=None,
+        interval=POLL_INTERVAL,
+        repeat=False,
+    ):
+        """Poll a search and yield availability changes as they happen.
+
+        Polls are spaced by a jittered ``interval``, stretched by a
+        PollScheduler while the server is failing, overloaded or slow to
+        answer. Failed polls are handled by a RetryPolicy: a dropped login
+        is restored with relogin(), timeouts and connection errors are
+        retried, and a run of failures pauses polling for a while; other
+        errors are raised. Stop by leaving the loop: watch() opens no
+        sessions of its own, so the client stays usable.
+
+        Args:
+            query: search_train() arguments as a dict (dep, arr, date, time,
+                train_type, passengers)
+            train_numbers: Only these trains (``h_trn_no``)
+            seat_type: ReserveOption; report openings only when reservable
+                with it
+            interval: Mean seconds between polls of a healthy server
+            repeat: Report open trains again on every poll while they stay
+                open, e.g. to retry a reservation that lost the seat
+
+        Yields:
+            Transition per change; ``Train(transition.row)`` to reserve
+
+        Examples:
+            >>> query = {"dep": "서울", "arr": "부산", "date": "20240101"}
+            >>> for change in korail.watch(query, {"101"}, ReserveOption.GENERAL_FIRST):
+            ...     if change.opened:
+            ...         korail.reserve(Train(change.row))
+            ...         break
+        """
+        params = self._search_params(**query)
+        wanted = None if train_numbers is None else set(train_numbers)
+        diff = AvailabilityDiff(korail_seats, "h_trn_no")
+        policy = RetryPolicy(PollScheduler(interval))
+        while True:
+            started = time.monotonic()
+            try:
+                rows = self._search_rows(params)
+            except (KorailError, OSError, ValueError) as ex:
+                if self._recover(policy, ex):
+                    try:
+                        self.relogin()
+                    except (KorailTimeoutError, OSError):
+                        pass  # 다음 조회에서 다시 로그인
+                policy.wait()
+                continue
+
+            policy.success(time.monotonic() - started)
+            if wanted is not None:
+                rows = [row for row in rows if row.get("h_trn_no") in wanted]
+            yield from watch_events(diff, rows, seat_type, repeat)
+            policy.wait()
+
+    def _recover(self, policy, ex):
+        """Apply the policy to a failed watch() poll; True if it must log in again.
+
+        Re-raises ``ex`` when polling again can't fix it.
+        """
+        action = policy.decide(ex).action
+        if action is Action.RAISE:
+            raise ex
+        return action is Action.RELOGIN
 
     def reserve(self, train, passengers=None, option=ReserveOption.GENERAL_FIRST):
+        r = self._get("reserve", params=self._reserve_data(train, passengers, option))
+        return self.reservations(self._parse_reserve(r.content))
+
+    def _reserve_data(self, train, passengers, option):
         reserving_seat = train.has_seat() or train.wait_reserve_flag < 0
         if reserving_seat:
             is_special_seat = {
@@ -713,9 +1165,7 @@ class Korail:
         cnt = sum(p.count for p in passengers)
 
         data = {
-            "Device": self._device,
-            "Version": self._version,
-            "Key": self._key,
+            **self._base_data(),
             "txtMenuId": "11",
             "txtJobId": "1101" if reserving_seat else "1102",
             "txtGdNo": "",
@@ -756,103 +1206,180 @@ class Korail:
 
         for i, psg in enumerate(passengers, 1):
             data.update(psg.get_dict(i))
+        return data
 
-        r = self._session.get(API_ENDPOINTS["reserve"], params=data)
-        self._log(r.text)
-        j = json.loads(r.text)
+    def _parse_reserve(self, text):
+        """Reservation number of a ``reserve`` response."""
+        self._log(text)
+        j = jsonlib.loads(text)
         if self._result_check(j):
-            rsv_id = j.get("h_pnr_no")
-            reservation = self.reservations(rsv_id)
-            return reservation
-        else:
-            raise SoldOutError()
-
-    def tickets(self):
-        data = {
-            "Device": self._device,
-            "Version": self._version,
-            "Key": self._key,
+            return j.get("h_pnr_no")
+        raise SoldOutError()
+
+    def tickets(self, with_seats=True, concurrency=TICKET_INFO_CONCURRENCY):
+        """Get all paid tickets.
+
+        Reads every page of the ticket list; pages after the first are
+        fetched in parallel. Seat details are fetched in parallel too, or
+        lazily on first access of ``Ticket.seat_no`` without ``with_seats``.
+
+        Args:
+            with_seats: Whether to fetch all seat details now (see load_seats)
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            List of Ticket objects
+        """
+        pages = [self._ticket_page(1)]
+        tickets, more = _join_pages(pages)
+        if more:
+            page = bind_context(self._ticket_page)
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                while more and len(pages) < MAX_TICKET_PAGES:
+                    start = len(pages) + 1
+                    stop = min(start + concurrency, MAX_TICKET_PAGES + 1)
+                    pages.extend(pool.map(page, range(start, stop)))
+                    tickets, more = _join_pages(pages)
+
+        for ticket in tickets:
+            ticket.seat = partial(self.ticket_seat, ticket)
+        if with_seats:
+            self.load_seats(tickets, concurrency)
+        return tickets
+
+    def _ticket_page(self, page_no):
+        r = self._get("myticketlist", params=self._ticket_list_data(page_no))
+        return self._parse_ticket_list(r.content)
+
+    def load_seats(self, tickets, concurrency=TICKET_INFO_CONCURRENCY):
+        """Fetch seat details of tickets not yet loaded, in parallel."""
+        pending = [t for t in tickets if not t.seat_loaded]
+        if pending:
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                seats = pool.map(bind_context(self.ticket_seat), pending)
+                for ticket, seat in zip(pending, seats):
+                    ticket.seat = seat
+        return tickets
+
+    def ticket_seat(self, ticket):
+        """Seat details of a ticket (None if the server has none)."""
+        r = self._get("myticketseat", params=self._ticket_seat_data(ticket))
+        return self._parse_ticket_seat(r.content)
+
+    def _ticket_list_data(self, page_no=1):
+        return {
+            **self._base_data(),
             "txtDeviceId": "",
             "txtIndex": "1",
-            "h_page_no": "1",
+            "h_page_no": str(page_no),
             "h_abrd_dt_from": "",
             "h_abrd_dt_to": "",
             "hiduserYn": "Y",
         }
 
-        r = self._session.get(API_ENDPOINTS["myticketlist"], params=data)
-        self._log(r.text)
-        j = json.loads(r.text)
+    def _parse_ticket_list(self, text):
+        self._log(text)
+        j = jsonlib.loads(text)
         try:
-            if self._result_check(j):
-                tickets = []
-                for info in j.get("reservation_list", []):
-                    ticket = Ticket(info)
-                    data = {
-                        "Device": self._device,
-                        "Version": self._version,
-                        "Key": self._key,
-                        "h_orgtk_wct_no": ticket.sale_info1,
-                        "h_orgtk_ret_sale_dt": ticket.sale_info2,
-                        "h_orgtk_sale_sqno": ticket.sale_info3,
-                        "h_orgtk_ret_pwd": ticket.sale_info4,
-                    }
-                    r = self._session.get(API_ENDPOINTS["myticketseat"], params=data)
-                    j = json.loads(r.text)
-                    if self._result_check(j):
-                        seat = (
-                            j.get("ticket_infos", {})
-                            .get("ticket_info", [{}])[0]
-                            .get("tk_seat_info", [{}])[0]
-                        )
-                        ticket.seat_no = seat.get("h_seat_no")
-                        ticket.seat_no_end = None
-                    tickets.append(ticket)
-                return tickets
+            self._result_check(j)
         except NoResultsError:
-            return []
+            return TicketPage([], False)
+        more = j.get("h_next_pg_flg")
+        return TicketPage(
+            [Ticket(info) for info in j.get("reservation_list", [])],
+            None if more is None else more == "Y",
+        )
 
-    def reservations(self, rsv_id=None):
-        data = {
-            "Device": self._device,
-            "Version": self._version,
-            "Key": self._key,
+    def _ticket_seat_data(self, ticket):
+        return {
+            **self._base_data(),
+            "h_orgtk_wct_no": ticket.sale_info1,
+            "h_orgtk_ret_sale_dt": ticket.sale_info2,
+            "h_orgtk_sale_sqno": ticket.sale_info3,
+            "h_orgtk_ret_pwd": ticket.sale_info4,
         }
-        r = self._session.get(API_ENDPOINTS["myreservationview"], params=data)
-        self._log(r.text)
-        j = json.loads(r.text)
-        try:
-            if not self._result_check(j):
-                return []
 
-            jrny_info = j.get("jrny_infos", {}).get("jrny_info", [])
-            reserves = []
-
-            for info in jrny_info:
-                train_info = info.get("train_infos", {}).get("train_info", [])
-                for tinfo in train_info:
-                    reservation = Reservation(tinfo)
-                    reservation.tickets, reservation.wct_no = self.ticket_info(
-                        reservation.rsv_id
-                    )
-                    if rsv_id and reservation.rsv_id == rsv_id:
-                        return reservation
-                    reserves.append(reservation)
-            return reserves
+    def _parse_ticket_seat(self, text):
+        self._log(text)
+        j = jsonlib.loads(text)
+        try:
+            self._result_check(j)
+        except NoResultsError:
+            return None
+        return (
+            j.get("ticket_infos", {})
+            .get("ticket_info", [{}])[0]
+            .get("tk_seat_info", [{}])[0]
+        )
 
+    def reservations(
+        self, rsv_id=None, with_tickets=False, concurrency=TICKET_INFO_CONCURRENCY
+    ):
+        """Get unpaid reservations, or the one with ``rsv_id``.
+
+        Seats and ``wct_no`` are fetched on first access of
+        ``Reservation.tickets`` / ``wct_no`` unless ``with_tickets`` is set;
+        the reservation with ``rsv_id`` gets its own fetched right away.
+
+        Args:
+            rsv_id: Reservation number to return instead of the list
+                (the list is returned if there is no such reservation)
+            with_tickets: Whether to fetch all seats now (see load_details)
+            concurrency: Maximum number of seat requests in flight
+
+        Returns:
+            List of Reservation objects, or the Reservation with ``rsv_id``
+        """
+        r = self._get("myreservationview", params=self._base_data())
+        try:
+            reserves = self._parse_reservations(r.content)
         except NoResultsError:
             return []
 
+        for reservation in reserves:
+            reservation.details = partial(self.ticket_info, reservation.rsv_id)
+        if rsv_id:
+            for reservation in reserves:
+                if reservation.rsv_id == rsv_id:
+                    return self.load_details([reservation])[0]
+        if with_tickets:
+            self.load_details(reserves, concurrency)
+        return reserves
+
+    def load_details(self, reservations, concurrency=TICKET_INFO_CONCURRENCY):
+        """Fetch seats and ``wct_no`` of reservations not yet loaded, in parallel."""
+        pending = [r for r in reservations if not r.details_loaded]
+        if pending:
+            rsv_ids = [r.rsv_id for r in pending]
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                for reservation, details in zip(
+                    pending, pool.map(bind_context(self.ticket_info), rsv_ids)
+                ):
+                    reservation.details = details or ([], None)
+        return reservations
+
+    def _parse_reservations(self, text):
+        """Reservations of a ``myreservationview`` response, without their seats."""
+        self._log(text)
+        j = jsonlib.loads(text)
+        self._result_check(j)
+        return [
+            Reservation(tinfo)
+            for info in j.get("jrny_infos", {}).get("jrny_info", [])
+            for tinfo in info.get("train_infos", {}).get("train_info", [])
+        ]
+
     def ticket_info(self, rsv_id=None):
-        data = {
-            "Device": self._device,
-            "Version": self._version,
-            "Key": self._key,
-            "hidPnrNo": rsv_id,
-        }
-        r = self._session.get(API_ENDPOINTS["myreservationlist"], params=data)
-        self._log(r.text)
-        j = json.loads(r.text)
+        r = self._get("myreservationlist", params=self._ticket_info_data(rsv_id))
+        return self._parse_ticket_info(r.content)
+
+    def _ticket_info_data(self, rsv_id):
+        return {**self._base_data(), "hidPnrNo": rsv_id}
+
+    def _parse_ticket_info(self, text):
+        """(seats, wct_no) of a ``myreservationlist`` response (None if none)."""
+        self._log(text)
+        j = jsonlib.loads(text)
         try:
             if not self._result_check(j):
                 return []
@@ -874,14 +1401,21 @@ class Korail:
         card_expire,
         installment=0,
         card_type="J",
+    ):
+        data = self._payment_data(
+            rsv, card_number, card_password, birthday, card_expire, installment, card_type
+        )
+        r = self._post("pay", data=data)
+        return self._parse_result(r.content)
+
+    def _payment_data(
+        self, rsv, card_number, card_password, birthday, card_expire, installment, card_type
     ):
         if not isinstance(rsv, Reservation):
             raise TypeError("rsv must be a Reservation instance")
 
-        data = {
-            "Device": self._device,
-            "Version": self._version,
-            "Key": self._key,
+        return {
+            **self._base_data(),
             "hidPnrNo": rsv.rsv_id,
             "hidWctNo": rsv.wct_no,
             "hidTmpJobSqno1": "000000",
@@ -901,35 +1435,32 @@ class Korail:
             "hiduserYn": "Y",
         }
 
-        r = self._session.post(API_ENDPOINTS["pay"], data=data)
-        self._log(r.text)
-        j = json.loads(r.text)
-        if self._result_check(j):
-            return True
-        return False
+    def _parse_result(self, text):
+        self._log(text)
+        return self._result_check(jsonlib.loads(text))
 
     def cancel(self, rsv):
+        r = self._post("cancel", data=self._cancel_data(rsv))
+        return self._parse_result(r.content)
+
+    def _cancel_data(self, rsv):
         if not isinstance(rsv, Reservation):
             raise TypeError("rsv must be a Reservation instance")
-        data = {
-            "Device": self._device,
-            "Version": self._version,
-            "Key": self._key,
+        return {
+            **self._base_data(),
             "txtPnrNo": rsv.rsv_id,
             "txtJrnySqno": rsv.journey_no,
             "txtJrnyCnt": rsv.journey_cnt,
             "hidRsvChgNo": rsv.rsv_chg_no,
         }
-        r = self._session.post(API_ENDPOINTS["cancel"], data=data)
-        self._log(r.text)
-        j = json.loads(r.text)
-        return self._result_check(j)
 
     def refund(self, ticket):
-        data = {
-            "Device": self._device,
-            "Version": self._version,
-            "Key": self._key,
+        r = self._post("refund", data=self._refund_data(ticket))
+        return self._parse_result(r.content)
+
+    def _refund_data(self, ticket):
+        return {
+            **self._base_data(),
             "txtPrnNo": ticket.pnr_no,
             "h_orgtk_sale_dt": ticket.sale_info2,
             "h_orgtk_sale_wct_no": ticket.sale_info1,
@@ -942,7 +1473,267 @@ class Korail:
             "latitude": "",
             "longitude": "",
         }
-        r = self._session.post(API_ENDPOINTS["refund"], data=data)
-        self._log(r.text)
-        j = json.loads(r.text)
-        return self._result_check(j)
+
+
+class AsyncKorail(Korail):
+    """Asyncio Korail client.
+
+    Same API as Korail, but every network method is a coroutine, so KTX
+    watch jobs can share an event loop with AsyncSRT jobs and notifications.
+    Request data and response parsing are shared with Korail.
+
+    Examples:
+        >>> async with AsyncKorail("1234567890", YOUR_PASSWORD) as korail:
+        ...     trains = await korail.search_train("서울", "부산")
+    """
+
+    def __init__(
+        self, korail_id, korail_pw, verbose=False, timeouts=None, transport=None
+    ):
+        super().__init__(
+            korail_id,
+            korail_pw,
+            auto_login=False,
+            verbose=verbose,
+            timeouts=timeouts,
+            transport=transport,
+        )
+
+    def _new_session(self):
+        return self._transport.async_session(
+            host_of(KORAIL_MOBILE), impersonate="chrome131_android"
+        )
+
+    async def __aenter__(self):
+        if not self.logined:
+            await self.login()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Close the HTTP session of the client."""
+        await self._transport.release(self._session)
+
+    async def _get(self, endpoint, url=None, **kwargs):
+        return await self._request("get", endpoint, url, **kwargs)
+
+    async def _post(self, endpoint, url=None, **kwargs):
+        return await self._request("post", endpoint, url, **kwargs)
+
+    async def _request(self, method, endpoint, url=None, **kwargs):
+        url = url or API_ENDPOINTS[endpoint]
+        await self._transport.governor.async_wait(host_of(url), endpoint, self.korail_id)
+        timeout = _timeout_for(
+            endpoint, self.timeouts.get(endpoint, self.timeouts["default"])
+        )
+        try:
+            return await getattr(self._session, method)(url, timeout=timeout, **kwargs)
+        except TIMEOUT_ERRORS as ex:
+            raise KorailTimeoutError(endpoint, timeout) from ex
+
+    async def __enc_password(self, password):
+        encrypted = self._cached_password(password)
+        if encrypted:
+            return encrypted
+        r = await self._post("code", data={"code": "app.login.cphd"})
+        return self._encrypt_password(r.content, password)
+
+    async def login(self, korail_id=None, korail_pw=None):
+        self._set_credentials(korail_id, korail_pw)
+        retry = self._reuses_login_key()
+        data = self._login_data(await self.__enc_password(self.korail_pw))
+        r = await self._post("login", data=data)
+        if self._on_login(r.content) or not retry:
+            return self.logined
+        data = self._login_data(await self.__enc_password(self.korail_pw))
+        r = await self._post("login", data=data)
+        return self._on_login(r.content)
+
+    async def relogin(self):
+        await asyncio.sleep(self._relogin_throttle.delay())
+        self.logined = False
+        return await self.login()
+
+    async def resume_session(self, state):
+        self._restore_session(state)
+        r = await self._get("myreservationview", params=self._base_data())
+        return self._on_resume(r.content)
+
+    async def logout(self):
+        r = await self._get("logout")
+        self._log(r.content)
+        self.logined = False
+
+    async def search_train(
+        self,
+        dep,
+        arr,
+        date=None,
+        time=None,
+        train_type=TrainType.ALL,
+        passengers=None,
+        include_no_seats=False,
+        include_waiting_list=False,
+    ):
+        params = self._search_params(dep, arr, date, time, train_type, passengers)
+        return self._filter_trains(
+            await self._search_rows(params), include_no_seats, include_waiting_list
+        )
+
+    async def _search_rows(self, params):
+        r = await self._get("search_schedule", params=params)
+        return self._parse_search(r.content)
+
+    async def watch(
+        self,
+        query,
+        train_numbers=None,
+        seat_type=None,
+        interval=POLL_INTERVAL,
+        repeat=False,
+    ):
+        """Async version of Korail.watch().
+
+        Close the generator when stopping early (``contextlib.aclosing``),
+        so its pending sleep or request is cancelled right away.
+        """
+        params = self._search_params(**query)
+        wanted = None if train_numbers is None else set(train_numbers)
+        diff = AvailabilityDiff(korail_seats, "h_trn_no")
+        policy = RetryPolicy(PollScheduler(interval))
+        while True:
+            started = time.monotonic()
+            try:
+                rows = await self._search_rows(params)
+            except (KorailError, OSError, ValueError) as ex:
+                if self._recover(policy, ex):
+                    try:
+                        await self.relogin()
+                    except (KorailTimeoutError, OSError):
+                        pass  # 다음 조회에서 다시 로그인
+                await policy.async_wait()
+                continue
+
+            policy.success(time.monotonic() - started)
+            if wanted is not None:
+                rows = [row for row in rows if row.get("h_trn_no") in wanted]
+            for event in watch_events(diff, rows, seat_type, repeat):
+                yield event
+            await policy.async_wait()
+
+    async def reserve(self, train, passengers=None, option=ReserveOption.GENERAL_FIRST):
+        data = self._reserve_data(train, passengers, option)
+        r = await self._get("reserve", params=data)
+        return await self.reservations(self._parse_reserve(r.content))
+
+    async def tickets(self, with_seats=True, concurrency=TICKET_INFO_CONCURRENCY):
+        """Async version of Korail.tickets().
+
+        A property cannot await the request, so without ``with_seats`` the
+        seat details stay unloaded (``seat`` is None and ``seat_no`` comes
+        from the ticket list) until fetched with ``load_seats``.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def page(page_no):
+            async with semaphore:
+                return await self._ticket_page(page_no)
+
+        pages = [await self._ticket_page(1)]
+        tickets, more = _join_pages(pages)
+        while more and len(pages) < MAX_TICKET_PAGES:
+            start = len(pages) + 1
+            stop = min(start + concurrency, MAX_TICKET_PAGES + 1)
+            pages.extend(await asyncio.gather(*map(page, range(start, stop))))
+            tickets, more = _join_pages(pages)
+        if with_seats:
+            await self.load_seats(tickets, concurrency)
+        return tickets
+
+    async def _ticket_page(self, page_no):
+        r = await self._get("myticketlist", params=self._ticket_list_data(page_no))
+        return self._parse_ticket_list(r.content)
+
+    async def load_seats(self, tickets, concurrency=TICKET_INFO_CONCURRENCY):
+        """Fetch seat details of tickets not yet loaded, in parallel."""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def load(ticket):
+            async with semaphore:
+                ticket.seat = await self.ticket_seat(ticket)
+
+        await asyncio.gather(*(load(t) for t in tickets if not t.seat_loaded))
+        return tickets
+
+    async def ticket_seat(self, ticket):
+        r = await self._get("myticketseat", params=self._ticket_seat_data(ticket))
+        return self._parse_ticket_seat(r.content)
+
+    async def reservations(
+        self, rsv_id=None, with_tickets=False, concurrency=TICKET_INFO_CONCURRENCY
+    ):
+        """Async version of Korail.reservations().
+
+        ``details`` stays None until loaded with ``with_tickets`` or
+        ``load_details``, since a property cannot await the request; the
+        reservation with ``rsv_id`` is always loaded.
+        """
+        r = await self._get("myreservationview", params=self._base_data())
+        try:
+            reserves = self._parse_reservations(r.content)
+        except NoResultsError:
+            return []
+
+        if rsv_id:
+            for reservation in reserves:
+                if reservation.rsv_id == rsv_id:
+                    await self.load_details([reservation])
+                    return reservation
+        if with_tickets:
+            await self.load_details(reserves, concurrency)
+        return reserves
+
+    async def load_details(self, reservations, concurrency=TICKET_INFO_CONCURRENCY):
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def load(reservation):
+            async with semaphore:
+                details = await self.ticket_info(reservation.rsv_id)
+            reservation.details = details or ([], None)
+
+        await asyncio.gather(
+            *(load(r) for r in reservations if not r.details_loaded)
+        )
+        return reservations
+
+    async def ticket_info(self, rsv_id=None):
+        r = await self._get("myreservationlist", params=self._ticket_info_data(rsv_id))
+        return self._parse_ticket_info(r.content)
+
+    async def pay_with_card(
+        self,
+        rsv,
+        card_number,
+        card_password,
+        birthday,
+        card_expire,
+        installment=0,
+        card_type="J",
+    ):
+        if isinstance(rsv, Reservation):
+            await self.load_details([rsv])  # wct_no
+        data = self._payment_data(
+            rsv, card_number, card_password, birthday, card_expire, installment, card_type
+        )
+        r = await self._post("pay", data=data)
+        return self._parse_result(r.content)
+
+    async def cancel(self, rsv):
+        r = await self._post("cancel", data=self._cancel_data(rsv))
+        return self._parse_result(r.content)
+
+    async def refund(self, ticket):
+        r = await self._post("refund", data=self._refund_data(ticket))
+        return self._parse_result(r.content)
@@ -0,0 +1,248 @@
+"""NetFunnel key cache shared by the SRT and Korail NetFunnel helpers.
+
+A NetFunnel key is only accepted for a limited time. ``KeyCache`` keeps the
+current key, learns how long keys really stay valid from rejections reported
+by the client, and tells a background refresher when to renew the key so that
+searches and reservations rarely wait for the funnel. ``SingleFlight`` makes
+concurrent callers share one queue sequence instead of each starting their
+own.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+
+MIN_TTL = 10  # 학습된 유효시간 하한 (초)
+REFRESH_LEAD = 5  # 만료 몇 초 전에 미리 갱신할지
+TTL_GROW_AFTER = 10  # 거절 없이 이만큼 키를 교체하면 유효시간을 1초 늘림
+
+
+class KeyCache:
+    """Current NetFunnel key with a learned time-to-live.
+
+    Args:
+        ttl: Upper bound of the key validity in seconds
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.max_ttl = ttl
+        self.ttl = ttl
+        self._entry = None  # (key, fetched_at)
+        self._used = False
+        self._survived = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.acquisitions = 0
+        self.refreshes = 0
+        self.failures = 0
+        self.rejections = 0
+        self.last_latency = None
+        self.total_latency = 0.0
+        self.last_nwait = 0
+
+    def get(self, now: float | None = None) -> str | None:
+        """Return the cached key if it is still valid, counting hits/misses.
+
+        Lock-free: the key and its fetch time are swapped as a single tuple.
+        """
+        key = self.peek(now)
+        if key:
+            self.hits += 1
+            self._used = True
+            return key
+        self.misses += 1
+        return None
+
+    def peek(self, now: float | None = None) -> str | None:
+        """Like get(), without touching the counters."""
+        entry = self._entry
+        now = time.time() if now is None else now
+        if entry and now - entry[1] < self.ttl:
+            return entry[0]
+        return None
+
+    def put(
+        self,
+        key: str,
+        fetched_at: float,
+        latency: float,
+        background: bool = False,
+        nwait=0,
+    ) -> None:
+        """Store a freshly acquired key.
+
+        ``nwait`` is the queue length the funnel first reported for it.
+        """
+        if self._entry:
+            self._survived += 1
+            if self._survived >= TTL_GROW_AFTER and self.ttl < self.max_ttl:
+                self.ttl = min(self.max_ttl, self.ttl + 1)
+                self._survived = 0
+        self._entry = (key, fetched_at)
+        self._used = False
+        self.acquisitions += 1
+        self.refreshes += background
+        self.last_latency = latency
+        self.total_latency += latency
+        try:
+            self.last_nwait = int(nwait or 0)
+        except ValueError:
+            self.last_nwait = 0
+
+    def fail(self) -> None:
+        self.failures += 1
+
+    def clear(self) -> None:
+        self._entry = None
+        self._used = False
+
+    def invalidate(self, now: float | None = None) -> None:
+        """Drop the key because the server rejected it, and learn from its age."""
+        entry = self._entry
+        if entry:
+            age = (time.time() if now is None else now) - entry[1]
+            self.ttl = max(min(MIN_TTL, self.max_ttl), min(self.ttl, age - 1))
+            self.rejections += 1
+            self._survived = 0
+        self.clear()
+
+    def refresh_in(self, now: float | None = None) -> float | None:
+        """Seconds until the key should be renewed, or None if not needed.
+
+        Keys nobody used since they were fetched, and keys that already
+        expired, are left alone so an idle client does not keep queueing at
+        the funnel.
+        """
+        entry = self._entry
+        now = time.time() if now is None else now
+        if not entry or not self._used or now - entry[1] >= self.ttl:
+            return None
+        return entry[1] + self.ttl - REFRESH_LEAD - now
+
+    def export(self) -> dict | None:
+        """Current key, its fetch time and the learned TTL, for persisting."""
+        entry = self._entry
+        if not entry:
+            return None
+        return {"key": entry[0], "fetched_at": entry[1], "ttl": self.ttl}
+
+    def restore(self, state: dict | None) -> None:
+        """Load state produced by export(); expired keys are ignored."""
+        if not state:
+            return
+        self.ttl = min(self.max_ttl, state.get("ttl", self.ttl))
+        if time.time() - state["fetched_at"] < self.ttl:
+            self._entry = (state["key"], state["fetched_at"])
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "acquisitions": self.acquisitions,
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "rejections": self.rejections,
+            "ttl": self.ttl,
+            "last_latency": self.last_latency,
+            "last_nwait": self.last_nwait,
+            "avg_latency": (
+                self.total_latency / self.acquisitions if self.acquisitions else None
+            ),
+        }
+
+
+class SingleFlight:
+    """Runs one call at a time; callers arriving meanwhile share its outcome."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._future = None
+
+    def do(self, fn):
+        with self._lock:
+            future = self._future
+            leader = future is None
+            if leader:
+                future = self._future = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as ex:
+            future.set_exception(ex)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._future = None
+
+
+class AsyncSingleFlight:
+    """SingleFlight for coroutines of one event loop."""
+
+    def __init__(self) -> None:
+        self._task = None
+
+    async def do(self, fn):
+        task = self._task
+        if task is None:
+            task = self._task = asyncio.ensure_future(fn())
+            task.add_done_callback(self._done)
+        # A cancelled waiter must not cancel the request the others wait for
+        return await asyncio.shield(task)
+
+    def _done(self, task) -> None:
+        if self._task is task:
+            self._task = None
+        if not task.cancelled():
+            task.exception()  # retrieved by the waiters; silence the loop warning
+
+
+class KeyRefresher(threading.Thread):
+    """Daemon thread renewing a KeyCache shortly before the key expires.
+
+    Args:
+        cache: Cache to watch
+        acquire: Callable fetching and storing a new key
+        interval: Longest time between two checks in seconds
+    """
+
+    def __init__(self, cache: KeyCache, acquire, interval: float = 1.0) -> None:
+        super().__init__(name="netfunnel-refresher", daemon=True)
+        self._cache = cache
+        self._acquire = acquire
+        self._interval = interval
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.is_set():
+            due = self._cache.refresh_in()
+            if due is not None and due <= 0:
+                try:
+                    self._acquire()
+                    continue
+                except Exception:
+                    due = None  # counted by the cache; retried after the interval
+            self._stopped.wait(self._interval if due is None else min(due, self._interval))
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+
+async def refresh_forever(cache: KeyCache, acquire, interval: float = 1.0) -> None:
+    """Asyncio counterpart of KeyRefresher; run it as a task and cancel to stop."""
+    while True:
+        due = cache.refresh_in()
+        if due is not None and due <= 0:
+            try:
+                await acquire()
+                continue
+            except Exception:
+                due = None
+        await asyncio.sleep(interval if due is None else min(due, interval))
@@ -0,0 +1,162 @@
+"""Record real request/response pairs into fixtures and replay them.
+
+``RecordingTransport`` wraps another transport and logs every exchange the
+clients make, with credentials, card data and personal details scrubbed.
+``save`` writes them as JSON lines; ``Replay`` serves them back in order,
+either through ``StandIn(replay=...)`` or directly as a FakeTransport handler.
+
+    transport = RecordingTransport()
+    srt = SRT(srt_id, srt_pw, transport=transport)
+    srt.search_train("수서", "부산")
+    transport.save("fixtures/srt_search.jsonl")
+"""
+
+import json
+from collections import defaultdict, deque
+from urllib.parse import urlparse
+
+from .transport import FakeResponse, Transport
+
+SCRUBBED = "***"
+
+# 요청/응답에서 지울 필드: 계정, 카드, 개인정보
+SCRUB_FIELDS = {
+    # SRT
+    "srchDvNm", "hmpgPwdCphd", "mbCrdNo", "mblPhone",
+    "stlCrCrdNo1", "vanPwd1", "crdVlidTrm1", "athnVal1",
+    "MB_CRD_NO", "CUST_NM", "MBL_PHONE", "CUST_MG_SRT_NO", "BTDT", "EMAIL",
+    # Korail
+    "txtMemberNo", "txtPwd",
+    "hidStlCrCrdNo1", "hidVanPwd1", "hidCrdVlidTrm1", "hidAthnVal1",
+    "strMbCrdNo", "strCustNm", "strCpNo", "strEmailAdr", "strCustId",
+    "h_buy_ps_nm", "h_orgtk_ret_pwd",
+}
+
+
+def scrub(value):
+    """Copy of a decoded request/response with sensitive fields masked."""
+    if isinstance(value, dict):
+        return {
+            k: SCRUBBED if k in SCRUB_FIELDS and v not in (None, "") else scrub(v)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [scrub(v) for v in value]
+    return value
+
+
+def scrub_body(text: str) -> str:
+    try:
+        decoded = json.loads(text)
+    except ValueError:
+        return text  # NetFunnel scripts and other non-JSON bodies
+    return json.dumps(scrub(decoded), ensure_ascii=False)
+
+
+class RecordingTransport(Transport):
+    """Transport logging every exchange of the sessions it creates.
+
+    Args:
+        inner: Transport doing the actual requests (default: a new Transport)
+
+    Attributes:
+        exchanges: Recorded exchanges, already scrubbed
+    """
+
+    def __init__(self, inner: Transport | None = None) -> None:
+        super().__init__()
+        self.inner = inner or Transport()
+        self.exchanges = []
+
+    def session(self, host: str, impersonate: str = "chrome"):
+        return _RecordingSession(self, self.inner.session(host, impersonate))
+
+    def async_session(self, host: str, impersonate: str = "chrome"):
+        return _AsyncRecordingSession(
+            self, self.inner.async_session(host, impersonate)
+        )
+
+    def record(self, method: str, url: str, kwargs: dict, response) -> None:
+        self.exchanges.append(
+            {
+                "method": method,
+                "path": urlparse(url).path,
+                "params": scrub(dict(kwargs.get("params") or {})),
+                "data": scrub(dict(kwargs.get("data") or {})),
+                "status": response.status_code,
+                "body": scrub_body(response.text),
+            }
+        )
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            for exchange in self.exchanges:
+                f.write(json.dumps(exchange, ensure_ascii=False) + "\n")
+
+
+class _RecordingSession:
+    def __init__(self, transport: RecordingTransport, session) -> None:
+        self._transport = transport
+        self._session = session
+
+    def __getattr__(self, name):
+        return getattr(self._session, name)  # headers, cookies, close
+
+    def get(self, url, **kwargs):
+        response = self._session.get(url, **kwargs)
+        self._transport.record("GET", url, kwargs, response)
+        return response
+
+    def post(self, url, **kwargs):
+        response = self._session.post(url, **kwargs)
+        self._transport.record("POST", url, kwargs, response)
+        return response
+
+
+class _AsyncRecordingSession(_RecordingSession):
+    async def get(self, url, **kwargs):
+        response = await self._session.get(url, **kwargs)
+        self._transport.record("GET", url, kwargs, response)
+        return response
+
+    async def post(self, url, **kwargs):
+        response = await self._session.post(url, **kwargs)
+        self._transport.record("POST", url, kwargs, response)
+        return response
+
+
+def load_fixtures(path: str) -> list[dict]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class Replay:
+    """Serves recorded responses per path in their recorded order.
+
+    Once a path's recordings run out, its last response keeps being served,
+    so a recorded search can be polled indefinitely.
+
+    Args:
+        exchanges: Recorded exchanges, or a path to a fixtures file
+    """
+
+    def __init__(self, exchanges: list[dict] | str) -> None:
+        if isinstance(exchanges, str):
+            exchanges = load_fixtures(exchanges)
+        self._queues = defaultdict(deque)
+        for exchange in exchanges:
+            self._queues[exchange["path"]].append(exchange)
+
+    def next(self, path: str) -> dict | None:
+        """Next recorded exchange for ``path``, or None if it was never recorded."""
+        queue = self._queues.get(path)
+        if not queue:
+            return None
+        return queue.popleft() if len(queue) > 1 else queue[0]
+
+    def __call__(self, request) -> FakeResponse:
+        """FakeTransport handler; unrecorded paths answer 404."""
+        exchange = self.next(request.path)
+        if exchange is None:
+            return FakeResponse("", 404, request.url)
+        return FakeResponse(exchange["body"], exchange["status"], request.url)
@@ -0,0 +1,174 @@
+"""What went wrong with a request, and what a polling loop should do about it.
+
+The SRT and Korail clients raise typed exceptions for the server answers a
+loop has to tell apart (sold out, overloaded, login expired, NetFunnel key
+rejected, ...), and every exception carries an ``ErrorKind``. ``classify``
+also covers the errors raised below the clients: dropped connections and
+unparsable responses. ``RetryPolicy`` turns the kind into an ``Action``,
+feeds the PollScheduler, and keeps a ``CircuitBreaker`` that pauses polling
+while the server keeps failing:
+
+    policy = RetryPolicy()
+    while True:
+        try:
+            trains = srt.search_train(...)
+        except Exception as ex:
+            decision = policy.decide(ex)
+            if decision.action is Action.RAISE:
+                raise
+            if decision.action is Action.RELOGIN:
+                srt.relogin()
+        else:
+            policy.success()
+        policy.wait()
+"""
+
+import asyncio
+import time
+from enum import Enum
+from typing import NamedTuple
+
+from .jsonlib import JSONDecodeError
+from .scheduler import PollScheduler, is_busy
+
+BREAKER_THRESHOLD = 10  # 연속 실패가 이만큼이면 조회 중단
+BREAKER_COOLDOWN = 60.0  # 조회 중단 시간 (초)
+
+
+class ErrorKind(Enum):
+    SOLD_OUT = "매진"
+    EMPTY = "조회 결과 없음"
+    BUSY = "서버 과부하"
+    NETFUNNEL = "NetFunnel 키 거절"
+    LOGIN = "로그인 필요"
+    TIMEOUT = "시간 초과"
+    CONNECTION = "연결 오류"
+    BAD_RESPONSE = "응답 해석 실패"
+    FATAL = "복구 불가"
+
+
+class Action(Enum):
+    RETRY = "retry"  # 그대로 다시 조회
+    REKEY = "rekey"  # NetFunnel 키를 버리고 다시 조회
+    RELOGIN = "relogin"  # 다시 로그인하고 조회
+    RAISE = "raise"  # 호출자에게 넘김
+
+
+ACTIONS = {
+    ErrorKind.SOLD_OUT: Action.RETRY,
+    ErrorKind.EMPTY: Action.RETRY,
+    ErrorKind.BUSY: Action.RETRY,
+    ErrorKind.NETFUNNEL: Action.REKEY,
+    ErrorKind.LOGIN: Action.RELOGIN,
+    ErrorKind.TIMEOUT: Action.RETRY,
+    ErrorKind.CONNECTION: Action.RETRY,
+    ErrorKind.BAD_RESPONSE: Action.RELOGIN,  # 세션이 깨져 HTML이 오는 경우
+    ErrorKind.FATAL: Action.RAISE,
+}
+
+# 서버가 정상적으로 답한 결과: 실패로 세지 않음
+ANSWERED = {ErrorKind.SOLD_OUT, ErrorKind.EMPTY}
+
+
+def classify(ex: BaseException) -> ErrorKind:
+    """The kind of a client, network or parsing error."""
+    kind = getattr(ex, "kind", None)
+    if kind is not None and kind is not ErrorKind.FATAL:
+        return kind
+    if is_busy(ex):
+        return ErrorKind.BUSY
+    if isinstance(ex, JSONDecodeError):  # 다른 ValueError는 다시 조회해도 그대로
+        return ErrorKind.BAD_RESPONSE
+    if isinstance(ex, OSError):  # ConnectionError (curl_cffi, requests)
+        return ErrorKind.CONNECTION
+    return ErrorKind.FATAL
+
+
+class Decision(NamedTuple):
+    kind: ErrorKind
+    action: Action
+
+
+class CircuitBreaker:
+    """Stops polling for ``cooldown`` seconds after ``threshold`` failures in a row.
+
+    After the pause one poll goes through; another failure pauses again,
+    a success closes the breaker.
+    """
+
+    def __init__(
+        self, threshold: int = BREAKER_THRESHOLD, cooldown: float = BREAKER_COOLDOWN
+    ) -> None:
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self.trips = 0
+
+    def success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+
+    def failure(self, now: float | None = None) -> bool:
+        """Record a failure; True if it opened the breaker."""
+        self.failures += 1
+        if self.failures < self.threshold:
+            return False
+        self.opened_at = time.monotonic() if now is None else now
+        self.trips += 1
+        return True
+
+    def remaining(self, now: float | None = None) -> float:
+        """Seconds until polling may resume (0 while closed)."""
+        if self.opened_at is None:
+            return 0.0
+        now = time.monotonic() if now is None else now
+        return max(0.0, self.opened_at + self.cooldown - now)
+
+    @property
+    def is_open(self) -> bool:
+        return self.remaining() > 0
+
+
+class RetryPolicy:
+    """Decides the reaction to failed polls and how long to wait before the next.
+
+    Args:
+        scheduler: Poll spacing to feed (default: a new PollScheduler)
+        breaker: Circuit breaker (default: a new CircuitBreaker)
+    """
+
+    def __init__(
+        self,
+        scheduler: PollScheduler | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
+        self.scheduler = scheduler or PollScheduler()
+        self.breaker = breaker or CircuitBreaker()
+        self.tripped = False  # 마지막 decide()가 차단기를 열었는지
+
+    def success(self, latency: float | None = None) -> None:
+        """Record an answered poll."""
+        self.scheduler.success(latency)
+        self.breaker.success()
+        self.tripped = False
+
+    def decide(self, ex: BaseException) -> Decision:
+        """Classify a failed poll, record it and return what to do."""
+        kind = classify(ex)
+        if kind in ANSWERED:
+            self.success()
+        elif kind is not ErrorKind.FATAL:
+            if kind is not ErrorKind.LOGIN:
+                self.scheduler.failure(busy=kind is ErrorKind.BUSY)
+            self.tripped = self.breaker.failure()
+        return Decision(kind, ACTIONS[kind])
+
+    def delay(self) -> float:
+        return max(self.breaker.remaining(), self.scheduler.delay())
+
+    def wait(self) -> None:
+        time.sleep(self.delay())
+
+    async def async_wait(self) -> None:
+        await asyncio.sleep(self.delay())
@@ -0,0 +1,150 @@
+"""Adaptive delays between availability polls.
+
+``PollScheduler`` spaces polls with the same jittered gamma delay the
+reserve loop always used (mean 1.25 s), scaled by a load level. Failed
+polls, "사용자가 많아 접속이 원활하지 않습니다" responses, responses slower
+than usual and NetFunnel queues raise the level; healthy polls bring it back
+down to the base rate. The raised level spaces the polls that follow an
+answer, when the seats just seen are fresh; right after an overload
+response, which shows nothing, the next poll comes sooner than the base
+rate. The delay never exceeds ``ceiling``.
+
+    scheduler = PollScheduler()
+    while True:
+        started = time.monotonic()
+        try:
+            trains = srt.search_train(...)
+        except SRTError as ex:
+            scheduler.failure(busy=is_busy(ex))
+        else:
+            scheduler.success(time.monotonic() - started)
+        scheduler.wait()
+"""
+
+import asyncio
+import time
+from random import gammavariate
+
+POLL_INTERVAL = 1.25  # 정상 상태의 평균 조회 간격 (초)
+POLL_CEILING = 30.0  # 조회 간격 상한 (초)
+POLL_SHAPE = 4  # 간격 분포의 감마 형상 모수
+
+ERROR_SMOOTHING = 0.2  # 오류율 이동 평균 가중치
+ERROR_WEIGHT = 6.0  # 오류율 100%일 때 기본 간격에 더할 배수
+BUSY_WEIGHT = 2.0  # 과부하 응답은 오류율에 두 배로 반영
+STREAK_FREE = 2  # 연속 실패가 이보다 많으면 실패마다 간격 2배
+LATENCY_SMOOTHING = 0.2  # 기준 응답 시간 이동 평균 가중치
+RECENT_SMOOTHING = 0.5  # 최근 응답 시간 이동 평균 가중치
+SLOW_RATIO = 3.0  # 최근 응답이 평소보다 이만큼 느려야 부하 신호
+SLOW_CAP = 3.0  # 응답 지연으로 늘어나는 간격 배수 상한
+NWAIT_STEP = 100  # NetFunnel 대기 인원 이만큼마다 기본 간격 1배 추가
+QUEUE_RECOVERY = 0.5  # 정상 응답마다 대기열 배수 감소 비율
+BUSY_RETRY = 0.5  # 과부하 응답 직후 간격 배수 (조회 결과가 없으므로 빨리 재시도)
+
+# 서버 과부하 응답
+BUSY_MESSAGES = ("사용자가 많아 접속이 원활하지 않습니다",)
+
+
+def is_busy(ex: Exception) -> bool:
+    """Whether an error is the server's overload response."""
+    msg = getattr(ex, "msg", None) or str(ex)
+    return any(busy in msg for busy in BUSY_MESSAGES)
+
+
+class PollScheduler:
+    """Chooses the delay before the next poll from recent server behaviour.
+
+    The level (delay multiplier) follows the strongest of three load
+    signals: the recent error rate, how much slower than usual the server
+    answers, and the NetFunnel queue length. Timeouts and connection errors
+    in a row beyond STREAK_FREE double it per failure, for a server that
+    stopped answering at all.
+
+    An overload response counts towards the error rate but, since it shows
+    no seats, is followed by a short BUSY_RETRY delay instead: the backoff
+    lands after answered polls, so seats that open during an overload are
+    still seen about as soon as with a fixed delay while fewer requests are
+    sent (see benchmarks.poll_scheduler).
+
+    Args:
+        base: Mean delay of a healthy server, in seconds
+        ceiling: Longest delay, in seconds
+    """
+
+    def __init__(
+        self, base: float = POLL_INTERVAL, ceiling: float = POLL_CEILING
+    ) -> None:
+        self.base = base
+        self.ceiling = ceiling
+        self.errors = 0.0  # 오류율 이동 평균
+        self.streak = 0  # 연속 실패 횟수
+        self.latency = None  # 평소 응답 시간
+        self.recent = None  # 최근 응답 시간
+        self.queued = 1.0  # NetFunnel 대기열 배수
+        self.busy = False  # 마지막 조회가 과부하 응답이었는지
+        self._acquisitions = None
+
+    @property
+    def level(self) -> float:
+        """Current delay multiplier (1 when healthy)."""
+        if self.busy:
+            return BUSY_RETRY
+        slow = 1.0
+        if self.latency:
+            slow = min(SLOW_CAP, max(1.0, self.recent / (SLOW_RATIO * self.latency)))
+        level = max(1 + ERROR_WEIGHT * self.errors, slow, self.queued)
+        if self.streak > STREAK_FREE:
+            level *= 2 ** (self.streak - STREAK_FREE)
+        return min(level, max(1.0, self.ceiling / self.base))
+
+    def success(self, latency: float | None = None) -> None:
+        """Record an answered poll and how long it took."""
+        self.errors *= 1 - ERROR_SMOOTHING
+        self.streak = 0
+        self.busy = False
+        self.queued = max(1.0, self.queued * QUEUE_RECOVERY)
+        if latency is None:
+            return
+        if self.latency is None:
+            self.latency = self.recent = latency
+            return
+        self.recent += RECENT_SMOOTHING * (latency - self.recent)
+        # 느린 응답은 기준선에 천천히 반영해 기준선이 밀려 올라가지 않게 함
+        weight = LATENCY_SMOOTHING
+        if latency > self.latency:
+            weight /= 4
+        self.latency += weight * (latency - self.latency)
+
+    def failure(self, busy: bool = False) -> None:
+        """Record a failed poll (timeout, connection error, bad JSON, overload)."""
+        weight = min(1.0, ERROR_SMOOTHING * (BUSY_WEIGHT if busy else 1))
+        self.errors += weight * (1 - self.errors)
+        self.busy = busy
+        if not busy:
+            self.streak += 1
+
+    def queue(self, nwait: int) -> None:
+        """Record the NetFunnel queue length seen when acquiring a key."""
+        self.queued = max(self.queued, 1 + nwait / NWAIT_STEP)
+
+    def netfunnel(self, stats: dict) -> None:
+        """Feed SRT.netfunnel_stats() after a poll; a newly queued key slows polling."""
+        acquisitions = stats.get("acquisitions")
+        if acquisitions != self._acquisitions:
+            self._acquisitions = acquisitions
+            self.queue(stats.get("last_nwait") or 0)
+
+    def interval(self) -> float:
+        """Mean delay at the current level."""
+        return min(self.ceiling, self.base * self.level)
+
+    def delay(self) -> float:
+        """A jittered delay for the next poll, never below a fifth of the mean."""
+        floor = self.interval() / (POLL_SHAPE + 1)
+        return min(self.ceiling, gammavariate(POLL_SHAPE, floor) + floor)
+
+    def wait(self) -> None:
+        time.sleep(self.delay())
+
+    async def async_wait(self) -> None:
+        await asyncio.sleep(self.delay())
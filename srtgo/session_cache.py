@@ -0,0 +1,112 @@
+"""Encrypted on-disk cache of authenticated SRT/Korail sessions.
+
+A cached session (cookie jar, membership metadata and NetFunnel key) lets a
+new process resume with one validation request instead of a full login.
+Files are encrypted with AES-GCM under a key supplied by the caller.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from Crypto.Cipher import AES
+from Crypto.Random import get_random_bytes
+
+SESSION_TTL = 60 * 60  # 캐시된 세션 유효시간 (초)
+
+
+def default_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "srtgo"
+
+
+def new_key() -> bytes:
+    return get_random_bytes(32)
+
+
+def export_cookies(cookies) -> list[dict]:
+    """Serialize a curl_cffi or requests cookie jar."""
+    return [
+        {
+            "name": cookie.name,
+            "value": cookie.value,
+            "domain": cookie.domain,
+            "path": cookie.path,
+            "secure": cookie.secure,
+            "expires": cookie.expires,
+        }
+        for cookie in getattr(cookies, "jar", cookies)
+    ]
+
+
+def import_cookies(cookies, items: list[dict]) -> None:
+    """Load cookies produced by export_cookies into a session's jar."""
+    now = time.time()
+    for item in items:
+        if item.get("expires") and item["expires"] < now:
+            continue
+        cookies.set(
+            item["name"],
+            item["value"],
+            domain=item.get("domain", ""),
+            path=item.get("path", "/"),
+            secure=item.get("secure", False),
+        )
+
+
+class SessionCache:
+    """Stores one encrypted session file per rail type and account.
+
+    Args:
+        key: 32-byte AES key
+        directory: Where to keep the files (default: ~/.cache/srtgo)
+        ttl: Seconds a saved session is considered worth resuming
+    """
+
+    def __init__(
+        self, key: bytes, directory: Path | None = None, ttl: float = SESSION_TTL
+    ) -> None:
+        self._key = key
+        self.directory = Path(directory or default_cache_dir())
+        self.ttl = ttl
+
+    def _path(self, rail_type: str, user_id: str) -> Path:
+        digest = hashlib.sha256(f"{rail_type}:{user_id}".encode("utf-8")).hexdigest()
+        return self.directory / f"session-{digest[:16]}.bin"
+
+    def load(self, rail_type: str, user_id: str) -> dict | None:
+        """Return the saved session state, or None if missing, stale or unreadable."""
+        path = self._path(rail_type, user_id)
+        try:
+            blob = path.read_bytes()
+            nonce, tag, ciphertext = blob[:12], blob[12:28], blob[28:]
+            cipher = AES.new(self._key, AES.MODE_GCM, nonce=nonce)
+            payload = json.loads(cipher.decrypt_and_verify(ciphertext, tag))
+        except (OSError, ValueError, KeyError):
+            return None
+
+        if payload.get("expires", 0) < time.time():
+            self.delete(rail_type, user_id)
+            return None
+        return payload.get("state")
+
+    def save(self, rail_type: str, user_id: str, state: dict) -> None:
+        payload = json.dumps({"expires": time.time() + self.ttl, "state": state})
+        cipher = AES.new(self._key, AES.MODE_GCM, nonce=get_random_bytes(12))
+        ciphertext, tag = cipher.encrypt_and_digest(payload.encode("utf-8"))
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(rail_type, user_id)
+        tmp = path.with_suffix(".tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(cipher.nonce + tag + ciphertext)
+        os.replace(tmp, path)
+
+    def delete(self, rail_type: str, user_id: str) -> None:
+        try:
+            self._path(rail_type, user_id).unlink()
+        except FileNotFoundError:
+            pass
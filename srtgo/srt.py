@@ -1,17 +1,42 @@
 import abc
-try:
-    import curl_cffi
-    HAS_CURL_CFFI = True
-except ImportError:
-    import requests
-    HAS_CURL_CFFI = False
-
+import asyncio
 import json
 import re
 import time
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from datetime import datetime
-from typing import Dict, List, Pattern
+from functools import partial
+from operator import itemgetter
+from types import MappingProxyType
+from typing import (
+    AsyncIterator,
+    Collection,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Pattern,
+)
+
+from . import jsonlib
+from .availability import AvailabilityDiff, Transition, watch_events
+from .deadline import TIMEOUT_ERRORS, bind_context, clip
+from .netfunnel import (
+    AsyncSingleFlight,
+    KeyCache,
+    KeyRefresher,
+    SingleFlight,
+    refresh_forever,
+)
+from .retry import Action, ErrorKind, RetryPolicy
+from .scheduler import POLL_INTERVAL, PollScheduler
+from .session_cache import export_cookies, import_cookies
+from .throttle import ReloginThrottle
+from .transport import Transport, host_of
 
 # Constants
 EMAIL_REGEX: Pattern = re.compile(r"[^@]+@[^@]+\.[^@]+")
@@ -85,6 +110,19 @@ TRAIN_NAME = {
 
 WINDOW_SEAT = {None: "000", True: "012", False: "013"}
 
+TICKET_INFO_CONCURRENCY = 4  # 동시에 조회할 승차권 상세 요청 수
+
+# 요청 제한시간 (초), 엔드포인트별
+REQUEST_TIMEOUTS = {
+    "default": 10.0,
+    "search_schedule": 5.0,  # 조회는 짧게 끊고 다시 시도
+    "tickets": 5.0,
+    "ticket_info": 5.0,
+    "payment": 30.0,  # 결제는 카드사 승인까지 기다림
+    "refund": 20.0,
+}
+NETFUNNEL_TIMEOUT = 5.0
+
 SRT_MOBILE = "https://app.srail.or.kr:443"
 API_ENDPOINTS = {
     "main": f"{SRT_MOBILE}/main/main.do",
@@ -105,6 +143,8 @@ API_ENDPOINTS = {
 
 # Exception classes
 class SRTError(Exception):
+    kind = ErrorKind.FATAL
+
     def __init__(self, msg):
         super().__init__(msg)
         self.msg = msg
@@ -126,11 +166,74 @@ class SRTDuplicateError(SRTResponseError):
 
 
 class SRTNotLoggedInError(SRTError):
-    pass
+    kind = ErrorKind.LOGIN
+
+    def __init__(self, msg="로그인 후 사용하십시오."):
+        super().__init__(msg)
 
 
 class SRTNetFunnelError(SRTError):
-    pass
+    kind = ErrorKind.NETFUNNEL
+
+
+class SRTSoldOutError(SRTResponseError):
+    """No seat left, or the standby list is closed or full."""
+
+    kind = ErrorKind.SOLD_OUT
+
+
+class SRTBusyError(SRTResponseError):
+    """The server is overloaded; poll again later."""
+
+    kind = ErrorKind.BUSY
+    retryable = True
+
+
+class SRTSessionExpiredError(SRTResponseError, SRTNotLoggedInError):
+    """The server dropped the login."""
+
+
+class SRTNetFunnelRejectedError(SRTResponseError, SRTNetFunnelError):
+    """The server rejected the NetFunnel key ("정상적인 경로로 접근 부탁드립니다")."""
+
+
+class SRTTimeoutError(SRTError):
+    """A request did not finish within its timeout or the active deadline.
+
+    Safe to retry for lookups. A timed out reserve or payment may still have
+    been processed by the server, so check the reservations before retrying.
+    """
+
+    kind = ErrorKind.TIMEOUT
+    retryable = True
+
+    def __init__(self, endpoint: str, timeout: float):
+        super().__init__(
+            f"{endpoint} 요청 시간 초과 ({timeout:.3g}초)"
+            if timeout
+            else f"{endpoint} 요청 전 기한 초과"
+        )
+        self.endpoint = endpoint
+        self.timeout = timeout
+
+
+# 서버 메시지 -> 예외 (먼저 맞는 것)
+RESPONSE_ERRORS = (
+    ("잔여석없음", SRTSoldOutError),
+    ("예약대기 접수가 마감되었습니다", SRTSoldOutError),
+    ("예약대기자한도수초과", SRTSoldOutError),
+    ("사용자가 많아 접속이 원활하지 않습니다", SRTBusyError),
+    ("로그인 후 사용하십시오", SRTSessionExpiredError),
+    ("정상적인 경로로 접근 부탁드립니다", SRTNetFunnelRejectedError),
+)
+
+
+def response_error(msg: str) -> SRTResponseError:
+    """The typed exception for a failure message of the server."""
+    for text, error in RESPONSE_ERRORS:
+        if text in msg:
+            return error(msg)
+    return SRTResponseError(msg)
 
 
 # Passenger class
@@ -236,6 +339,19 @@ class Disability4To6(Passenger):
 
 # Ticket class
 class SRTTicket:
+    __slots__ = (
+        "car",
+        "seat",
+        "seat_type_code",
+        "seat_type",
+        "passenger_type_code",
+        "passenger_type",
+        "price",
+        "original_price",
+        "discount",
+        "is_waiting",
+    )
+
     SEAT_TYPE = {"1": "일반실", "2": "특실"}
 
     PASSENGER_TYPE = {
@@ -303,7 +419,35 @@ class SRTTicket:
 
 
 class SRTReservation:
-    def __init__(self, train, pay, tickets):
+    """Reservation summary.
+
+    ``tickets`` may be a list of SRTTicket or a zero-argument callable that
+    fetches them; a callable is invoked on first access of ``tickets``.
+    """
+
+    __slots__ = (
+        "reservation_number",
+        "total_cost",
+        "seat_count",
+        "train_code",
+        "train_name",
+        "train_number",
+        "dep_date",
+        "dep_time",
+        "dep_station_code",
+        "dep_station_name",
+        "arr_time",
+        "arr_station_code",
+        "arr_station_name",
+        "payment_date",
+        "payment_time",
+        "paid",
+        "is_running",
+        "is_waiting",
+        "_tickets",
+    )
+
+    def __init__(self, train, pay, tickets=None):
         self.reservation_number = train.get("pnrNo")
         self.total_cost = int(train.get("rcvdAmt"))
         self.seat_count = train.get("tkSpecNum") or int(train.get("seatNum"))
@@ -329,6 +473,52 @@ class SRTReservation:
 
         self._tickets = tickets
 
+    @classmethod
+    def from_reserve(
+        cls, train: "SRTTrain", result: dict, tickets: list, is_waiting: bool
+    ) -> "SRTReservation":
+        """Build a reservation from a reserve response and its ticket list.
+
+        Only valid for a response that has_reservation_fields().
+
+        Args:
+            train: Reserved train
+            result: ``reservListMap`` entry of the reserve response
+            tickets: Tickets of the new reservation (ticket_info)
+            is_waiting: Whether it is a standby reservation
+        """
+        reservation = cls(
+            {
+                "pnrNo": result["pnrNo"],
+                "rcvdAmt": result["rcvdAmt"],
+                "tkSpecNum": result.get("tkSpecNum") or len(tickets),
+            },
+            {
+                "stlbTrnClsfCd": train.train_code,
+                "trnNo": train.train_number,
+                "dptDt": train.dep_date,
+                "dptTm": train.dep_time,
+                "dptRsStnCd": train.dep_station_code,
+                "arvTm": train.arr_time,
+                "arvRsStnCd": train.arr_station_code,
+                "iseLmtDt": result.get("iseLmtDt"),
+                "iseLmtTm": result.get("iseLmtTm"),
+                "stlFlg": "N",
+            },
+            tickets,
+        )
+        reservation.is_waiting = is_waiting
+        return reservation
+
+    @staticmethod
+    def has_reservation_fields(result: dict, is_waiting: bool) -> bool:
+        """Whether a reserve response carries the amount and payment deadline.
+
+        Otherwise the reservation has to be read from the reservation list.
+        """
+        fields = ("rcvdAmt",) if is_waiting else ("rcvdAmt", "iseLmtDt", "iseLmtTm")
+        return all(result.get(field) for field in fields)
+
     def __str__(self):
         return self.dump()
 
@@ -345,10 +535,11 @@ class SRTReservation:
 
         if not self.paid:
             if not self.is_waiting:
-                base += (
-                    f", 구입기한 {self.payment_date[4:6]}월 {self.payment_date[6:8]}일 "
-                    f"{self.payment_time[:2]}:{self.payment_time[2:4]}"
-                )
+                if self.payment_date and self.payment_time:
+                    base += (
+                        f", 구입기한 {self.payment_date[4:6]}월 {self.payment_date[6:8]}일 "
+                        f"{self.payment_time[:2]}:{self.payment_time[2:4]}"
+                    )
             elif not self.is_running:
                 base += ", 예약대기"
 
@@ -359,18 +550,32 @@ class SRTReservation:
 
     @property
     def tickets(self):
+        if callable(self._tickets):
+            self._tickets = self._tickets()
         return self._tickets
 
+    @tickets.setter
+    def tickets(self, tickets):
+        self._tickets = tickets
+
+    @property
+    def tickets_loaded(self) -> bool:
+        return self._tickets is not None and not callable(self._tickets)
+
 
 # SRTResponseData class
 class SRTResponseData:
-    """SRT Response data class that parses JSON response from API request"""
+    """SRT Response data class that parses JSON response from API request
+
+    ``response`` may be the raw response bytes. Indexing (``data["key"]``)
+    reads the parsed document without copying it; get_all() returns a copy.
+    """
 
     STATUS_SUCCESS = "SUCC"
     STATUS_FAIL = "FAIL"
 
-    def __init__(self, response: str) -> None:
-        self._json = json.loads(response)
+    def __init__(self, response: str | bytes) -> None:
+        self._json = jsonlib.loads(response)
         self._status = self._parse()
 
     def __str__(self) -> str:
@@ -403,6 +608,9 @@ class SRTResponseData:
     def message(self) -> str:
         return self._status.get("msgTxt", "")
 
+    def __getitem__(self, key: str):
+        return self._json[key]
+
     def get_all(self) -> dict:
         return self._json.copy()
 
@@ -419,10 +627,32 @@ class SeatType(Enum):
 
 # Train class
 class Train:
-    pass
+    __slots__ = ()
 
 
 class SRTTrain(Train):
+    __slots__ = (
+        "train_code",
+        "train_name",
+        "train_number",
+        "dep_date",
+        "dep_time",
+        "dep_station_code",
+        "dep_station_name",
+        "dep_station_run_order",
+        "dep_station_constitution_order",
+        "arr_date",
+        "arr_time",
+        "arr_station_code",
+        "arr_station_name",
+        "arr_station_run_order",
+        "arr_station_constitution_order",
+        "general_seat_state",
+        "special_seat_state",
+        "reserve_wait_possible_name",
+        "reserve_wait_possible_code",
+    )
+
     def __init__(self, data):
         self.train_code = data["stlbTrnClsfCd"]
         self.train_name = TRAIN_NAME[self.train_code]
@@ -496,11 +726,266 @@ class SRTTrain(Train):
         return self.general_seat_available() or self.special_seat_available()
 
 
+class _TrainColumns:
+    """Columns and indexes shared by a TrainTable and the views filtered from it."""
+
+    __slots__ = (
+        "columns",
+        "general",
+        "special",
+        "wait_code",
+        "by_number",
+        "dep_order",
+        "dep_times",
+    )
+
+    def __init__(
+        self,
+        columns: dict[str, tuple],
+        general: array,
+        special: array,
+        wait_code: array,
+    ) -> None:
+        self.columns = columns
+        self.general = general
+        self.special = special
+        self.wait_code = wait_code
+
+        self.by_number = {}
+        for i, number in enumerate(columns["train_number"]):
+            self.by_number.setdefault(number, i)
+
+        dep_times = columns["dep_time"]
+        self.dep_order = array(
+            "l", sorted(range(len(wait_code)), key=dep_times.__getitem__)
+        )
+        self.dep_times = [dep_times[i] for i in self.dep_order]
+
+
+class TrainTable:
+    """SRT search results stored column by column.
+
+    Every SRTTrain field is kept as one tuple per column rather than one
+    object per row, seat availability and the standby code as byte arrays.
+    Rows are indexed by train number and by departure time, so ``find`` and
+    ``departing_by`` don't scan the rows; filtering returns a view holding
+    only the selected row numbers. Indexing or iterating the table builds
+    SRTTrain objects on demand.
+
+    Examples:
+        >>> table = srt.search_train("수서", "부산", as_table=True)
+        >>> table.find("00305")
+        >>> table.departing_by("120000").available()
+    """
+
+    __slots__ = ("_data", "_rows", "_members")
+
+    # SRTTrain 속성: 응답 필드
+    COLUMNS = {
+        "train_code": "stlbTrnClsfCd",
+        "train_number": "trnNo",
+        "dep_date": "dptDt",
+        "dep_time": "dptTm",
+        "dep_station_code": "dptRsStnCd",
+        "dep_station_run_order": "dptStnRunOrdr",
+        "dep_station_constitution_order": "dptStnConsOrdr",
+        "arr_date": "arvDt",
+        "arr_time": "arvTm",
+        "arr_station_code": "arvRsStnCd",
+        "arr_station_run_order": "arvStnRunOrdr",
+        "arr_station_constitution_order": "arvStnConsOrdr",
+        "general_seat_state": "gnrmRsvPsbStr",
+        "special_seat_state": "sprmRsvPsbStr",
+        "reserve_wait_possible_name": "rsvWaitPsbCdNm",
+    }
+
+    def __init__(self, data: _TrainColumns, rows: array | None = None) -> None:
+        self._data = data
+        self._rows = rows  # None: 전체 행
+        self._members = None
+
+    @classmethod
+    def from_rows(cls, rows: list[dict]) -> "TrainTable":
+        """Table of the SRT trains among ``dsOutput1`` rows."""
+        rows = [row for row in rows if row["stlbTrnClsfCd"] == "17"]
+        columns = {
+            attr: tuple(map(itemgetter(key), rows)) for attr, key in cls.COLUMNS.items()
+        }
+        return cls(
+            _TrainColumns(
+                columns,
+                array("b", ["예약가능" in s for s in columns["general_seat_state"]]),
+                array("b", ["예약가능" in s for s in columns["special_seat_state"]]),
+                array("b", map(int, map(itemgetter("rsvWaitPsbCd"), rows))),
+            )
+        )
+
+    def _row_numbers(self):
+        return range(len(self._data.wait_code)) if self._rows is None else self._rows
+
+    def _contains(self, row: int) -> bool:
+        if self._rows is None:
+            return True
+        if self._members is None:
+            self._members = bytearray(len(self._data.wait_code))
+            for i in self._rows:
+                self._members[i] = 1
+        return bool(self._members[row])
+
+    def _train(self, row: int) -> SRTTrain:
+        train = SRTTrain.__new__(SRTTrain)
+        for attr, values in self._data.columns.items():
+            setattr(train, attr, values[row])
+        train.train_name = TRAIN_NAME[train.train_code]
+        train.dep_station_name = STATION_NAME[train.dep_station_code]
+        train.arr_station_name = STATION_NAME[train.arr_station_code]
+        train.reserve_wait_possible_code = self._data.wait_code[row]
+        return train
+
+    def __len__(self) -> int:
+        return len(self._row_numbers())
+
+    def __getitem__(self, i: int) -> SRTTrain:
+        return self._train(self._row_numbers()[i])
+
+    def __iter__(self):
+        return (self._train(row) for row in self._row_numbers())
+
+    def __repr__(self) -> str:
+        return f"<TrainTable {len(self)} trains>"
+
+    def column(self, name: str) -> tuple:
+        """Values of one SRTTrain field, in row order."""
+        values = self._data.columns[name]
+        if self._rows is None:
+            return values
+        return tuple(values[row] for row in self._rows)
+
+    def find(self, train_number: str) -> SRTTrain | None:
+        row = self._data.by_number.get(train_number)
+        if row is None or not self._contains(row):
+            return None
+        return self._train(row)
+
+    def departing_by(self, time_limit: str) -> "TrainTable":
+        """Trains departing at or before ``time_limit`` (HHMMSS)."""
+        end = bisect_right(self._data.dep_times, time_limit)
+        rows = sorted(self._data.dep_order[:end])
+        if self._rows is not None:
+            rows = [row for row in rows if self._contains(row)]
+        return TrainTable(self._data, array("l", rows))
+
+    def available(self) -> "TrainTable":
+        """Trains with general or special seats available."""
+        general, special = self._data.general, self._data.special
+        return TrainTable(
+            self._data,
+            array(
+                "l", [row for row in self._row_numbers() if general[row] or special[row]]
+            ),
+        )
+
+
+def _seat_open(state: str) -> bool:
+    return "예약가능" in state
+
+
+def _seat_matches(row: dict, seat_type: SeatType) -> bool:
+    """Whether a ``dsOutput1`` row can be reserved with ``seat_type``.
+
+    A sold-out train matches when its standby list is open, as reserve()
+    falls back to reserve_standby() for it.
+    """
+    general = _seat_open(row["gnrmRsvPsbStr"])
+    special = _seat_open(row["sprmRsvPsbStr"])
+    if not (general or special):
+        return int(row["rsvWaitPsbCd"]) == 9
+    if seat_type == SeatType.GENERAL_ONLY:
+        return general
+    if seat_type == SeatType.SPECIAL_ONLY:
+        return special
+    return True
+
+
+def _select_rows(
+    rows: list[dict],
+    available_only: bool = False,
+    time: str | None = None,
+    time_limit: str | None = None,
+    train_numbers: Collection[str] | None = None,
+    seat_type: SeatType | None = None,
+) -> Iterator[dict]:
+    """SRT rows of a search response passing the filters, before any SRTTrain is built.
+
+    Args:
+        rows: ``dsOutput1`` rows
+        available_only: Only rows with general or special seats available
+        time: Only rows departing at or after this time (HHMMSS)
+        time_limit: Only rows departing at or before this time (HHMMSS)
+        train_numbers: Only these train numbers
+        seat_type: Only rows reservable with this seat type
+    """
+    for row in rows:
+        if row["stlbTrnClsfCd"] != "17":
+            continue
+        if train_numbers is not None and row["trnNo"] not in train_numbers:
+            continue
+        dep_time = row["dptTm"]
+        if (time and dep_time < time) or (time_limit and dep_time > time_limit):
+            continue
+        if available_only and not (
+            _seat_open(row["gnrmRsvPsbStr"]) or _seat_open(row["sprmRsvPsbStr"])
+        ):
+            continue
+        if seat_type is not None and not _seat_matches(row, seat_type):
+            continue
+        yield row
+
+
+class PreparedSearch(NamedTuple):
+    """A validated, reusable SRT search built by SRT.prepare_search().
+
+    ``body`` is the read-only search form without ``netfunnelKey``; form()
+    copies it and patches only the fields that change between polls.
+    """
+
+    body: Mapping[str, str]
+    date: str
+    time: str | None
+    time_limit: str | None
+    train_numbers: frozenset[str] | None
+    seat_type: "SeatType | None"
+
+    def form(self, netfunnel_key: str, now: datetime | None = None) -> dict:
+        """Search form for one poll.
+
+        Args:
+            netfunnel_key: NetFunnel key for this request
+            now: Current time (default: datetime.now())
+
+        Raises:
+            ValueError: If the search date has passed
+        """
+        form = dict(self.body)
+        form["netfunnelKey"] = netfunnel_key
+
+        now = (now or datetime.now()).strftime("%Y%m%d%H%M%S")
+        today = now[:8]
+        if self.date < today:
+            raise ValueError("Date cannot be before today")
+        if self.date == today and now[8:] > form["dptTm"]:
+            # 오늘 검색은 지난 시각의 열차를 빼고 현재 시각부터 조회
+            form["dptTm"] = now[8:]
+            form["dptTm1"] = now[8:10] + "0000"
+        return form
+
+
 # NetFunnel
 class NetFunnelHelper:
     WAIT_STATUS_PASS = "200"
     WAIT_STATUS_FAIL = "201"
     ALREADY_COMPLETED = "502"
+    WAIT_INTERVAL = 1  # 대기열 재확인 간격 (초)
 
     OP_CODE = {
         "getTidchkEnter": "5101",
@@ -528,64 +1013,128 @@ class NetFunnelHelper:
         "Accept-Language": "en-US,en;q=0.9,ko-KR;q=0.8,ko;q=0.7",
     }
 
-    def __init__(self, debug=False):
-        if HAS_CURL_CFFI:
-            self._session = curl_cffi.Session(impersonate="chrome")
-        else:
-            self._session = requests.session()
+    NETFUNNEL_URL = "https://{host}/ts.wseq"
+    NETFUNNEL_HOST = "nf.letskorail.com"
+
+    def __init__(self, debug=False, timeout=NETFUNNEL_TIMEOUT, transport=None):
+        self._transport = transport or Transport()
+        self._session = self._new_session()
         self._session.headers.update(self.DEFAULT_HEADERS)
-        self._cached_key = None
-        self._last_fetch_time = 0
-        self._cache_ttl = 48  # 48 seconds
+        self.timeout = timeout
+        self._cache = KeyCache(ttl=48)  # 48 seconds at most
+        self._flight = self._new_flight()
+        self._refresher = None
         self.debug = debug
 
+    def _new_session(self):
+        return self._transport.session(self.NETFUNNEL_HOST)
+
+    @staticmethod
+    def _new_flight():
+        return SingleFlight()
+
     def run(self):
-        current_time = time.time()
-        if self._is_cache_valid(current_time):
-            return self._cached_key
+        """Return a valid NetFunnel key, queueing for a new one if needed.
 
+        A still-valid key is returned without locking. Otherwise concurrent
+        callers share a single queue sequence.
+        """
+        return self._cache.get() or self._flight.do(self._acquire_missing)
+
+    def _acquire_missing(self):
+        return self._cache.peek() or self._acquire()
+
+    def _refresh(self):
+        return self._flight.do(partial(self._acquire, background=True))
+
+    def _acquire(self, background: bool = False):
+        started = time.time()
         try:
-            status, self._cached_key, nwait, ip = self._start()
-            self._last_fetch_time = current_time
+            status, key, nwait, ip = self._start()
+            queued = nwait
 
             # Keep checking until we get a pass status
             while status == self.WAIT_STATUS_FAIL:
-                print(f"\r현재 {nwait}명 대기중...", end="", flush=True)
-                time.sleep(1)
-                status, self._cached_key, nwait, ip = self._check(ip)
+                if not background:
+                    print(f"\r현재 {nwait}명 대기중...", end="", flush=True)
+                time.sleep(self.WAIT_INTERVAL)
+                status, key, nwait, ip = self._check(ip, key)
 
             # Complete the funnel process
-            status, *_ = self._complete(ip)
+            status, *_ = self._complete(ip, key)
             if status in (self.WAIT_STATUS_PASS, self.ALREADY_COMPLETED):
-                return self._cached_key
+                self._cache.put(
+                    key, started, time.time() - started, background, queued
+                )
+                return key
 
-            self.clear()
             raise SRTNetFunnelError("Failed to complete NetFunnel")
 
+        except (SRTTimeoutError, SRTNetFunnelError):
+            self._cache.fail()
+            raise  # 시간 초과는 TIMEOUT으로 분류되도록 그대로
         except Exception as ex:
-            self.clear()
+            self._cache.fail()
             raise SRTNetFunnelError(str(ex))
 
     def clear(self):
-        self._cached_key = None
-        self._last_fetch_time = 0
+        self._cache.clear()
+
+    def invalidate(self):
+        """Drop the key after the server rejected it, shortening the learned TTL."""
+        self._cache.invalidate()
+
+    def start_refresher(self):
+        """Renew the key in a background thread shortly before it expires."""
+        if self._refresher is None:
+            self._refresher = KeyRefresher(self._cache, self._refresh)
+            self._refresher.start()
+
+    def stop_refresher(self):
+        if self._refresher is not None:
+            self._refresher.stop()
+            self._refresher = None
+
+    def stats(self) -> dict:
+        """Key hit/miss counters, learned TTL and acquisition latency."""
+        return self._cache.stats()
+
+    def export_state(self) -> dict | None:
+        return self._cache.export()
+
+    def restore_state(self, state: dict | None) -> None:
+        self._cache.restore(state)
 
     def _start(self):
         return self._make_request("getTidchkEnter")
 
-    def _check(self, ip: str | None = None):
-        return self._make_request("chkEnter", ip)
+    def _check(self, ip: str | None = None, key: str | None = None):
+        return self._make_request("chkEnter", ip, key)
 
-    def _complete(self, ip: str | None = None):
-        return self._make_request("setComplete", ip)
+    def _complete(self, ip: str | None = None, key: str | None = None):
+        return self._make_request("setComplete", ip, key)
 
-    def _make_request(self, opcode: str, ip: str | None = None):
-        url = f"https://{ip or 'nf.letskorail.com'}/ts.wseq"
-        params = self._build_params(self.OP_CODE[opcode])
-        r = self._session.get(url, params=params, verify=False)
+    def _make_request(self, opcode: str, ip: str | None = None, key: str | None = None):
+        url = self.NETFUNNEL_URL.format(host=ip or self.NETFUNNEL_HOST)
+        params = self._build_params(self.OP_CODE[opcode], key=key)
+        self._transport.governor.wait(self.NETFUNNEL_HOST, "netfunnel")
+        timeout = self._timeout()
+        try:
+            r = self._session.get(url, params=params, verify=False, timeout=timeout)
+        except TIMEOUT_ERRORS as ex:
+            raise SRTTimeoutError("netfunnel", timeout) from ex
+        return self._handle_response(r.text)
+
+    def _timeout(self) -> float:
+        timeout = clip(self.timeout)
+        if not timeout:
+            raise SRTTimeoutError("netfunnel", 0)
+        return timeout
+
+    def _handle_response(self, text: str):
         if self.debug:
-            print(r.text)
-        response = self._parse(r.text)
+            print(text)
+        response = self._parse(text)
         return map(response.get, ("status", "key", "nwait", "ip"))
 
     def _build_params(
@@ -602,9 +1151,9 @@ class NetFunnelHelper:
         if opcode in (self.OP_CODE["getTidchkEnter"], self.OP_CODE["chkEnter"]):
             params.update({"sid": "service_1", "aid": "act_10"})
             if opcode == self.OP_CODE["chkEnter"]:
-                params.update({"key": key or self._cached_key, "ttl": "1"})
+                params.update({"key": key, "ttl": "1"})
         elif opcode == self.OP_CODE["setComplete"]:
-            params["key"] = key or self._cached_key
+            params["key"] = key
 
         return params
 
@@ -623,11 +1172,86 @@ class NetFunnelHelper:
         params.update({"code": code, "status": status})
         return params
 
-    def _is_cache_valid(self, current_time: float) -> bool:
-        return bool(
-            self._cached_key
-            and (current_time - self._last_fetch_time) < self._cache_ttl
-        )
+
+class AsyncNetFunnelHelper(NetFunnelHelper):
+    """NetFunnelHelper variant that awaits the queue instead of sleeping."""
+
+    def _new_session(self):
+        return self._transport.async_session(self.NETFUNNEL_HOST)
+
+    @staticmethod
+    def _new_flight():
+        return AsyncSingleFlight()
+
+    async def run(self):
+        return self._cache.get() or await self._flight.do(self._acquire_missing)
+
+    async def _acquire_missing(self):
+        return self._cache.peek() or await self._acquire()
+
+    async def _refresh(self):
+        return await self._flight.do(partial(self._acquire, background=True))
+
+    async def _acquire(self, background: bool = False):
+        started = time.time()
+        try:
+            status, key, nwait, ip = await self._start()
+            queued = nwait
+
+            # Keep checking until we get a pass status
+            while status == self.WAIT_STATUS_FAIL:
+                if not background:
+                    print(f"\r현재 {nwait}명 대기중...", end="", flush=True)
+                await asyncio.sleep(self.WAIT_INTERVAL)
+                status, key, nwait, ip = await self._check(ip, key)
+
+            # Complete the funnel process
+            status, *_ = await self._complete(ip, key)
+            if status in (self.WAIT_STATUS_PASS, self.ALREADY_COMPLETED):
+                self._cache.put(
+                    key, started, time.time() - started, background, queued
+                )
+                return key
+
+            raise SRTNetFunnelError("Failed to complete NetFunnel")
+
+        except (SRTTimeoutError, SRTNetFunnelError):
+            self._cache.fail()
+            raise  # 시간 초과는 TIMEOUT으로 분류되도록 그대로
+        except Exception as ex:
+            self._cache.fail()
+            raise SRTNetFunnelError(str(ex))
+
+    def start_refresher(self):
+        """Renew the key in a task of the running loop shortly before it expires."""
+        if self._refresher is None:
+            self._refresher = asyncio.create_task(
+                refresh_forever(self._cache, self._refresh)
+            )
+
+    def stop_refresher(self):
+        if self._refresher is not None:
+            self._refresher.cancel()
+            self._refresher = None
+
+    async def _make_request(
+        self, opcode: str, ip: str | None = None, key: str | None = None
+    ):
+        url = self.NETFUNNEL_URL.format(host=ip or self.NETFUNNEL_HOST)
+        params = self._build_params(self.OP_CODE[opcode], key=key)
+        await self._transport.governor.async_wait(self.NETFUNNEL_HOST, "netfunnel")
+        timeout = self._timeout()
+        try:
+            r = await self._session.get(
+                url, params=params, verify=False, timeout=timeout
+            )
+        except TIMEOUT_ERRORS as ex:
+            raise SRTTimeoutError("netfunnel", timeout) from ex
+        return self._handle_response(r.text)
+
+    async def close(self) -> None:
+        self.stop_refresher()
+        await self._transport.release(self._session)
 
 
 # SRT class
@@ -639,6 +1263,12 @@ class SRT:
         srt_pw (str): SRT account password
         auto_login (bool): Whether to automatically login on initialization
         verbose (bool): Whether to print debug logs
+        netfunnel_refresh (bool): Whether to renew the NetFunnel key in the
+            background before it expires
+        timeouts (dict): Per-endpoint request timeouts in seconds, merged
+            over REQUEST_TIMEOUTS (keys of API_ENDPOINTS, or "default")
+        transport (Transport): Creates the HTTP sessions of the client and
+            its NetFunnel helper (default: a new session each)
 
     Examples:
         >>> srt = SRT("1234567890", YOUR_PASSWORD) # with membership number
@@ -646,15 +1276,28 @@ class SRT:
         >>> srt = SRT("010-1234-xxxx", YOUR_PASSWORD) # with phone number
     """
 
+    _netfunnel_class = NetFunnelHelper
+
     def __init__(
-        self, srt_id: str, srt_pw: str, auto_login: bool = True, verbose: bool = False
+        self,
+        srt_id: str,
+        srt_pw: str,
+        auto_login: bool = True,
+        verbose: bool = False,
+        netfunnel_refresh: bool = False,
+        timeouts: dict | None = None,
+        transport: Transport | None = None,
     ) -> None:
-        if HAS_CURL_CFFI:
-            self._session = curl_cffi.Session(impersonate="chrome")
-        else:
-            self._session = requests.session()
+        self._transport = transport or Transport()
+        self._session = self._new_session()
         self._session.headers.update(DEFAULT_HEADERS)
-        self._netfunnel = NetFunnelHelper(debug=verbose)
+        self.timeouts = {**REQUEST_TIMEOUTS, **(timeouts or {})}
+        self._netfunnel = self._netfunnel_class(
+            debug=verbose,
+            timeout=self.timeouts.get("netfunnel", NETFUNNEL_TIMEOUT),
+            transport=self._transport,
+        )
+        self._relogin_throttle = ReloginThrottle()
         self.srt_id = srt_id
         self.srt_pw = srt_pw
         self.verbose = verbose
@@ -663,13 +1306,43 @@ class SRT:
         self.membership_name = None
         self.phone_number = None
 
+        if netfunnel_refresh:
+            self._netfunnel.start_refresher()
+
         if auto_login:
             self.login()
 
-    def _log(self, msg: str) -> None:
+    def _new_session(self):
+        return self._transport.session(host_of(SRT_MOBILE))
+
+    def _log(self, msg: str | bytes) -> None:
         if self.verbose:
+            if isinstance(msg, bytes):
+                msg = msg.decode("utf-8", "replace")
             print("[*] " + msg)
 
+    def _post(self, endpoint: str, **kwargs):
+        """POST to an API endpoint within its timeout and the active deadline.
+
+        Waits for the transport's request budget first.
+
+        Raises:
+            SRTTimeoutError: If the request timed out or the deadline passed
+        """
+        url = API_ENDPOINTS[endpoint]
+        self._transport.governor.wait(host_of(url), endpoint, self.srt_id)
+        timeout = self._timeout(endpoint)
+        try:
+            return self._session.post(url, timeout=timeout, **kwargs)
+        except TIMEOUT_ERRORS as ex:
+            raise SRTTimeoutError(endpoint, timeout) from ex
+
+    def _timeout(self, endpoint: str) -> float:
+        timeout = clip(self.timeouts.get(endpoint, self.timeouts["default"]))
+        if not timeout:
+            raise SRTTimeoutError(endpoint, 0)
+        return timeout
+
     def login(self, srt_id: str | None = None, srt_pw: str | None = None) -> bool:
         """Login to SRT server.
 
@@ -685,9 +1358,28 @@ class SRT:
         Raises:
             SRTLoginError: If login fails
         """
-        srt_id = srt_id or self.srt_id
-        srt_pw = srt_pw or self.srt_pw
+        data = self._login_data(srt_id or self.srt_id, srt_pw or self.srt_pw)
+        r = self._post("login", data=data)
+        return self._on_login(r)
+
+    def relogin(self) -> bool:
+        """Log in again on the current session after the server dropped it.
+
+        Unlike creating a new client, this keeps the open connections and the
+        cached NetFunnel key. Consecutive calls are spaced out by a
+        ReloginThrottle so a flapping network cannot cause a login storm.
+
+        Returns:
+            bool: Whether login was successful
 
+        Raises:
+            SRTLoginError: If login fails
+        """
+        time.sleep(self._relogin_throttle.delay())
+        self.is_login = False
+        return self.login()
+
+    def _login_data(self, srt_id: str, srt_pw: str) -> dict:
         login_type = (
             "2"
             if EMAIL_REGEX.match(srt_id)
@@ -697,7 +1389,7 @@ class SRT:
         if login_type == "3":
             srt_id = re.sub("-", "", srt_id)
 
-        data = {
+        return {
             "auto": "Y",
             "check": "Y",
             "page": "menu",
@@ -709,8 +1401,8 @@ class SRT:
             "hmpgPwdCphd": srt_pw,
         }
 
-        r = self._session.post(url=API_ENDPOINTS["login"], data=data)
-        self._log(r.text)
+    def _on_login(self, r) -> bool:
+        self._log(r.content)
 
         if "존재하지않는 회원입니다" in r.text:
             raise SRTLoginError(r.json()["MSG"])
@@ -720,7 +1412,7 @@ class SRT:
             raise SRTLoginError(r.text.strip())
 
         self.is_login = True
-        user_info = json.loads(r.text)["userMap"]
+        user_info = jsonlib.loads(r.content)["userMap"]
         self.membership_number = user_info["MB_CRD_NO"]
         self.membership_name = user_info["CUST_NM"]
         self.phone_number = user_info["MBL_PHONE"]
@@ -742,8 +1434,11 @@ class SRT:
         if not self.is_login:
             return True
 
-        r = self._session.post(url=API_ENDPOINTS["logout"])
-        self._log(r.text)
+        r = self._post("logout")
+        return self._on_logout(r)
+
+    def _on_logout(self, r) -> bool:
+        self._log(r.content)
 
         if not r.ok:
             raise SRTResponseError(r.text)
@@ -752,6 +1447,58 @@ class SRT:
         self.membership_number = None
         return True
 
+    def export_session(self) -> dict:
+        """Snapshot of the logged-in session (cookies, member info, NetFunnel key).
+
+        Feed it to resume_session in another process to skip the login.
+        """
+        return {
+            "cookies": export_cookies(self._session.cookies),
+            "membership_number": self.membership_number,
+            "membership_name": self.membership_name,
+            "phone_number": self.phone_number,
+            "netfunnel": self._netfunnel.export_state(),
+        }
+
+    def resume_session(self, state: dict) -> bool:
+        """Restore a session from export_session and validate it with one request.
+
+        Returns:
+            bool: Whether the session is still logged in. If not, the client
+            is left logged out and login() should be called.
+        """
+        self._restore_session(state)
+        r = self._post("tickets", data={"pageNo": "0"})
+        return self._on_resume(r.content)
+
+    def _restore_session(self, state: dict) -> None:
+        import_cookies(self._session.cookies, state.get("cookies", []))
+        self.membership_number = state.get("membership_number")
+        self.membership_name = state.get("membership_name")
+        self.phone_number = state.get("phone_number")
+        self._netfunnel.restore_state(state.get("netfunnel"))
+        self.is_login = True
+
+    def _on_resume(self, text: str | bytes) -> bool:
+        try:
+            self._parse(text)
+        except (SRTError, ValueError):
+            self.is_login = False
+            self.membership_number = None
+            self._session.cookies.clear()
+            return False
+        return True
+
+    def _parse(self, text: str | bytes) -> SRTResponseData:
+        """Parse a response and raise SRTResponseError if it is a failure."""
+        self._log(text)
+        parser = SRTResponseData(text)
+
+        if not parser.success():
+            raise response_error(parser.message())
+
+        return parser
+
     def search_train(
         self,
         dep: str,
@@ -761,7 +1508,8 @@ class SRT:
         time_limit: str | None = None,
         passengers: list[Passenger] | None = None,
         available_only: bool = True,
-    ) -> list[SRTTrain]:
+        as_table: bool = False,
+    ) -> list[SRTTrain] | TrainTable:
         """Search for available trains.
 
         Args:
@@ -772,13 +1520,28 @@ class SRT:
             time_limit: Only return trains before this time
             passengers: List of passengers (default: 1 adult)
             available_only: Only return trains with available seats
+            as_table: Return a columnar TrainTable instead of a list
 
         Returns:
-            List of matching SRTTrain objects
+            List of matching SRTTrain objects, or a TrainTable of them
 
         Raises:
             ValueError: If invalid station names provided
         """
+        data = self._search_data(dep, arr, date, time, passengers)
+        data["netfunnelKey"] = self._netfunnel.run()
+
+        r = self._post("search_schedule", data=data)
+        return self._parse_trains(r.content, available_only, time_limit, as_table)
+
+    def _search_data(
+        self,
+        dep: str,
+        arr: str,
+        date: str | None,
+        time: str | None,
+        passengers: list[Passenger] | None,
+    ) -> dict:
         if dep not in STATION_CODE or arr not in STATION_CODE:
             raise ValueError(f'Invalid station: "{dep}" or "{arr}"')
 
@@ -797,7 +1560,7 @@ class SRT:
 
         passengers = Passenger.combine(passengers or [Adult()])
 
-        data = {
+        return {
             "chtnDvCd": "1",
             "dptDt": date,
             "dptTm": time,
@@ -816,26 +1579,215 @@ class SRT:
             "tkTrnNo": "",
             "tkTripChgFlg": "",
             "dlayTnumAplFlg": "Y",
-            "netfunnelKey": self._netfunnel.run(),
         }
 
-        r = self._session.post(url=API_ENDPOINTS["search_schedule"], data=data)
-        self._log(r.text)
-        parser = SRTResponseData(r.text)
+    def _parse_trains(
+        self,
+        text: str | bytes,
+        available_only: bool,
+        time_limit: str | None,
+        as_table: bool = False,
+    ) -> list[SRTTrain] | TrainTable:
+        parser = self._parse(text)
+
+        if as_table:
+            table = TrainTable.from_rows(parser["outDataSets"]["dsOutput1"])
+            if time_limit:
+                table = table.departing_by(time_limit)
+            return table.available() if available_only else table
+
+        rows = parser["outDataSets"]["dsOutput1"]
+        return [
+            SRTTrain(row)
+            for row in _select_rows(rows, available_only, time_limit=time_limit)
+        ]
 
-        if not parser.success():
-            raise SRTResponseError(parser.message())
+    def find_trains(
+        self,
+        dep: str,
+        arr: str,
+        date: str | None = None,
+        time: str | None = None,
+        time_limit: str | None = None,
+        train_numbers: Collection[str] | None = None,
+        seat_type: SeatType | None = None,
+        passengers: list[Passenger] | None = None,
+    ) -> dict[str, SRTTrain]:
+        """Search trains and return the matching ones keyed by train number.
 
-        return [
-            train
-            for train in (
-                SRTTrain(t)
-                for t in parser.get_all()["outDataSets"]["dsOutput1"]
-                if t["stlbTrnClsfCd"] == "17"
+        The filters are applied to the raw response rows, so only matching
+        trains are built. Train numbers stay valid across searches, unlike
+        positions in the search_train() list.
+
+        Args:
+            dep: Departure station name
+            arr: Arrival station name
+            date: Date in YYYYMMDD format (default: today)
+            time: Only trains departing at or after this time (HHMMSS)
+            time_limit: Only trains departing at or before this time (HHMMSS)
+            train_numbers: Only these train numbers (e.g. ``{"00305"}``)
+            seat_type: Only trains reservable with this seat type; a sold-out
+                train counts when its standby list is open
+            passengers: List of passengers (default: 1 adult)
+
+        Returns:
+            Dict of train number to SRTTrain, in departure order
+
+        Examples:
+            >>> wanted = {"00305", "00313"}
+            >>> srt.find_trains("수서", "부산", "20240101", train_numbers=wanted,
+            ...                 seat_type=SeatType.GENERAL_ONLY)
+        """
+        return self.search_prepared(
+            self.prepare_search(
+                dep, arr, date, time, time_limit, train_numbers, seat_type, passengers
             )
-            if (not available_only or train.seat_available())
-            and (not time_limit or train.dep_time <= time_limit)
-        ]
+        )
+
+    def prepare_search(
+        self,
+        dep: str,
+        arr: str,
+        date: str | None = None,
+        time: str | None = None,
+        time_limit: str | None = None,
+        train_numbers: Collection[str] | None = None,
+        seat_type: SeatType | None = None,
+        passengers: list[Passenger] | None = None,
+    ) -> PreparedSearch:
+        """Validate and build a search once, to run it with search_prepared().
+
+        Takes the same arguments as find_trains(). Stations, passengers and
+        the search form are checked and built here; each run only adds the
+        NetFunnel key and, for a search of today, moves the start time up
+        to the current time.
+
+        Examples:
+            >>> search = srt.prepare_search("수서", "부산", train_numbers={"00305"})
+            >>> while not (found := srt.search_prepared(search)):
+            ...     time.sleep(1)
+        """
+        data = self._search_data(dep, arr, date, time, passengers)
+        data["dptTm"] = time or "000000"  # form()이 실행 시각에 맞춰 조정
+        data["dptTm1"] = data["dptTm"][:2] + "0000"
+        return PreparedSearch(
+            MappingProxyType(data),
+            data["dptDt"],
+            time,
+            time_limit,
+            None if train_numbers is None else frozenset(train_numbers),
+            seat_type,
+        )
+
+    def search_prepared(self, search: PreparedSearch) -> dict[str, SRTTrain]:
+        """Run a prepared search.
+
+        Returns:
+            Dict of train number to SRTTrain, as find_trains()
+        """
+        return {row["trnNo"]: SRTTrain(row) for row in self.search_rows(search)}
+
+    def search_rows(self, search: PreparedSearch) -> list[dict]:
+        """Run a prepared search and return the matching raw ``dsOutput1`` rows.
+
+        For callers that only look at what changed between polls (see
+        srtgo.availability) and build SRTTrain objects for a few rows.
+        """
+        data = search.form(self._netfunnel.run())
+        r = self._post("search_schedule", data=data)
+        return self._parse_prepared(r.content, search)
+
+    def watch(
+        self,
+        query: PreparedSearch | dict,
+        train_numbers: Collection[str] | None = None,
+        seat_type: SeatType | None = None,
+        interval: float = POLL_INTERVAL,
+        repeat: bool = False,
+    ) -> Iterator[Transition]:
+        """Poll a search and yield availability changes as they happen.
+
+        Polls are spaced by a jittered ``interval``, stretched by a
+        PollScheduler while the server is failing, overloaded, slow to
+        answer or queueing at NetFunnel. Failed polls are handled by a
+        RetryPolicy: a rejected NetFunnel key is dropped, a dropped login is
+        restored with relogin(), overload, timeouts and connection errors
+        are retried, and a run of failures pauses polling for a while;
+        other errors are raised. Stop by
+        leaving the loop: watch() opens no sessions of its own, so the
+        client stays usable.
+
+        Args:
+            query: PreparedSearch, or prepare_search() arguments as a dict
+            train_numbers: Only these trains
+            seat_type: Report openings only when reservable with this seat type
+            interval: Mean seconds between polls of a healthy server
+            repeat: Report open trains again on every poll while they stay
+                open, e.g. to retry a reservation that lost the seat
+
+        Yields:
+            Transition per change; ``SRTTrain(transition.row)`` to reserve
+
+        Examples:
+            >>> query = {"dep": "수서", "arr": "부산", "date": "20240101"}
+            >>> for change in srt.watch(query, {"00305"}, SeatType.GENERAL_FIRST):
+            ...     if change.opened:
+            ...         srt.reserve(SRTTrain(change.row))
+            ...         break
+        """
+        search = self._watch_search(query, train_numbers)
+        diff = AvailabilityDiff()
+        policy = RetryPolicy(PollScheduler(interval))
+        while True:
+            started = time.monotonic()
+            try:
+                rows = self.search_rows(search)
+            except (SRTError, OSError, ValueError) as ex:
+                if self._recover(policy, ex):
+                    try:
+                        self.relogin()
+                    except (SRTTimeoutError, OSError):
+                        pass  # 다음 조회에서 다시 로그인
+                policy.wait()
+                continue
+
+            policy.success(time.monotonic() - started)
+            policy.scheduler.netfunnel(self.netfunnel_stats())
+            yield from watch_events(diff, rows, seat_type, repeat)
+            policy.wait()
+
+    def _watch_search(
+        self, query: PreparedSearch | dict, train_numbers: Collection[str] | None
+    ) -> PreparedSearch:
+        if isinstance(query, PreparedSearch):
+            if train_numbers is None:
+                return query
+            return query._replace(train_numbers=frozenset(train_numbers))
+        return self.prepare_search(**query, train_numbers=train_numbers)
+
+    def _recover(self, policy: RetryPolicy, ex: Exception) -> bool:
+        """Apply the policy to a failed watch() poll; True if it must log in again.
+
+        Re-raises ``ex`` when polling again can't fix it.
+        """
+        action = policy.decide(ex).action
+        if action is Action.RAISE:
+            raise ex
+        if action is Action.REKEY:
+            self.clear()
+        return action is Action.RELOGIN
+
+    def _parse_prepared(self, text: str | bytes, search: PreparedSearch) -> list[dict]:
+        parser = self._parse(text)
+        return list(
+            _select_rows(
+                parser["outDataSets"]["dsOutput1"],
+                time=search.time,
+                time_limit=search.time_limit,
+                train_numbers=search.train_numbers,
+                seat_type=search.seat_type,
+            )
+        )
 
     def reserve(
         self,
@@ -905,14 +1857,22 @@ class SRT:
             >>> trains = srt.search_train("수서", "부산", "210101", "000000")
             >>> srt.reserve_standby(trains[0])
         """
-        if option == SeatType.SPECIAL_FIRST:
-            option = SeatType.SPECIAL_ONLY
-        elif option == SeatType.GENERAL_FIRST:
-            option = SeatType.GENERAL_ONLY
         return self._reserve(
-            RESERVE_JOBID["STANDBY"], train, passengers, option, mblPhone=mblPhone
+            RESERVE_JOBID["STANDBY"],
+            train,
+            passengers,
+            self._standby_option(option),
+            mblPhone=mblPhone,
         )
 
+    @staticmethod
+    def _standby_option(option: SeatType) -> SeatType:
+        if option == SeatType.SPECIAL_FIRST:
+            return SeatType.SPECIAL_ONLY
+        if option == SeatType.GENERAL_FIRST:
+            return SeatType.GENERAL_ONLY
+        return option
+
     def _reserve(
         self,
         jobid: str,
@@ -940,7 +1900,49 @@ class SRT:
             TypeError: If train is not SRTTrain
             ValueError: If train is not SRT
             SRTError: If reservation not found after creation
+
+        The reservation is built from the reserve response and a single
+        ticket_info lookup; the full reservation list is scanned instead if
+        the response lacks the amount or payment deadline, or that lookup
+        comes back empty.
         """
+        data = self._reserve_data(
+            jobid, train, passengers, option, mblPhone, window_seat
+        )
+        data["netfunnelKey"] = self._netfunnel.run()
+
+        r = self._post("reserve", data=data)
+        result = self._parse_reserve(r.content)
+        is_waiting = jobid == RESERVE_JOBID["STANDBY"]
+        if not SRTReservation.has_reservation_fields(result, is_waiting):
+            return self._find_reservation(result["pnrNo"])
+
+        try:
+            tickets = self.ticket_info(result["pnrNo"])
+        except SRTResponseError:
+            tickets = None
+        if not tickets:
+            return self._find_reservation(result["pnrNo"])
+
+        return SRTReservation.from_reserve(train, result, tickets, is_waiting)
+
+    def _find_reservation(self, reservation_number: str) -> SRTReservation:
+        """Look a reservation up in the full reservation list (slow path)."""
+        for ticket in self.get_reservations():
+            if ticket.reservation_number == reservation_number:
+                return ticket
+
+        raise SRTError("Ticket not found: check reservation status")
+
+    def _reserve_data(
+        self,
+        jobid: str,
+        train: SRTTrain,
+        passengers: list[Passenger] | None,
+        option: SeatType,
+        mblPhone: str | None,
+        window_seat: bool | None,
+    ) -> dict:
         if not self.is_login:
             raise SRTNotLoggedInError()
 
@@ -984,7 +1986,6 @@ class SRT:
             "dptStnRunOrdr1": train.dep_station_run_order,
             "arvStnRunOrdr1": train.arr_station_run_order,
             "mblPhone": mblPhone,
-            "netfunnelKey": self._netfunnel.run(),
         }
 
         if jobid == RESERVE_JOBID["PERSONAL"]:
@@ -995,21 +1996,10 @@ class SRT:
                 passengers, special_seat=is_special_seat, window_seat=window_seat
             )
         )
+        return data
 
-        r = self._session.post(url=API_ENDPOINTS["reserve"], data=data)
-        self._log(r.text)
-        parser = SRTResponseData(r.text)
-
-        if not parser.success():
-            raise SRTResponseError(parser.message())
-
-        reservation_number = parser.get_all()["reservListMap"][0]["pnrNo"]
-
-        for ticket in self.get_reservations():
-            if ticket.reservation_number == reservation_number:
-                return ticket
-
-        raise SRTError("Ticket not found: check reservation status")
+    def _parse_reserve(self, text: str | bytes) -> dict:
+        return self._parse(text)["reservListMap"][0]
 
     def reserve_standby_option_settings(
         self,
@@ -1034,27 +2024,43 @@ class SRT:
             >>> res = srt.reserve_standby(trains[0])
             >>> srt.reserve_standby_option_settings(res, True, True, "010-1234-xxxx")
         """
+        data = self._standby_option_data(
+            reservation, isAgreeSMS, isAgreeClassChange, telNo
+        )
+        r = self._post("standby_option", data=data)
+        self._log(r.content)
+        return r.status_code == 200
+
+    def _standby_option_data(
+        self,
+        reservation: SRTReservation | int,
+        isAgreeSMS: bool,
+        isAgreeClassChange: bool,
+        telNo: str | None,
+    ) -> dict:
         if not self.is_login:
             raise SRTNotLoggedInError()
 
         reservation_number = getattr(reservation, "reservation_number", reservation)
 
-        data = {
+        return {
             "pnrNo": reservation_number,
             "psrmClChgFlg": "Y" if isAgreeClassChange else "N",
             "smsSndFlg": "Y" if isAgreeSMS else "N",
             "telNo": telNo if isAgreeSMS else "",
         }
 
-        r = self._session.post(url=API_ENDPOINTS["standby_option"], data=data)
-        self._log(r.text)
-        return r.status_code == 200
-
-    def get_reservations(self, paid_only: bool = False) -> list[SRTReservation]:
+    def get_reservations(
+        self, paid_only: bool = False, with_tickets: bool = False
+    ) -> list[SRTReservation]:
         """Get all reservations.
 
+        Tickets are fetched lazily on first access of
+        ``SRTReservation.tickets`` unless ``with_tickets`` is set.
+
         Args:
             paid_only: Whether to only return paid reservations
+            with_tickets: Whether to fetch all tickets now (see load_tickets)
 
         Returns:
             List of SRTReservation objects
@@ -1066,17 +2072,45 @@ class SRT:
         if not self.is_login:
             raise SRTNotLoggedInError()
 
-        r = self._session.post(url=API_ENDPOINTS["tickets"], data={"pageNo": "0"})
-        self._log(r.text)
-        parser = SRTResponseData(r.text)
+        r = self._post("tickets", data={"pageNo": "0"})
 
-        if not parser.success():
-            raise SRTResponseError(parser.message())
+        reservations = [
+            SRTReservation(train, pay, partial(self.ticket_info, train["pnrNo"]))
+            for train, pay in self._parse_reservations(r.content, paid_only)
+        ]
+        if with_tickets:
+            self.load_tickets(reservations)
+        return reservations
+
+    def load_tickets(
+        self,
+        reservations: list[SRTReservation],
+        concurrency: int = TICKET_INFO_CONCURRENCY,
+    ) -> list[SRTReservation]:
+        """Fetch tickets of reservations not yet loaded, in parallel.
 
+        Args:
+            reservations: Reservations to fill in
+            concurrency: Maximum number of ticket requests in flight
+
+        Returns:
+            The given reservations
+        """
+        pending = [r for r in reservations if not r.tickets_loaded]
+        if pending:
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                for reservation, tickets in zip(
+                    pending, pool.map(bind_context(self.ticket_info), pending)
+                ):
+                    reservation.tickets = tickets
+        return reservations
+
+    def _parse_reservations(self, text: str | bytes, paid_only: bool) -> list[tuple]:
+        parser = self._parse(text)
         return [
-            SRTReservation(train, pay, self.ticket_info(train["pnrNo"]))
+            (train, pay)
             for train, pay in zip(
-                parser.get_all()["trainListMap"], parser.get_all()["payListMap"]
+                parser["trainListMap"], parser["payListMap"]
             )
             if not paid_only or pay["stlFlg"] != "N"
         ]
@@ -1094,22 +2128,19 @@ class SRT:
             SRTNotLoggedInError: If not logged in
             SRTResponseError: If server returns error
         """
+        r = self._post("ticket_info", data=self._ticket_info_data(reservation))
+        return self._parse_tickets(r.content)
+
+    def _ticket_info_data(self, reservation: SRTReservation | int) -> dict:
         if not self.is_login:
             raise SRTNotLoggedInError()
 
         reservation_number = getattr(reservation, "reservation_number", reservation)
+        return {"pnrNo": reservation_number, "jrnySqno": "1"}
 
-        r = self._session.post(
-            url=API_ENDPOINTS["ticket_info"],
-            data={"pnrNo": reservation_number, "jrnySqno": "1"},
-        )
-        self._log(r.text)
-        parser = SRTResponseData(r.text)
-
-        if not parser.success():
-            raise SRTResponseError(parser.message())
-
-        return [SRTTicket(ticket) for ticket in parser.get_all()["trainListMap"]]
+    def _parse_tickets(self, text: str | bytes) -> list[SRTTicket]:
+        parser = self._parse(text)
+        return [SRTTicket(ticket) for ticket in parser["trainListMap"]]
 
     def cancel(self, reservation: SRTReservation | int) -> bool:
         """Cancel a reservation.
@@ -1130,21 +2161,16 @@ class SRT:
             SRTNotLoggedInError: If not logged in
             SRTResponseError: If server returns error
         """
+        r = self._post("cancel", data=self._cancel_data(reservation))
+        self._parse(r.content)
+        return True
+
+    def _cancel_data(self, reservation: SRTReservation | int) -> dict:
         if not self.is_login:
             raise SRTNotLoggedInError()
 
         reservation_number = getattr(reservation, "reservation_number", reservation)
-
-        data = {"pnrNo": reservation_number, "jrnyCnt": "1", "rsvChgTno": "0"}
-
-        r = self._session.post(url=API_ENDPOINTS["cancel"], data=data)
-        self._log(r.text)
-        parser = SRTResponseData(r.text)
-
-        if not parser.success():
-            raise SRTResponseError(parser.message())
-
-        return True
+        return {"pnrNo": reservation_number, "jrnyCnt": "1", "rsvChgTno": "0"}
 
     def pay_with_card(
         self,
@@ -1178,10 +2204,32 @@ class SRT:
             SRTNotLoggedInError: If not logged in
             SRTResponseError: If payment fails
         """
+        data = self._payment_data(
+            reservation,
+            number,
+            password,
+            validation_number,
+            expire_date,
+            installment,
+            card_type,
+        )
+        r = self._post("payment", data=data)
+        return self._parse_payment(r.content)
+
+    def _payment_data(
+        self,
+        reservation: SRTReservation,
+        number: str,
+        password: str,
+        validation_number: str,
+        expire_date: str,
+        installment: int,
+        card_type: str,
+    ) -> dict:
         if not self.is_login:
             raise SRTNotLoggedInError()
 
-        data = {
+        return {
             "stlDmnDt": datetime.now().strftime("%Y%m%d"),
             "mbCrdNo": self.membership_number,
             "stlMnsSqno1": "1",
@@ -1215,21 +2263,24 @@ class SRT:
             "pageUrl": "",
         }
 
-        r = self._session.post(url=API_ENDPOINTS["payment"], data=data)
-        self._log(r.text)
-        response = json.loads(r.text)
+    def _parse_payment(self, text: str | bytes) -> bool:
+        self._log(text)
+        response = jsonlib.loads(text)
 
         if response["outDataSets"]["dsOutput0"][0]["strResult"] == "FAIL":
             raise SRTResponseError(response["outDataSets"]["dsOutput0"][0]["msgTxt"])
 
         return True
 
-    def reserve_info(self, reservation: SRTReservation | int) -> bool:
+    def reserve_info(self, reservation: SRTReservation | int) -> dict:
         referer = API_ENDPOINTS["reserve_info_referer"] + reservation.reservation_number
         self._session.headers.update({"Referer": referer})
-        r = self._session.post(url=API_ENDPOINTS["reserve_info"])
-        self._log(r.text)
-        response = json.loads(r.text)
+        r = self._post("reserve_info")
+        return self._parse_reserve_info(r.content)
+
+    def _parse_reserve_info(self, text: str | bytes) -> dict:
+        self._log(text)
+        response = jsonlib.loads(text)
         if response.get("ErrorCode") == "0" and response.get("ErrorMsg") == "":
             return response.get("outDataSets").get("dsOutput1")[0]
         else:
@@ -1237,7 +2288,13 @@ class SRT:
 
     def refund(self, reservation: SRTReservation | int) -> bool:
         info = self.reserve_info(reservation)
-        data = {
+        r = self._post("refund", data=self._refund_data(info))
+        self._parse(r.content)
+        return True
+
+    @staticmethod
+    def _refund_data(info: dict) -> dict:
+        return {
             "pnr_no": info.get("pnrNo"),
             "cnc_dmn_cont": "승차권 환불로 취소",
             "saleDt": info.get("ogtkSaleDt"),
@@ -1247,15 +2304,361 @@ class SRT:
             "psgNm": info.get("buyPsNm"),
         }
 
-        r = self._session.post(url=API_ENDPOINTS["refund"], data=data)
-        self._log(r.text)
-        response = SRTResponseData(r.text)
+    def clear(self):
+        """Drop the NetFunnel key after the server rejected it."""
+        self._log("Clearing the netfunnel key")
+        self._netfunnel.invalidate()
+
+    def netfunnel_stats(self) -> dict:
+        """NetFunnel key hits, misses, learned TTL and acquisition latency."""
+        return self._netfunnel.stats()
 
-        if not response.success():
-            raise SRTResponseError(response.message())
+    def budget_stats(self) -> dict:
+        """Remaining request budget and throttle time of the transport's governor."""
+        return self._transport.governor.stats()
 
+
+class AsyncSRT(SRT):
+    """Asyncio SRT client.
+
+    Same API as SRT, but every network method is a coroutine and the
+    NetFunnel queue is awaited instead of blocking the thread, so a single
+    event loop can drive many watch jobs at once.
+
+    Args:
+        srt_id (str): SRT account ID (membership number, email, or phone)
+        srt_pw (str): SRT account password
+        verbose (bool): Whether to print debug logs
+        netfunnel_refresh (bool): Whether to renew the NetFunnel key in a
+            background task (started by ``async with``)
+
+    Examples:
+        >>> async with AsyncSRT("1234567890", YOUR_PASSWORD) as srt:
+        ...     trains = await srt.search_train("수서", "부산")
+    """
+
+    _netfunnel_class = AsyncNetFunnelHelper
+
+    def __init__(
+        self,
+        srt_id: str,
+        srt_pw: str,
+        verbose: bool = False,
+        netfunnel_refresh: bool = False,
+        timeouts: dict | None = None,
+        transport: Transport | None = None,
+    ) -> None:
+        super().__init__(
+            srt_id,
+            srt_pw,
+            auto_login=False,
+            verbose=verbose,
+            timeouts=timeouts,
+            transport=transport,
+        )
+        self._netfunnel_refresh = netfunnel_refresh
+
+    def _new_session(self):
+        return self._transport.async_session(host_of(SRT_MOBILE))
+
+    async def __aenter__(self) -> "AsyncSRT":
+        if self._netfunnel_refresh:
+            self._netfunnel.start_refresher()
+        if not self.is_login:
+            await self.login()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the HTTP sessions of the client and its NetFunnel helper."""
+        await self._netfunnel.close()
+        await self._transport.release(self._session)
+
+    async def _post(self, endpoint: str, **kwargs):
+        url = API_ENDPOINTS[endpoint]
+        await self._transport.governor.async_wait(host_of(url), endpoint, self.srt_id)
+        timeout = self._timeout(endpoint)
+        try:
+            return await self._session.post(url, timeout=timeout, **kwargs)
+        except TIMEOUT_ERRORS as ex:
+            raise SRTTimeoutError(endpoint, timeout) from ex
+
+    async def login(
+        self, srt_id: str | None = None, srt_pw: str | None = None
+    ) -> bool:
+        data = self._login_data(srt_id or self.srt_id, srt_pw or self.srt_pw)
+        r = await self._post("login", data=data)
+        return self._on_login(r)
+
+    async def relogin(self) -> bool:
+        await asyncio.sleep(self._relogin_throttle.delay())
+        self.is_login = False
+        return await self.login()
+
+    async def resume_session(self, state: dict) -> bool:
+        self._restore_session(state)
+        r = await self._post("tickets", data={"pageNo": "0"})
+        return self._on_resume(r.content)
+
+    async def logout(self) -> bool:
+        if not self.is_login:
+            return True
+
+        r = await self._post("logout")
+        return self._on_logout(r)
+
+    async def search_train(
+        self,
+        dep: str,
+        arr: str,
+        date: str | None = None,
+        time: str | None = None,
+        time_limit: str | None = None,
+        passengers: list[Passenger] | None = None,
+        available_only: bool = True,
+        as_table: bool = False,
+    ) -> list[SRTTrain] | TrainTable:
+        data = self._search_data(dep, arr, date, time, passengers)
+        data["netfunnelKey"] = await self._netfunnel.run()
+
+        r = await self._post("search_schedule", data=data)
+        return self._parse_trains(r.content, available_only, time_limit, as_table)
+
+    async def find_trains(
+        self,
+        dep: str,
+        arr: str,
+        date: str | None = None,
+        time: str | None = None,
+        time_limit: str | None = None,
+        train_numbers: Collection[str] | None = None,
+        seat_type: SeatType | None = None,
+        passengers: list[Passenger] | None = None,
+    ) -> dict[str, SRTTrain]:
+        return await self.search_prepared(
+            self.prepare_search(
+                dep, arr, date, time, time_limit, train_numbers, seat_type, passengers
+            )
+        )
+
+    async def search_prepared(self, search: PreparedSearch) -> dict[str, SRTTrain]:
+        return {row["trnNo"]: SRTTrain(row) for row in await self.search_rows(search)}
+
+    async def search_rows(self, search: PreparedSearch) -> list[dict]:
+        data = search.form(await self._netfunnel.run())
+        r = await self._post("search_schedule", data=data)
+        return self._parse_prepared(r.content, search)
+
+    async def watch(
+        self,
+        query: PreparedSearch | dict,
+        train_numbers: Collection[str] | None = None,
+        seat_type: SeatType | None = None,
+        interval: float = POLL_INTERVAL,
+        repeat: bool = False,
+    ) -> AsyncIterator[Transition]:
+        """Async version of SRT.watch().
+
+        Close the generator when stopping early (``contextlib.aclosing``),
+        so its pending sleep or request is cancelled right away.
+        """
+        search = self._watch_search(query, train_numbers)
+        diff = AvailabilityDiff()
+        policy = RetryPolicy(PollScheduler(interval))
+        while True:
+            started = time.monotonic()
+            try:
+                rows = await self.search_rows(search)
+            except (SRTError, OSError, ValueError) as ex:
+                if self._recover(policy, ex):
+                    try:
+                        await self.relogin()
+                    except (SRTTimeoutError, OSError):
+                        pass  # 다음 조회에서 다시 로그인
+                await policy.async_wait()
+                continue
+
+            policy.success(time.monotonic() - started)
+            policy.scheduler.netfunnel(self.netfunnel_stats())
+            for event in watch_events(diff, rows, seat_type, repeat):
+                yield event
+            await policy.async_wait()
+
+    async def reserve(
+        self,
+        train: SRTTrain,
+        passengers: list[Passenger] | None = None,
+        option: SeatType = SeatType.GENERAL_FIRST,
+        window_seat: bool | None = None,
+    ) -> SRTReservation:
+        if not train.seat_available() and train.reserve_wait_possible_code >= 0:
+            reservation = await self.reserve_standby(
+                train, passengers, option=option, mblPhone=self.phone_number
+            )
+            if self.phone_number:
+                agree_class_change = (
+                    option == SeatType.SPECIAL_FIRST or option == SeatType.GENERAL_FIRST
+                )
+                await self.reserve_standby_option_settings(
+                    reservation,
+                    isAgreeSMS=True,
+                    isAgreeClassChange=agree_class_change,
+                    telNo=self.phone_number,
+                )
+            return reservation
+
+        return await self._reserve(
+            RESERVE_JOBID["PERSONAL"],
+            train,
+            passengers,
+            option,
+            window_seat=window_seat,
+        )
+
+    async def reserve_standby(
+        self,
+        train: SRTTrain,
+        passengers: list[Passenger] | None = None,
+        option: SeatType = SeatType.GENERAL_FIRST,
+        mblPhone: str | None = None,
+    ) -> SRTReservation:
+        return await self._reserve(
+            RESERVE_JOBID["STANDBY"],
+            train,
+            passengers,
+            self._standby_option(option),
+            mblPhone=mblPhone,
+        )
+
+    async def _reserve(
+        self,
+        jobid: str,
+        train: SRTTrain,
+        passengers: list[Passenger] | None = None,
+        option: SeatType = SeatType.GENERAL_FIRST,
+        mblPhone: str | None = None,
+        window_seat: bool | None = None,
+    ) -> SRTReservation:
+        data = self._reserve_data(
+            jobid, train, passengers, option, mblPhone, window_seat
+        )
+        data["netfunnelKey"] = await self._netfunnel.run()
+
+        r = await self._post("reserve", data=data)
+        result = self._parse_reserve(r.content)
+        is_waiting = jobid == RESERVE_JOBID["STANDBY"]
+        if not SRTReservation.has_reservation_fields(result, is_waiting):
+            return await self._find_reservation(result["pnrNo"])
+
+        try:
+            tickets = await self.ticket_info(result["pnrNo"])
+        except SRTResponseError:
+            tickets = None
+        if not tickets:
+            return await self._find_reservation(result["pnrNo"])
+
+        return SRTReservation.from_reserve(train, result, tickets, is_waiting)
+
+    async def _find_reservation(self, reservation_number: str) -> SRTReservation:
+        for ticket in await self.get_reservations():
+            if ticket.reservation_number == reservation_number:
+                await self.load_tickets([ticket])
+                return ticket
+
+        raise SRTError("Ticket not found: check reservation status")
+
+    async def reserve_standby_option_settings(
+        self,
+        reservation: SRTReservation | int,
+        isAgreeSMS: bool,
+        isAgreeClassChange: bool,
+        telNo: str | None = None,
+    ) -> bool:
+        data = self._standby_option_data(
+            reservation, isAgreeSMS, isAgreeClassChange, telNo
+        )
+        r = await self._post("standby_option", data=data)
+        self._log(r.content)
+        return r.status_code == 200
+
+    async def get_reservations(
+        self, paid_only: bool = False, with_tickets: bool = False
+    ) -> list[SRTReservation]:
+        """Get all reservations.
+
+        ``tickets`` stays None until loaded with ``with_tickets`` or
+        ``load_tickets``, since a property cannot await the request.
+        """
+        if not self.is_login:
+            raise SRTNotLoggedInError()
+
+        r = await self._post("tickets", data={"pageNo": "0"})
+
+        reservations = [
+            SRTReservation(train, pay)
+            for train, pay in self._parse_reservations(r.content, paid_only)
+        ]
+        if with_tickets:
+            await self.load_tickets(reservations)
+        return reservations
+
+    async def load_tickets(
+        self,
+        reservations: list[SRTReservation],
+        concurrency: int = TICKET_INFO_CONCURRENCY,
+    ) -> list[SRTReservation]:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def load(reservation):
+            async with semaphore:
+                reservation.tickets = await self.ticket_info(reservation)
+
+        await asyncio.gather(
+            *(load(r) for r in reservations if not r.tickets_loaded)
+        )
+        return reservations
+
+    async def ticket_info(self, reservation: SRTReservation | int) -> list[SRTTicket]:
+        r = await self._post("ticket_info", data=self._ticket_info_data(reservation))
+        return self._parse_tickets(r.content)
+
+    async def cancel(self, reservation: SRTReservation | int) -> bool:
+        r = await self._post("cancel", data=self._cancel_data(reservation))
+        self._parse(r.content)
         return True
 
-    def clear(self):
-        self._log("Clearing the netfunnel key")
-        self._netfunnel.clear()
+    async def pay_with_card(
+        self,
+        reservation: SRTReservation,
+        number: str,
+        password: str,
+        validation_number: str,
+        expire_date: str,
+        installment: int = 0,
+        card_type: str = "J",
+    ) -> bool:
+        data = self._payment_data(
+            reservation,
+            number,
+            password,
+            validation_number,
+            expire_date,
+            installment,
+            card_type,
+        )
+        r = await self._post("payment", data=data)
+        return self._parse_payment(r.content)
+
+    async def reserve_info(self, reservation: SRTReservation | int) -> dict:
+        referer = API_ENDPOINTS["reserve_info_referer"] + reservation.reservation_number
+        self._session.headers.update({"Referer": referer})
+        r = await self._post("reserve_info")
+        return self._parse_reserve_info(r.content)
+
+    async def refund(self, reservation: SRTReservation | int) -> bool:
+        info = await self.reserve_info(reservation)
+        r = await self._post("refund", data=self._refund_data(info))
+        self._parse(r.content)
+        return True
@@ -5,11 +5,12 @@ except ImportError:
 
 from datetime import datetime, timedelta
 from json.decoder import JSONDecodeError
-from random import gammavariate
 from termcolor import colored
 from typing import Awaitable, Callable, List, Optional, Tuple, Union
 
 import asyncio
+import atexit
+import base64
 import click
 import inquirer
 import keyring
@@ -20,6 +21,7 @@ import re
 from .ktx import (
     Korail,
     KorailError,
+    KorailTimeoutError,
     ReserveOption,
     TrainType,
     AdultPassenger,
@@ -29,10 +31,17 @@ from .ktx import (
     Disability4To6Passenger,
 )
 
+from . import bench
+from .availability import AvailabilityDiff
+from .deadline import deadline
+from .retry import Action, ErrorKind, RetryPolicy
+from .session_cache import SessionCache, new_key
+
 from .srt import (
     SRT,
     SRTError,
-    SRTNetFunnelError,
+    SRTTimeoutError,
+    SRTTrain,
     SeatType,
     Adult,
     Child,
@@ -118,10 +127,7 @@ DEFAULT_STATIONS = {
     "KTX": ["서울", "대전", "동대구", "부산"],
 }
 
-# 예약 간격 (평균 간격 (초) = SHAPE * SCALE): gamma distribution (1.25 +/- 0.25 s)
-RESERVE_INTERVAL_SHAPE = 4
-RESERVE_INTERVAL_SCALE = 0.25
-RESERVE_INTERVAL_MIN = 0.25
+RESERVE_DEADLINE = 60  # 예매부터 결제까지 전체 제한시간 (초, 예매 중 NetFunnel 대기 포함)
 
 WAITING_BAR = ["|", "/", "-", "\\"]
 
@@ -129,9 +135,13 @@ RailType = Union[str, None]
 ChoiceType = Union[int, None]
 
 
-@click.command()
+@click.group(invoke_without_command=True)
 @click.option("--debug", is_flag=True, help="Debug mode")
-def srtgo(debug=False):
+@click.pass_context
+def srtgo(ctx, debug=False):
+    if ctx.invoked_subcommand is not None:
+        return
+
     MENU_CHOICES = [
         ("예매 시작", 1),
         ("예매 확인/결제/취소", 2),
@@ -184,6 +194,37 @@ def srtgo(debug=False):
             action(rail_type)
 
 
+@srtgo.command("bench")
+@click.option(
+    "--rows", type=int, multiple=True, help="Rows per synthetic response (repeatable)"
+)
+@click.option("--filter", "select", help="Only run cases containing this text")
+@click.option("--output", type=click.Path(dir_okay=False), help="Write results as JSON")
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Compare against saved results",
+)
+@click.option(
+    "--threshold",
+    type=float,
+    default=bench.REGRESSION_THRESHOLD,
+    show_default=True,
+    help="Slowdown ratio counted as a regression",
+)
+def bench_command(rows, select, output, baseline, threshold):
+    """Time the response parsing and payload building hot paths."""
+    results = bench.run(rows or bench.DEFAULT_ROWS, select)
+    if output:
+        bench.save(results, output)
+    if baseline:
+        regressions = bench.report(results, bench.load(baseline), threshold)
+        if regressions:
+            raise click.ClickException(f"{regressions}개 항목이 기준보다 느려졌습니다")
+    else:
+        bench.report(results)
+
+
 def set_station(rail_type: RailType) -> bool:
     stations, default_station_key = get_station(rail_type)
 
@@ -431,7 +472,7 @@ def set_login(rail_type="SRT", debug=False):
         return False
 
 
-def login(rail_type="SRT", debug=False):
+def login(rail_type="SRT", debug=False, netfunnel_refresh=False):
     if (
         keyring.get_password(rail_type, "id") is None
         or keyring.get_password(rail_type, "pass") is None
@@ -441,12 +482,56 @@ def login(rail_type="SRT", debug=False):
     user_id = keyring.get_password(rail_type, "id")
     password = keyring.get_password(rail_type, "pass")
 
-    rail = SRT if rail_type == "SRT" else Korail
-    return rail(user_id, password, verbose=debug)
+    if rail_type == "SRT":
+        rail = SRT(
+            user_id,
+            password,
+            auto_login=False,
+            verbose=debug,
+            netfunnel_refresh=netfunnel_refresh,
+        )
+    else:
+        rail = Korail(user_id, password, auto_login=False, verbose=debug)
+
+    cache = get_session_cache()
+    state = cache.load(rail_type, user_id) if cache else None
+    if not (state and rail.resume_session(state)):
+        rail.login()
+
+    if cache:
+        cache.save(rail_type, user_id, rail.export_session())
+        if not _cached_sessions:
+            atexit.register(_save_sessions, cache)
+        _cached_sessions[rail_type] = (user_id, rail)
+    return rail
+
+
+_cached_sessions = {}
+
+
+def get_session_cache() -> Optional[SessionCache]:
+    """Session cache keyed by a random secret kept in the keyring."""
+    try:
+        key = keyring.get_password("srtgo", "session_key")
+        if key is None:
+            key = base64.b64encode(new_key()).decode()
+            keyring.set_password("srtgo", "session_key", key)
+        return SessionCache(base64.b64decode(key))
+    except Exception:
+        return None
+
+
+def _save_sessions(cache: SessionCache) -> None:
+    for rail_type, (user_id, rail) in _cached_sessions.items():
+        try:
+            if getattr(rail, "is_login", getattr(rail, "logined", False)):
+                cache.save(rail_type, user_id, rail.export_session())
+        except Exception:
+            pass
 
 
 def reserve(rail_type="SRT", debug=False):
-    rail = login(rail_type, debug=debug)
+    rail = login(rail_type, debug=debug, netfunnel_refresh=True)
     is_srt = rail_type == "SRT"
 
     # Get date, time, stations, and passenger info
@@ -655,6 +740,11 @@ def reserve(rail_type="SRT", debug=False):
         return
 
     n_trains = len(choice["trains"])
+    # 검색 결과 순서가 바뀌어도 같은 열차를 찾도록 열차 번호로 고정
+    train_numbers = [
+        trains[i].train_number if is_srt else trains[i].train_no
+        for i in choice["trains"]
+    ]
 
     # Get seat type preference
     seat_type = SeatType if is_srt else ReserveOption
@@ -679,23 +769,69 @@ def reserve(rail_type="SRT", debug=False):
 
     # Reserve function
     def _reserve(train):
-        reserve = rail.reserve(train, passengers=passengers, option=options["type"])
+        tgprintf = get_telegram()
+        started = time.monotonic()
+        try:
+            with deadline(RESERVE_DEADLINE):
+                reserve = rail.reserve(
+                    train, passengers=passengers, option=options["type"]
+                )
+        except (SRTTimeoutError, KorailTimeoutError) as ex:
+            # 좌석이 이미 잡혔을 수 있으므로 다시 예매하기 전에 예약 내역 확인
+            try:
+                reserve = _held_reservation(rail, train)
+            except Exception as check_ex:
+                msg = (
+                    f"\n예매 응답 시간 초과 ({ex}), 예약 내역 확인 실패: {check_ex}"
+                    "\n예약 내역을 직접 확인하세요"
+                )
+                print(colored(msg, "red"))
+                asyncio.run(tgprintf(msg))
+                return
+            if reserve is None:
+                raise
+
         msg = f"{reserve}"
         if hasattr(reserve, "tickets") and reserve.tickets:
             msg += "\n" + "\n".join(map(str, reserve.tickets))
 
         print(colored(f"\n\n🎫 🎉 예매 성공!!! 🎉 🎫\n{msg}\n", "red", "on_green"))
 
-        if options["pay"] and not reserve.is_waiting and pay_card(rail, reserve):
+        try:
+            with deadline(RESERVE_DEADLINE - (time.monotonic() - started)):
+                paid = (
+                    options["pay"]
+                    and not reserve.is_waiting
+                    and pay_card(rail, reserve)
+                )
+        except (SRTTimeoutError, KorailTimeoutError) as ex:
+            # The reservation is held; do not let the loop reserve again
+            print(colored(f"\n결제 확인 필요: {ex}\n", "red"))
+            msg += f"\n결제 확인 필요: {ex}"
+            paid = False
+        if paid:
             print(
-                colored("\n\n💳 ✨ 결제 성공!!! ✨ 💳\n\n", "green", "on_red"), end=""
+                colored("\n\n💳 ✨ 결제 성공!!! ✨ 💳\n\n", "green", "on_red"),
+                end="",
             )
             msg += "\n결제 완료"
 
-        tgprintf = get_telegram()
         asyncio.run(tgprintf(msg))
 
-    # Reservation loop
+    if is_srt:
+        search = rail.prepare_search(
+            params["dep"],
+            params["arr"],
+            params["date"],
+            params["time"],
+            train_numbers=train_numbers,
+            passengers=params["passengers"],
+        )
+        # 직전 조회와 달라진 열차만 확인
+        diff = AvailabilityDiff()
+
+    # Reservation loop: 서버 상태에 따라 조회 간격 조절, 오류 대응은 RetryPolicy
+    policy = RetryPolicy()
     i_try = 0
     start_time = time.time()
     while True:
@@ -710,84 +846,87 @@ def reserve(rail_type="SRT", debug=False):
                 flush=True,
             )
 
-            trains = rail.search_train(**params)
-            for i in choice["trains"]:
-                if _is_seat_available(trains[i], options["type"], rail_type):
-                    _reserve(trains[i])
-                    return
-            _sleep()
-
-        except SRTError as ex:
-            msg = ex.msg
-            if "정상적인 경로로 접근 부탁드립니다" in msg or isinstance(
-                ex, SRTNetFunnelError
-            ):
+            started = time.monotonic()
+            if is_srt:
+                rows = rail.search_rows(search)
+                policy.success(time.monotonic() - started)
+                policy.scheduler.netfunnel(rail.netfunnel_stats())
+                changes = diff.update(rows)
                 if debug:
-                    print(
-                        f"\nException: {ex}\nType: {type(ex)}\nArgs: {ex.args}\nMessage: {msg}"
-                    )
-                rail.clear()
-            elif "로그인 후 사용하십시오" in msg:
-                if debug:
-                    print(
-                        f"\nException: {ex}\nType: {type(ex)}\nArgs: {ex.args}\nMessage: {msg}"
-                    )
-                rail = login(rail_type, debug=debug)
-                if not rail.is_login and not _handle_error(ex):
-                    return
-            elif not any(
-                err in msg
-                for err in (
-                    "잔여석없음",
-                    "사용자가 많아 접속이 원활하지 않습니다",
-                    "예약대기 접수가 마감되었습니다",
-                    "예약대기자한도수초과",
-                )
-            ):
-                if not _handle_error(ex):
-                    return
-            _sleep()
-
-        except KorailError as ex:
-            msg = ex.msg
-            if "Need to Login" in msg:
-                rail = login(rail_type, debug=debug)
-                if not rail.is_login and not _handle_error(ex):
-                    return
-            elif not any(
-                err in msg
-                for err in ("Sold out", "잔여석없음", "예약대기자한도수초과")
-            ):
-                if not _handle_error(ex):
-                    return
-            _sleep()
-
-        except JSONDecodeError as ex:
-            if debug:
-                print(
-                    f"\nException: {ex}\nType: {type(ex)}\nArgs: {ex.args}\nMessage: {ex.msg}"
-                )
-            _sleep()
-            rail = login(rail_type, debug=debug)
-
-        except ConnectionError as ex:
-            if not _handle_error(ex, "연결이 끊겼습니다"):
-                return
-            rail = login(rail_type, debug=debug)
+                    for change in changes:
+                        print(f"\n{change}")
+                # 열림뿐 아니라 닫힘으로 예약대기가 가능해진 경우도 있으므로
+                # 매 조회마다 원하는 열차의 현재 상태를 확인
+                for train_number in train_numbers:
+                    seats = diff.state(train_number)
+                    if seats is None or not seats.reservable(options["type"]):
+                        continue
+                    row = next(r for r in rows if r["trnNo"] == train_number)
+                    train = SRTTrain(row)
+                    if _is_seat_available(train, options["type"], rail_type):
+                        _reserve(train)
+                        return
+            else:
+                trains = rail.search_train(**params)
+                policy.success(time.monotonic() - started)
+                by_number = {train.train_no: train for train in trains}
+                for train_number in train_numbers:
+                    train = by_number.get(train_number)
+                    if train and _is_seat_available(train, options["type"], rail_type):
+                        _reserve(train)
+                        return
+            policy.wait()
 
         except Exception as ex:
-            if debug:
-                print("\nUndefined exception")
-            if not _handle_error(ex):
+            if not _recover(rail, policy, ex, debug):
                 return
-            rail = login(rail_type, debug=debug)
+            policy.wait()
 
 
-def _sleep():
-    time.sleep(
-        gammavariate(RESERVE_INTERVAL_SHAPE, RESERVE_INTERVAL_SCALE)
-        + RESERVE_INTERVAL_MIN
-    )
+def _held_reservation(rail, train):
+    """The unpaid reservation of ``train``, if a timed-out reserve went through."""
+    if isinstance(rail, SRT):
+        reservations, number = rail.get_reservations(), "train_number"
+    else:
+        reservations, number = rail.reservations(), "train_no"
+    for reservation in reservations:
+        if (
+            not getattr(reservation, "paid", False)
+            and getattr(reservation, number) == getattr(train, number)
+            and reservation.dep_date == train.dep_date
+        ):
+            return reservation
+    return None
+
+
+def _recover(rail, policy, ex, debug=False):
+    """React to a failed poll as the RetryPolicy decides; False stops the loop."""
+    decision = policy.decide(ex)
+    if debug:
+        print(f"\n{decision.kind.value}: {ex!r}")
+    if policy.tripped:
+        print(f"\n오류가 계속되어 {policy.breaker.cooldown:.0f}초 동안 조회를 멈춥니다")
+
+    if decision.action is Action.REKEY:
+        rail.clear()
+    elif decision.action is Action.RELOGIN:
+        if not _relogin(rail) and decision.kind is ErrorKind.LOGIN:
+            return _handle_error(ex)
+    elif decision.action is Action.RAISE:
+        if not _handle_error(ex):
+            return False
+        if not isinstance(ex, (SRTError, KorailError)):
+            _relogin(rail)
+    return True
+
+
+def _relogin(rail):
+    """Re-authenticate in place; failures are reported and retried by the loop."""
+    try:
+        return rail.relogin()
+    except (SRTError, KorailError, JSONDecodeError, ConnectionError) as ex:
+        print(f"\n재로그인 실패: {ex}")
+        return False
 
 
 def _handle_error(ex, msg=None):
@@ -858,6 +997,8 @@ def check_reservation(rail_type="SRT", debug=False):
         if choice == -2:
             out = []
             if all_reservations:
+                if rail_type == "SRT":
+                    rail.load_tickets(all_reservations)
                 out.append("[ 예매 내역 ]")
                 for reservation in all_reservations:
                     out.append(f"🚅{reservation}")
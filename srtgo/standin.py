@@ -0,0 +1,567 @@
+"""Local stand-in for the SRT, Korail and NetFunnel servers.
+
+``StandIn`` runs a threaded HTTP server on localhost (or answers in memory
+through ``transport()``) that reproduces what the clients see from the real
+services:
+
+- NetFunnel queueing: 201 with a shrinking ``nwait``, then 200, and 502 when a
+  key is completed twice
+- seat availability that opens after a number of searches and closes again
+  once the seat is reserved
+- scripted error messages, e.g. "로그인 후 사용하십시오" or "잔여석없음"
+- a fixed latency per request
+- responses recorded with srtgo.recorder, replayed before the built-in ones
+
+``patch()`` points srtgo.srt, srtgo.ktx and korail_bypass at the server, so
+every performance claim about the clients and the reserve loop can be
+measured on a laptop.
+
+    with StandIn(latency=0.05, queue=(3, 1), opens={2: 5}) as standin:
+        with standin.patch():
+            srt = SRT("id", "pw")
+            ...
+"""
+
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlparse
+
+from . import ktx, srt
+from .recorder import Replay
+from .transport import FakeResponse, FakeTransport
+
+KORAIL_PREFIX = "com.korail.mobile"
+
+SRT_PATHS = {urlparse(url).path: name for name, url in srt.API_ENDPOINTS.items()}
+KORAIL_PATHS = {
+    url.rsplit(KORAIL_PREFIX, 1)[1]: name for name, url in ktx.API_ENDPOINTS.items()
+}
+
+# 한국어 오류 메시지 예시 (errors= 에 그대로 넣어 재현)
+NOT_LOGGED_IN = "로그인 후 사용하십시오."
+SOLD_OUT = "잔여석없음"
+BUSY = "사용자가 많아 접속이 원활하지 않습니다."
+
+KORAIL_TICKET_PAGE = 10  # Korail 승차권 목록 페이지 크기
+
+
+# SRT rows
+def train_row(i: int, date: str = "20301231", available: bool = False) -> dict:
+    dep = 6 * 60 + 10 * i
+    arr = dep + 150
+    return {
+        "stlbTrnClsfCd": "17",
+        "trnNo": f"{300 + i:05d}",
+        "dptDt": date,
+        "dptTm": f"{dep // 60 % 24:02d}{dep % 60:02d}00",
+        "dptRsStnCd": "0551",
+        "dptStnRunOrdr": "000001",
+        "dptStnConsOrdr": "000001",
+        "arvDt": date,
+        "arvTm": f"{arr // 60 % 24:02d}{arr % 60:02d}00",
+        "arvRsStnCd": "0020",
+        "arvStnRunOrdr": "000010",
+        "arvStnConsOrdr": "000010",
+        "gnrmRsvPsbStr": "예약가능" if available else "매진",
+        "sprmRsvPsbStr": "매진",
+        "rsvWaitPsbCdNm": "매진",
+        "rsvWaitPsbCd": "-1",
+    }
+
+
+def reservation_rows(pnr_no: str, train: dict, seats: int = 1) -> tuple[dict, dict]:
+    """(trainListMap, payListMap) entries of an unpaid reservation on ``train``."""
+    summary = {"pnrNo": pnr_no, "rcvdAmt": str(52900 * seats), "tkSpecNum": seats}
+    pay = {
+        **{k: train[k] for k in ("stlbTrnClsfCd", "trnNo", "dptDt", "dptTm")},
+        **{k: train[k] for k in ("dptRsStnCd", "arvTm", "arvRsStnCd")},
+        "iseLmtDt": train["dptDt"],
+        "iseLmtTm": "235900",
+        "stlFlg": "N",
+    }
+    return summary, pay
+
+
+def ticket_row(seat: int) -> dict:
+    return {
+        "scarNo": "5",
+        "seatNo": f"{seat}A",
+        "psrmClCd": "1",
+        "dcntKndCd": "000",
+        "rcvdAmt": "52900",
+        "stdrPrc": "52900",
+        "dcntPrc": "0",
+    }
+
+
+# Korail rows
+def korail_train_row(i: int, date: str = "20301231", available: bool = False) -> dict:
+    dep = 6 * 60 + 10 * i
+    arr = dep + 160
+    return {
+        "h_trn_clsf_cd": "100",
+        "h_trn_clsf_nm": "KTX",
+        "h_trn_gp_cd": "100",
+        "h_trn_no": f"{100 + i:03d}",
+        "h_dpt_rs_stn_nm": "서울",
+        "h_dpt_rs_stn_cd": "0001",
+        "h_dpt_dt": date,
+        "h_dpt_tm": f"{dep // 60 % 24:02d}{dep % 60:02d}00",
+        "h_arv_rs_stn_nm": "부산",
+        "h_arv_rs_stn_cd": "0020",
+        "h_arv_dt": date,
+        "h_arv_tm": f"{arr // 60 % 24:02d}{arr % 60:02d}00",
+        "h_run_dt": date,
+        "h_rsv_psb_flg": "Y",
+        "h_rsv_psb_nm": "예약하기" if available else "좌석매진",
+        "h_spe_rsv_cd": "13",
+        "h_gen_rsv_cd": "11" if available else "13",
+        "h_wait_rsv_flg": "-1",
+    }
+
+
+def korail_reservation_row(pnr_no: str, train: dict, seats: int = 1) -> dict:
+    return {
+        **train,
+        "h_pnr_no": pnr_no,
+        "h_tot_seat_cnt": str(seats),
+        "h_ntisu_lmt_dt": train["h_dpt_dt"],
+        "h_ntisu_lmt_tm": "235900",
+        "h_rsv_amt": str(59800 * seats),
+    }
+
+
+def korail_ticket_row(i: int, train: dict) -> dict:
+    return {
+        "ticket_list": [
+            {
+                "train_info": [
+                    {
+                        **train,
+                        "h_pnr_no": f"{i + 1:014d}",
+                        "h_seat_cnt": "1",
+                        "h_seat_no": f"{i % 20 + 1}A",
+                        "h_seat_no_end": "",
+                        "h_srcar_no": f"{i // 20 % 8 + 1}",
+                        "h_buy_ps_nm": "STANDIN",
+                        "h_orgtk_sale_dt": train["h_dpt_dt"],
+                        "h_orgtk_wct_no": "12345",
+                        "h_orgtk_ret_sale_dt": train["h_dpt_dt"],
+                        "h_orgtk_sale_sqno": f"{i + 1:05d}",
+                        "h_orgtk_ret_pwd": "0000",
+                        "h_rcvd_amt": "59800",
+                    }
+                ]
+            }
+        ]
+    }
+
+
+def korail_seat_row(seat: int) -> dict:
+    return {
+        "h_srcar_no": "8",
+        "h_seat_no": f"{seat}A",
+        "h_psrm_cl_nm": "일반실",
+        "h_psg_tp_dv_nm": "어른",
+        "h_rcvd_amt": "59800",
+        "h_seat_prc": "59800",
+        "h_dcnt_amt": "0",
+    }
+
+
+def _success(**body) -> dict:
+    return {"resultMap": [{"strResult": "SUCC", "msgTxt": ""}], **body}
+
+
+def _korail_success(**body) -> dict:
+    return {"strResult": "SUCC", "h_msg_cd": "", "h_msg_txt": "", **body}
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # many clients connect at once; the default 5 drops SYNs
+
+
+class StandIn:
+    """Local server answering the SRT, Korail and NetFunnel endpoints.
+
+    Args:
+        latency: Seconds every response is delayed by
+        rows: Trains returned by each search
+        reservations: Unpaid reservations that already exist (SRT and Korail)
+        tickets: Paid Korail tickets, listed ``KORAIL_TICKET_PAGE`` per page
+        queue: ``nwait`` values NetFunnel reports before letting a client in
+        opens: Train index -> search number from which the train has seats
+        errors: Endpoint name (a key of API_ENDPOINTS, or "netfunnel") ->
+            error messages returned by its next requests. Korail errors may
+            be ``(code, message)`` tuples.
+        replay: Recorded exchanges (srtgo.recorder.Replay or a fixtures
+            path) served before the built-in responses
+
+    Attributes:
+        hits: Requests per path
+        searches: Search requests per service ("srt", "korail")
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        rows: int = 20,
+        reservations: int = 0,
+        tickets: int = 0,
+        queue: tuple[int, ...] = (),
+        opens: dict[int, int] | None = None,
+        errors: dict[str, list] | None = None,
+        replay: Replay | str | None = None,
+    ) -> None:
+        self.latency = latency
+        self.rows = [train_row(i) for i in range(rows)]
+        self.korail_rows = [korail_train_row(i) for i in range(rows)]
+        self.reservations = [
+            reservation_rows(f"{i + 1:014d}", self.rows[i % rows])
+            for i in range(reservations)
+        ]
+        self.korail_reservations = [
+            korail_reservation_row(f"{i + 1:014d}", self.korail_rows[i % rows])
+            for i in range(reservations)
+        ]
+        self.korail_tickets = [
+            korail_ticket_row(i, self.korail_rows[i % rows]) for i in range(tickets)
+        ]
+        self.queue = tuple(queue)
+        self.opens = dict(opens or {})
+        self.errors = {name: list(msgs) for name, msgs in (errors or {}).items()}
+        self.replay = Replay(replay) if isinstance(replay, str) else replay
+        self.taken = {"srt": set(), "korail": set()}
+
+        self.hits = Counter()
+        self.searches = Counter()
+        self._funnel = {}  # key -> remaining nwait values, or None once completed
+        self._lock = threading.Lock()
+        self._server = _Server(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def host(self) -> str:
+        return "%s:%d" % self._server.server_address
+
+    def __enter__(self) -> "StandIn":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    @contextmanager
+    def patch(self, wait_interval: float = 0.05):
+        """Redirect the SRT, Korail and NetFunnel clients to this server.
+
+        Args:
+            wait_interval: NetFunnel re-check interval while queued, instead
+                of the real 1 second
+        """
+        base = f"http://{self.host}"
+        saved = [
+            (srt.API_ENDPOINTS, dict(srt.API_ENDPOINTS)),
+            (ktx.API_ENDPOINTS, dict(ktx.API_ENDPOINTS)),
+        ]
+        attrs = [
+            (srt.NetFunnelHelper, "NETFUNNEL_URL", "http://{host}/ts.wseq"),
+            (srt.NetFunnelHelper, "NETFUNNEL_HOST", self.host),
+            (srt.NetFunnelHelper, "WAIT_INTERVAL", wait_interval),
+            (ktx.NetFunnelHelper, "NETFUNNEL_URL", f"{base}/ts.wseq"),
+            (ktx.NetFunnelHelper, "WAIT_INTERVAL", wait_interval),
+        ]
+        bypass = sys.modules.get("korail_bypass")
+        if bypass is not None:
+            saved.append(
+                (bypass._PATCHED_ENDPOINTS, dict(bypass._PATCHED_ENDPOINTS))
+            )
+            attrs.append((bypass, "PBLK_URL", f"{base}/ebizweb/pwd_action/pblk"))
+            bypass._PATCHED_ENDPOINTS.update(
+                {
+                    k: f"{base}/ebizweb/classes/{KORAIL_PREFIX}{v.rsplit(KORAIL_PREFIX, 1)[1]}"
+                    for k, v in bypass._PATCHED_ENDPOINTS.items()
+                }
+            )
+
+        srt.API_ENDPOINTS.update(
+            {k: v.replace(srt.SRT_MOBILE, base) for k, v in srt.API_ENDPOINTS.items()}
+        )
+        ktx.API_ENDPOINTS.update(
+            {
+                k: f"{base}/classes/{KORAIL_PREFIX}{v.rsplit(KORAIL_PREFIX, 1)[1]}"
+                for k, v in ktx.API_ENDPOINTS.items()
+            }
+        )
+        originals = [(obj, name, getattr(obj, name)) for obj, name, _ in attrs]
+        for obj, name, value in attrs:
+            setattr(obj, name, value)
+        try:
+            yield self
+        finally:
+            for endpoints, values in saved:
+                endpoints.update(values)
+            for obj, name, value in originals:
+                setattr(obj, name, value)
+
+    def transport(self) -> FakeTransport:
+        """In-memory transport answering like the server, without sockets."""
+
+        def handle(request):
+            self.hits[request.path] += 1
+            if self.latency:
+                time.sleep(self.latency)
+            status, _, body = self.respond(
+                request.path, {**request.params, **request.data}
+            )
+            return FakeResponse(body, status, request.url)
+
+        return FakeTransport(handle)
+
+    # Routing
+    def respond(self, path: str, form: dict | None = None) -> tuple[int, str, str]:
+        """Return (status, content type, body) for a request."""
+        form = form or {}
+        with self._lock:
+            if self.replay is not None:
+                exchange = self.replay.next(path)
+                if exchange is not None:
+                    return exchange["status"], "application/json", exchange["body"]
+
+            if path.endswith("/ts.wseq"):
+                return 200, "text/javascript", self._netfunnel(form)
+            if path.endswith("pwd_action/pblk"):
+                service, name = "korail", "pblk"
+            elif KORAIL_PREFIX in path:
+                service = "korail"
+                name = KORAIL_PATHS.get(path.rsplit(KORAIL_PREFIX, 1)[1])
+            else:
+                service, name = "srt", SRT_PATHS.get(path)
+
+            if self.errors.get(name):
+                body = self._error(service, self.errors[name].pop(0))
+            elif service == "srt":
+                body = self._srt(name, form)
+            else:
+                body = self._korail(name, form)
+            return 200, "application/json", json.dumps(body, ensure_ascii=False)
+
+    @staticmethod
+    def _error(service: str, error) -> dict:
+        if service == "srt":
+            return {"resultMap": [{"strResult": "FAIL", "msgTxt": error}]}
+        code, message = error if isinstance(error, tuple) else ("", error)
+        return {"strResult": "FAIL", "h_msg_cd": code, "h_msg_txt": message}
+
+    def _available(self, service: str, i: int) -> bool:
+        opens_at = self.opens.get(i)
+        return (
+            opens_at is not None
+            and self.searches[service] >= opens_at
+            and i not in self.taken[service]
+        )
+
+    # NetFunnel
+    def _netfunnel(self, form: dict) -> str:
+        opcode, key = form.get("opcode"), form.get("key")
+        if self.errors.get("netfunnel"):
+            return self.errors["netfunnel"].pop(0)
+
+        if opcode == "5101":  # getTidchkEnter
+            key = f"STANDIN{len(self._funnel) + 1}"
+            self._funnel[key] = list(self.queue)
+        waits = self._funnel.get(key)
+        if opcode == "5004":  # setComplete
+            status = "502" if waits is None else "200"
+            self._funnel[key] = None
+            nwait = 0
+        elif waits:
+            status, nwait = "201", waits.pop(0)
+        else:
+            status, nwait = "200", 0
+
+        result = f"key={key}&nwait={nwait}&ip="
+        if "js" not in form:  # Korail helper: plain "status:params"
+            return f"{status}:{result}"
+        return (
+            f"NetFunnel.gControl.result='{opcode}:{status}:{result}'; "
+            "NetFunnel.gControl._showResult();"
+        )
+
+    # SRT
+    def _srt(self, name: str | None, form: dict) -> dict:
+        if name == "login":
+            return {
+                "userMap": {
+                    "MB_CRD_NO": "1234567890",
+                    "CUST_NM": "STANDIN",
+                    "MBL_PHONE": "010-0000-0000",
+                }
+            }
+        if name == "search_schedule":
+            self.searches["srt"] += 1
+            rows = [
+                train_row(i, available=self._available("srt", i))
+                for i in range(len(self.rows))
+            ]
+            return _success(outDataSets={"dsOutput1": rows})
+        if name == "tickets":
+            return _success(
+                trainListMap=[summary for summary, _ in self.reservations],
+                payListMap=[pay for _, pay in self.reservations],
+            )
+        if name == "ticket_info":
+            return _success(trainListMap=[ticket_row(1)])
+        if name == "reserve":
+            i = next(
+                (i for i, r in enumerate(self.rows) if r["trnNo"] == form.get("trnNo1")),
+                0,
+            )
+            if i in self.taken["srt"]:
+                return self._error("srt", SOLD_OUT)
+            if i in self.opens:
+                self.taken["srt"].add(i)
+            summary, pay = reservation_rows(
+                f"{len(self.reservations) + 1:014d}", self.rows[i]
+            )
+            self.reservations.append((summary, pay))
+            return _success(
+                reservListMap=[
+                    {
+                        "pnrNo": summary["pnrNo"],
+                        "rcvdAmt": summary["rcvdAmt"],
+                        "tkSpecNum": summary["tkSpecNum"],
+                        "iseLmtDt": pay["iseLmtDt"],
+                        "iseLmtTm": pay["iseLmtTm"],
+                    }
+                ]
+            )
+        return _success()
+
+    # Korail
+    def _korail(self, name: str | None, form: dict) -> dict:
+        if name == "code":
+            return _korail_success(
+                **{"app.login.cphd": {"idx": "1", "key": "0123456789abcdef" * 2}}
+            )
+        if name == "pblk":
+            return _korail_success(
+                publicKeyModulus=_RSA_MODULUS, publicKeyExponent="10001", keyname="1"
+            )
+        if name == "login":
+            return _korail_success(
+                strMbCrdNo="1234567890",
+                strCustNm="STANDIN",
+                strEmailAdr="standin@example.com",
+                strCpNo="010-0000-0000",
+            )
+        if name == "search_schedule":
+            self.searches["korail"] += 1
+            rows = [
+                korail_train_row(i, available=self._available("korail", i))
+                for i in range(len(self.korail_rows))
+            ]
+            return _korail_success(trn_infos={"trn_info": rows})
+        if name == "reserve":
+            i = next(
+                (
+                    i
+                    for i, r in enumerate(self.korail_rows)
+                    if r["h_trn_no"] == form.get("txtTrnNo1")
+                ),
+                0,
+            )
+            if i in self.taken["korail"]:
+                return self._error("korail", ("ERR211161", SOLD_OUT))
+            if i in self.opens:
+                self.taken["korail"].add(i)
+            pnr_no = f"{len(self.korail_reservations) + 1:014d}"
+            self.korail_reservations.append(
+                korail_reservation_row(pnr_no, self.korail_rows[i])
+            )
+            return _korail_success(h_pnr_no=pnr_no)
+        if name == "myreservationview":
+            if not self.korail_reservations:
+                return self._error("korail", ("P100", "No Results"))
+            return _korail_success(
+                jrny_infos={
+                    "jrny_info": [
+                        {"train_infos": {"train_info": [row]}}
+                        for row in self.korail_reservations
+                    ]
+                }
+            )
+        if name == "myreservationlist":
+            return _korail_success(
+                h_wct_no="12345",
+                jrny_infos={"jrny_info": [{"seat_infos": {"seat_info": [korail_seat_row(1)]}}]},
+            )
+        if name == "myticketlist":
+            page = int(form.get("h_page_no", 1))
+            start = (page - 1) * KORAIL_TICKET_PAGE
+            rows = self.korail_tickets[start : start + KORAIL_TICKET_PAGE]
+            if not rows:
+                return self._error("korail", ("P100", "No Results"))
+            more = start + KORAIL_TICKET_PAGE < len(self.korail_tickets)
+            return _korail_success(
+                reservation_list=rows, h_next_pg_flg="Y" if more else "N"
+            )
+        if name == "myticketseat":
+            sqno = form.get("h_orgtk_sale_sqno", "1")
+            return _korail_success(
+                ticket_infos={
+                    "ticket_info": [{"tk_seat_info": [korail_seat_row(int(sqno))]}]
+                }
+            )
+        return _korail_success()
+
+    def _handler(self):
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def _reply(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                url = urlparse(self.path)
+                form = dict(parse_qsl(url.query, keep_blank_values=True))
+                form.update(
+                    parse_qsl(self.rfile.read(length).decode(), keep_blank_values=True)
+                )
+                standin.hits[url.path] += 1
+                if standin.latency:
+                    time.sleep(standin.latency)
+                status, content_type, body = standin.respond(url.path, form)
+                payload = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                try:
+                    self.wfile.write(payload)
+                except (BrokenPipeError, ConnectionResetError):
+                    self.close_connection = True  # client gave up (timeout)
+
+            do_GET = do_POST = _reply
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+# 1024-bit RSA modulus for the stand-in pblk endpoint (public key only)
+_RSA_MODULUS = (
+    "c3a5b1f0e6d2a4b8c9e1f3a5b7d9e1f3a5c7e9f1b3d5f7a9c1e3f5a7b9d1f3a5"
+    "c7e9f1b3d5f7a9c1e3f5a7b9d1f3a5c7e9f1b3d5f7a9c1e3f5a7b9d1f3a5c7e9"
+    "f1b3d5f7a9c1e3f5a7b9d1f3a5c7e9f1b3d5f7a9c1e3f5a7b9d1f3a5c7e9f1b3"
+    "d5f7a9c1e3f5a7b9d1f3a5c7e9f1b3d5f7a9c1e3f5a7b9d1f3a5c7e9f1b3d5f7"
+)
@@ -0,0 +1,59 @@
+"""Throttling of the login recovery path.
+
+When the network flaps, every failed request in the reserve loop asks for a
+new login. ``ReloginThrottle`` spaces those logins out with an exponentially
+growing interval so a burst of errors cannot turn into a login storm, and
+forgets the streak once logins become rare again.
+"""
+
+import threading
+import time
+
+RELOGIN_BASE = 1.0  # 연속 재로그인 최소 간격 (초)
+RELOGIN_CAP = 60.0  # 재로그인 간격 상한 (초)
+RELOGIN_RESET = 300.0  # 이 시간 동안 재로그인이 없으면 간격 초기화 (초)
+
+
+class ReloginThrottle:
+    """Exponential spacing between consecutive re-logins.
+
+    The first re-login after a quiet period runs immediately; each following
+    one within ``reset`` seconds waits twice as long as the previous gap,
+    starting at ``base`` and capped at ``cap``.
+
+    Args:
+        base: First enforced gap in seconds
+        cap: Largest gap in seconds
+        reset: Quiet time after which the streak is forgotten
+    """
+
+    def __init__(
+        self,
+        base: float = RELOGIN_BASE,
+        cap: float = RELOGIN_CAP,
+        reset: float = RELOGIN_RESET,
+    ) -> None:
+        self.base = base
+        self.cap = cap
+        self.reset = reset
+        self._lock = threading.Lock()
+        self._last = None
+        self._streak = 0
+
+    def delay(self, now: float | None = None) -> float:
+        """Reserve the next login slot and return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic() if now is None else now
+            if self._last is None or now - self._last >= self.reset:
+                self._streak = 0
+                self._last = now
+                return 0.0
+
+            gap = min(self.cap, self.base * 2**self._streak)
+            self._streak += 1
+            start = max(now, self._last + gap)
+            self._last = start
+            return start - now
+
+    def wait(self) -> None:
+        time.sleep(self.delay())
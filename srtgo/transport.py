@@ -0,0 +1,290 @@
+"""HTTP transports for the SRT and Korail clients.
+
+A transport creates the sessions the clients send their requests through.
+``Transport`` wraps curl_cffi (or requests when curl_cffi is not installed)
+and controls pool size, HTTP version and DNS caching; with ``shared=True``
+clients talking to the same host reuse one pooled session and therefore its
+open connections. Every request first waits for the transport's
+RequestGovernor, which by default is shared by the whole process.
+``FakeTransport`` answers requests in memory for tests and
+offline benchmarks.
+"""
+
+try:
+    import curl_cffi
+    from curl_cffi import CurlHttpVersion, CurlOpt
+    HAS_CURL_CFFI = True
+except ImportError:
+    import requests
+    from requests.adapters import HTTPAdapter
+    HAS_CURL_CFFI = False
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+
+from .governor import RequestGovernor, default_governor
+
+MAX_CONNECTIONS = 10  # 세션당 연결 풀 크기
+DNS_CACHE_TIMEOUT = 300  # DNS 조회 결과 재사용 시간 (초)
+
+
+class Transport:
+    """Creates the HTTP sessions used by the clients.
+
+    Args:
+        impersonate: curl_cffi browser fingerprint overriding the clients' own
+        http2: Use HTTP/2 when the server offers it; False forces HTTP/1.1
+        shared: Hand out one session per host and fingerprint instead of a
+            new one per client. Shared sessions also share cookies, so only
+            share between clients of the same account.
+        max_connections: Connection pool size of each session
+        dns_cache_timeout: Seconds a resolved address is reused (curl_cffi only)
+        governor: Request budgets to wait for (default: the process-wide
+            default_governor())
+
+    Examples:
+        >>> transport = Transport(shared=True)
+        >>> srt = SRT(srt_id, srt_pw, transport=transport)
+        >>> watcher = SRT(srt_id, srt_pw, transport=transport)  # same connections
+    """
+
+    def __init__(
+        self,
+        impersonate: str | None = None,
+        http2: bool = True,
+        shared: bool = False,
+        max_connections: int = MAX_CONNECTIONS,
+        dns_cache_timeout: int = DNS_CACHE_TIMEOUT,
+        governor: RequestGovernor | None = None,
+    ) -> None:
+        self.impersonate = impersonate
+        self.http2 = http2
+        self.shared = shared
+        self.max_connections = max_connections
+        self.dns_cache_timeout = dns_cache_timeout
+        self.governor = governor or default_governor()
+        self._sessions = {}
+        self._async_sessions = {}
+
+    def session(self, host: str, impersonate: str = "chrome"):
+        """Blocking session for requests to ``host``."""
+        return self._get(self._sessions, self._create, host, impersonate)
+
+    def async_session(self, host: str, impersonate: str = "chrome"):
+        """Awaitable session for requests to ``host``."""
+        return self._get(self._async_sessions, self._create_async, host, impersonate)
+
+    def _get(self, sessions: dict, create, host: str, impersonate: str):
+        impersonate = self.impersonate or impersonate
+        if not self.shared:
+            return create(impersonate)
+        key = (host, impersonate)
+        if key not in sessions:
+            sessions[key] = create(impersonate)
+        return sessions[key]
+
+    def _curl_kwargs(self, impersonate: str) -> dict:
+        return {
+            "impersonate": impersonate,
+            "http_version": None if self.http2 else CurlHttpVersion.V1_1,
+            "curl_options": {
+                CurlOpt.MAXCONNECTS: self.max_connections,
+                CurlOpt.DNS_CACHE_TIMEOUT: self.dns_cache_timeout,
+            },
+        }
+
+    def _requests_session(self):
+        session = requests.session()
+        adapter = HTTPAdapter(pool_maxsize=self.max_connections)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _create(self, impersonate: str):
+        if HAS_CURL_CFFI:
+            return curl_cffi.Session(**self._curl_kwargs(impersonate))
+        return self._requests_session()
+
+    def _create_async(self, impersonate: str):
+        if HAS_CURL_CFFI:
+            return curl_cffi.AsyncSession(
+                max_clients=self.max_connections, **self._curl_kwargs(impersonate)
+            )
+        return _ThreadedSession(self._requests_session())
+
+    def is_shared(self, session) -> bool:
+        return any(
+            session is s
+            for s in (*self._sessions.values(), *self._async_sessions.values())
+        )
+
+    async def release(self, session) -> None:
+        """Close an async session a client is done with, unless it is shared."""
+        if not self.is_shared(session):
+            await session.close()
+
+    def close(self) -> None:
+        """Close the shared blocking sessions."""
+        for session in self._sessions.values():
+            session.close()
+        self._sessions.clear()
+
+    async def aclose(self) -> None:
+        """Close the shared async sessions."""
+        for session in self._async_sessions.values():
+            await session.close()
+        self._async_sessions.clear()
+
+
+def host_of(url: str) -> str:
+    return urlparse(url).netloc
+
+
+class _ThreadedSession:
+    """Awaitable wrapper running a blocking requests session in worker threads.
+
+    Used by the async clients when curl_cffi is not installed.
+    """
+
+    def __init__(self, session) -> None:
+        self._session = session
+        self.headers = session.headers
+        self.cookies = session.cookies
+
+    async def get(self, url, **kwargs):
+        return await asyncio.to_thread(self._session.get, url, **kwargs)
+
+    async def post(self, url, **kwargs):
+        return await asyncio.to_thread(self._session.post, url, **kwargs)
+
+    async def close(self) -> None:
+        self._session.close()
+
+
+# Fake transport
+@dataclass
+class FakeRequest:
+    method: str
+    url: str
+    params: dict = field(default_factory=dict)
+    data: dict = field(default_factory=dict)
+    headers: dict = field(default_factory=dict)
+
+    @property
+    def path(self) -> str:
+        return urlparse(self.url).path
+
+
+class FakeResponse:
+    def __init__(self, text: str = "", status_code: int = 200, url: str = "") -> None:
+        self.text = text
+        self.status_code = status_code
+        self.url = url
+        self.headers = {}
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def content(self) -> bytes:
+        return self.text.encode("utf-8")
+
+    def json(self):
+        return json.loads(self.text)
+
+
+@dataclass
+class _FakeCookie:
+    name: str
+    value: str
+    domain: str = ""
+    path: str = "/"
+    secure: bool = False
+    expires: int | None = None
+
+
+class _FakeCookies:
+    def __init__(self) -> None:
+        self.jar = []
+
+    def set(self, name, value, domain="", path="/", secure=False, **kwargs) -> None:
+        self.jar = [c for c in self.jar if (c.name, c.domain) != (name, domain)]
+        self.jar.append(_FakeCookie(name, value, domain, path, secure))
+
+    def get(self, name, default=None):
+        return next((c.value for c in self.jar if c.name == name), default)
+
+    def clear(self) -> None:
+        self.jar = []
+
+
+class FakeSession:
+    """In-memory session answering every request with the transport's handler."""
+
+    def __init__(self, transport: "FakeTransport") -> None:
+        self._transport = transport
+        self.headers = {}
+        self.cookies = _FakeCookies()
+
+    def get(self, url, params=None, **kwargs):
+        return self._send("GET", url, params=params, **kwargs)
+
+    def post(self, url, data=None, **kwargs):
+        return self._send("POST", url, data=data, **kwargs)
+
+    def _send(self, method, url, params=None, data=None, headers=None, **kwargs):
+        request = FakeRequest(
+            method, url, dict(params or {}), dict(data or {}),
+            {**self.headers, **(headers or {})},
+        )
+        return self._transport.handle(request)
+
+    def close(self) -> None:
+        pass
+
+
+class FakeAsyncSession(FakeSession):
+    async def get(self, url, params=None, **kwargs):
+        return self._send("GET", url, params=params, **kwargs)
+
+    async def post(self, url, data=None, **kwargs):
+        return self._send("POST", url, data=data, **kwargs)
+
+    async def close(self) -> None:
+        pass
+
+
+class FakeTransport(Transport):
+    """Transport answering requests in memory, for tests and offline benchmarks.
+
+    Args:
+        handler: Called with a FakeRequest; returns a FakeResponse, a
+            ``(status, text)`` tuple, or the response text. It may raise to
+            simulate network errors and timeouts.
+
+    Attributes:
+        requests: Every request sent, in order
+    """
+
+    def __init__(self, handler) -> None:
+        super().__init__(shared=True, governor=RequestGovernor(hosts={}))
+        self.handler = handler
+        self.requests = []
+
+    def _create(self, impersonate: str):
+        return FakeSession(self)
+
+    def _create_async(self, impersonate: str):
+        return FakeAsyncSession(self)
+
+    def handle(self, request: FakeRequest) -> FakeResponse:
+        self.requests.append(request)
+        response = self.handler(request)
+        if isinstance(response, FakeResponse):
+            return response
+        if isinstance(response, tuple):
+            return FakeResponse(response[1], response[0], request.url)
+        return FakeResponse(response, 200, request.url)
@@ -0,0 +1,116 @@
+from srtgo.availability import (
+    SOLD_OUT,
+    AvailabilityDiff,
+    Change,
+    Seats,
+    korail_seats,
+    watch_events,
+)
+from srtgo.srt import SeatType
+
+
+def row(number="00301", general=False, special=False, standby=False):
+    return {
+        "trnNo": number,
+        "gnrmRsvPsbStr": "예약가능" if general else "매진",
+        "sprmRsvPsbStr": "예약가능" if special else "매진",
+        "rsvWaitPsbCd": "9" if standby else "-1",
+    }
+
+
+def changes(transitions):
+    return [(t.train_number, t.change) for t in transitions]
+
+
+def test_first_update_reports_open_seats():
+    diff = AvailabilityDiff()
+    assert changes(diff.update([row(general=True), row("00303")])) == [
+        ("00301", Change.GENERAL_OPENED)
+    ]
+    assert diff.state("00303") == SOLD_OUT
+
+
+def test_unchanged_rows_report_nothing():
+    diff = AvailabilityDiff()
+    diff.update([row(general=True)])
+    assert diff.update([row(general=True)]) == []
+
+
+def test_closing_and_gone():
+    diff = AvailabilityDiff()
+    diff.update([row(general=True), row("00303", special=True)])
+    assert changes(diff.update([row()])) == [
+        ("00301", Change.GENERAL_CLOSED),
+        ("00303", Change.GONE),
+    ]
+    assert diff.state("00303") is None
+
+
+def test_states_is_a_snapshot():
+    diff = AvailabilityDiff()
+    diff.update([row(general=True)])
+    states = diff.states()
+    diff.update([row()])
+    assert states == {"00301": Seats(True, False, False)}
+    assert diff.states() == {"00301": SOLD_OUT}
+
+
+def test_forget_reports_again():
+    diff = AvailabilityDiff()
+    diff.update([row(general=True)])
+    diff.forget("00301")
+    assert changes(diff.update([row(general=True)])) == [
+        ("00301", Change.GENERAL_OPENED)
+    ]
+
+
+def test_reservable():
+    assert Seats(True, False, False).reservable(SeatType.GENERAL_ONLY)
+    assert not Seats(False, True, True).reservable(SeatType.GENERAL_ONLY)
+    assert Seats(False, True, False).reservable(SeatType.GENERAL_FIRST)
+    assert Seats(False, False, True).reservable(SeatType.GENERAL_ONLY)
+    assert not SOLD_OUT.reservable()
+
+
+def test_watch_events_skips_openings_not_reservable_with_option():
+    diff = AvailabilityDiff()
+    events = watch_events(diff, [row(special=True)], SeatType.GENERAL_ONLY)
+    assert events == []
+
+
+def test_watch_events_reports_train_made_reservable_by_a_closing():
+    # 특실만 열려 있고 일반실 매진, 예약대기 가능: 일반실 전용으로는 예약 불가
+    diff = AvailabilityDiff()
+    option = SeatType.GENERAL_ONLY
+    assert watch_events(diff, [row(special=True, standby=True)], option) == []
+
+    # 특실이 닫히면 매진 + 예약대기: 예약대기로 예약 가능
+    events = watch_events(diff, [row(standby=True)], option)
+    assert changes(events) == [
+        ("00301", Change.SPECIAL_CLOSED),
+        ("00301", Change.RESERVABLE),
+    ]
+    assert events[-1].opened
+    assert events[-1].row == row(standby=True)
+
+
+def test_watch_events_reports_reservable_once():
+    diff = AvailabilityDiff()
+    watch_events(diff, [row(special=True, standby=True)], SeatType.GENERAL_ONLY)
+    events = watch_events(diff, [row(standby=True)], SeatType.GENERAL_ONLY)
+    assert [t for t in events if t.opened]
+    assert watch_events(diff, [row(standby=True)], SeatType.GENERAL_ONLY) == []
+
+
+def test_watch_events_repeat_reports_open_trains_every_poll():
+    diff = AvailabilityDiff()
+    for _ in range(3):
+        events = watch_events(diff, [row(general=True)], repeat=True)
+        assert changes(events) == [("00301", Change.GENERAL_OPENED)]
+
+
+def test_korail_seats():
+    assert korail_seats(
+        {"h_gen_rsv_cd": "11", "h_spe_rsv_cd": "13", "h_wait_rsv_flg": "9"}
+    ) == Seats(True, False, True)
+    assert korail_seats({}) == SOLD_OUT
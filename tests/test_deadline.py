@@ -0,0 +1,32 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from srtgo.deadline import bind_context, clip, deadline, remaining
+from srtgo.ktx import Korail, KorailTimeoutError
+from srtgo.standin import StandIn
+
+
+def test_nested_deadline_only_shortens():
+    assert remaining() is None
+    with deadline(10):
+        with deadline(60):
+            assert remaining() <= 10
+        with deadline(1):
+            assert clip(5) <= 1
+    assert clip(5) == 5
+
+
+def test_bind_context_carries_deadline_into_threads():
+    with deadline(10), ThreadPoolExecutor(max_workers=4) as pool:
+        plain = list(pool.map(lambda _: remaining(), range(4)))
+        bound = list(pool.map(bind_context(lambda _: remaining()), range(4)))
+    assert plain == [None] * 4
+    assert all(left is not None and 0 < left <= 10 for left in bound)
+
+
+def test_seat_lookups_in_workers_respect_deadline():
+    with StandIn(latency=0.2, tickets=4) as standin, standin.patch():
+        korail = Korail("standin", "standin", auto_login=False)
+        with deadline(0.3), pytest.raises(KorailTimeoutError):
+            korail.tickets()
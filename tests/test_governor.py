@@ -0,0 +1,49 @@
+import time
+
+import pytest
+
+from srtgo.deadline import deadline
+from srtgo.governor import Budget, RequestGovernor, TokenBucket
+
+HOST = "app.srail.or.kr:443"
+
+
+def test_bucket_allows_burst_then_spaces_requests():
+    bucket = TokenBucket(Budget(60, 3), now=0)
+    assert [bucket.take(0) for _ in range(3)] == [0, 0, 0]
+    assert bucket.take(0) == pytest.approx(1.0)
+    assert bucket.take(0) == pytest.approx(2.0)
+    # 대기 중인 요청이 토큰을 먼저 가져감
+    assert bucket.take(1.5) == pytest.approx(1.5)
+    assert bucket.remaining(100) == 3
+
+
+def test_every_bucket_bounds_the_wait():
+    governor = RequestGovernor(
+        hosts={HOST: Budget(600, 100)},
+        endpoints={"login": Budget(60, 1)},
+        account=Budget(120, 2),
+    )
+    assert governor.delay(HOST, "login", "user", now=0) == 0
+    assert governor.delay(HOST, "login", "user", now=0) == pytest.approx(1.0)
+    assert governor.delay(HOST, "search", "user", now=0) == pytest.approx(0.5)
+    assert governor.delay(HOST, "search", "other", now=0) == 0
+
+    stats = governor.stats(now=0)
+    assert stats["throttled"] == 2
+    assert stats["buckets"][f"{HOST} login"]["throttled"] == 1
+    assert stats["buckets"][f"{HOST} @user"]["throttled"] == 1
+
+
+def test_ungoverned_hosts_pass_through():
+    governor = RequestGovernor(hosts={HOST: Budget(60, 1)})
+    assert all(governor.delay("127.0.0.1:8080", now=0) == 0 for _ in range(10))
+
+
+def test_wait_never_outlasts_the_deadline():
+    governor = RequestGovernor(hosts={HOST: Budget(1, 1)}, account=None)
+    governor.wait(HOST)
+    started = time.monotonic()
+    with deadline(0.1):
+        governor.wait(HOST)  # 토큰까지 60초: 데드라인까지만 대기
+    assert time.monotonic() - started < 0.5
@@ -0,0 +1,180 @@
+import asyncio
+from urllib.parse import urlparse
+
+import pytest
+
+from srtgo import ktx
+from srtgo.ktx import AsyncKorail, Korail, TicketPage, _join_pages
+from srtgo.standin import KORAIL_TICKET_PAGE, StandIn
+
+SEAT_PATH = urlparse(ktx.API_ENDPOINTS["myticketseat"]).path
+LIST_PATH = urlparse(ktx.API_ENDPOINTS["myticketlist"]).path
+
+
+class FakeTicket:
+    def __init__(self, number):
+        self.number = number
+
+    def get_ticket_no(self):
+        return self.number
+
+
+def page(numbers, more=None):
+    return TicketPage([FakeTicket(n) for n in numbers], more)
+
+
+def joined(*pages):
+    tickets, more = _join_pages(list(pages))
+    return [t.number for t in tickets], more
+
+
+def test_join_pages_follows_next_page_flag():
+    assert joined(page([1, 2], True)) == ([1, 2], True)
+    assert joined(page([1, 2], True), page([3], False)) == ([1, 2, 3], False)
+    assert joined(page([1, 2], False), page([3])) == ([1, 2], False)
+
+
+def test_join_pages_without_flag_stops_at_short_empty_or_repeated_page():
+    assert joined(page([1, 2]), page([3, 4])) == ([1, 2, 3, 4], True)
+    assert joined(page([1, 2]), page([3])) == ([1, 2, 3], False)
+    assert joined(page([1, 2]), page([])) == ([1, 2], False)
+    assert joined(page([1, 2]), page([1, 2])) == ([1, 2], False)
+    assert joined(page([])) == ([], False)
+
+
+def test_tickets_read_every_page_and_load_seats_lazily():
+    with StandIn(tickets=25) as standin, standin.patch():
+        korail = Korail("standin", "standin", auto_login=False)
+        tickets = korail.tickets(with_seats=False, concurrency=1)
+        assert len(tickets) == 25
+        assert len({t.get_ticket_no() for t in tickets}) == 25
+        assert standin.hits[LIST_PATH] == -(-25 // KORAIL_TICKET_PAGE)
+        assert standin.hits[SEAT_PATH] == 0
+
+        tickets[0].seat_no
+        assert standin.hits[SEAT_PATH] == 1
+        korail.load_seats(tickets)
+        assert standin.hits[SEAT_PATH] == 25
+
+
+async def async_tickets(**kwargs):
+    korail = AsyncKorail("standin", "standin")
+    try:
+        return await korail.tickets(**kwargs)
+    finally:
+        await korail.close()
+
+
+@pytest.mark.parametrize("with_seats", [True, False])
+def test_async_tickets_match_sync(with_seats):
+    with StandIn(tickets=12) as standin, standin.patch():
+        korail = Korail("standin", "standin", auto_login=False)
+        expected = [t.seat_no for t in korail.tickets()]
+
+        standin.hits.clear()
+        tickets = asyncio.run(async_tickets(with_seats=with_seats))
+
+        assert standin.hits[SEAT_PATH] == (12 if with_seats else 0)
+        assert len(tickets) == 12
+        if with_seats:
+            assert [t.seat_no for t in tickets] == expected
+        else:
+            assert all(t.seat is None for t in tickets)
+
+
+def test_async_load_seats_skips_loaded_tickets():
+    async def run():
+        korail = AsyncKorail("standin", "standin")
+        try:
+            tickets = await korail.tickets(with_seats=False)
+            await korail.load_seats(tickets[:5])
+            standin.hits.clear()
+            await korail.load_seats(tickets)
+            return tickets
+        finally:
+            await korail.close()
+
+    with StandIn(tickets=12) as standin, standin.patch():
+        tickets = asyncio.run(run())
+        assert standin.hits[SEAT_PATH] == 7
+        assert all(t.seat_loaded for t in tickets)
+
+
+# reservations
+DETAILS_PATH = urlparse(ktx.API_ENDPOINTS["myreservationlist"]).path
+
+
+def test_reservation_details_are_loaded_lazily():
+    with StandIn(reservations=3) as standin, standin.patch():
+        korail = Korail("standin", "standin", auto_login=False)
+        reservations = korail.reservations()
+        assert len(reservations) == 3
+        assert standin.hits[DETAILS_PATH] == 0
+        assert not reservations[0].details_loaded
+
+        assert reservations[0].tickets
+        assert reservations[0].wct_no is not None
+        assert standin.hits[DETAILS_PATH] == 1
+
+        korail.load_details(reservations)
+        assert standin.hits[DETAILS_PATH] == 3
+
+
+def test_reservation_by_id_loads_only_that_one():
+    with StandIn(reservations=3) as standin, standin.patch():
+        korail = Korail("standin", "standin", auto_login=False)
+        wanted = korail.reservations()[1].rsv_id
+        reservation = korail.reservations(wanted)
+        assert reservation.rsv_id == wanted
+        assert reservation.details_loaded
+        assert standin.hits[DETAILS_PATH] == 1
+
+
+def test_async_reservation_details_wait_for_load_details():
+    async def run():
+        korail = AsyncKorail("standin", "standin")
+        try:
+            reservations = await korail.reservations()
+            assert all(r.tickets is None for r in reservations)
+            return await korail.load_details(reservations)
+        finally:
+            await korail.close()
+
+    with StandIn(reservations=3) as standin, standin.patch():
+        reservations = asyncio.run(run())
+        assert all(r.tickets for r in reservations)
+        assert standin.hits[DETAILS_PATH] == 3
+
+
+# login key
+CODE_PATH = urlparse(ktx.API_ENDPOINTS["code"]).path
+LOGIN_PATH = urlparse(ktx.API_ENDPOINTS["login"]).path
+
+
+def test_login_key_is_reused_until_it_expires(monkeypatch):
+    with StandIn() as standin, standin.patch():
+        korail = Korail("standin", "standin")
+        assert korail.login()
+        assert standin.hits[CODE_PATH] == 1
+
+        monkeypatch.setattr(ktx, "LOGIN_KEY_TTL", 0)
+        assert korail.login()
+        assert standin.hits[CODE_PATH] == 2
+
+
+def test_rejected_reused_key_is_retried_with_a_new_one():
+    with StandIn() as standin, standin.patch():
+        korail = Korail("standin", "standin")
+        standin.errors["login"] = [("WRD000000", "로그인 정보가 올바르지 않습니다")]
+        assert korail.login()
+        assert standin.hits[CODE_PATH] == 2
+        assert standin.hits[LOGIN_PATH] == 3
+
+
+def test_rejected_new_key_is_not_retried():
+    with StandIn(errors={"login": [("WRD000000", "비밀번호 오류")]}) as standin:
+        with standin.patch():
+            korail = Korail("standin", "standin", auto_login=False)
+            assert not korail.login()
+            assert standin.hits[LOGIN_PATH] == 1
+            assert korail._login_key is None
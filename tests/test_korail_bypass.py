@@ -0,0 +1,37 @@
+import pytest
+
+import korail_bypass
+from korail_bypass import KorailBypass, RsaKeyCache
+from srtgo.ktx import KorailError
+from srtgo.standin import StandIn
+
+PBLK_PATH = "/ebizweb/pwd_action/pblk"
+
+
+@pytest.fixture(autouse=True)
+def fresh_keys(monkeypatch):
+    monkeypatch.setattr(korail_bypass, "_RSA_KEYS", RsaKeyCache())
+    monkeypatch.setattr(korail_bypass, "LOGIN_RETRY_BASE", 0)
+
+
+def login(errors):
+    with StandIn(errors={"login": errors}) as standin, standin.patch():
+        rail = KorailBypass("standin", "standin", auto_login=False)
+        rail.login()
+        return standin.hits[PBLK_PATH]
+
+
+def test_account_error_keeps_key():
+    assert login([("WRC000391", "비밀번호가 일치하지 않습니다")] * 2) == 1
+
+
+@pytest.mark.parametrize(
+    "error", [("", "로그인 실패"), ("WRC000999", "비밀번호 복호화 오류입니다")]
+)
+def test_key_error_fetches_new_key(error):
+    assert login([error]) == 2
+
+
+def test_locked_account_raises():
+    with pytest.raises(KorailError):
+        login([("WRC000390", "계정 잠김")])
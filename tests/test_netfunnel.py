@@ -0,0 +1,183 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from srtgo import ktx, srt
+from srtgo.deadline import deadline
+from srtgo.netfunnel import (
+    MIN_TTL,
+    REFRESH_LEAD,
+    TTL_GROW_AFTER,
+    AsyncSingleFlight,
+    KeyCache,
+    KeyRefresher,
+    SingleFlight,
+)
+from srtgo.retry import ErrorKind, classify
+from srtgo.standin import StandIn
+
+
+def test_srt_netfunnel_timeout_stays_typed():
+    with StandIn(latency=0.3) as standin, standin.patch():
+        helper = srt.NetFunnelHelper(timeout=0.05)
+        with pytest.raises(srt.SRTTimeoutError) as info:
+            helper.run()
+    assert classify(info.value) is ErrorKind.TIMEOUT
+
+
+def test_async_srt_netfunnel_timeout_stays_typed():
+    async def run():
+        helper = srt.AsyncNetFunnelHelper(timeout=0.05)
+        try:
+            await helper.run()
+        finally:
+            await helper.close()
+
+    with StandIn(latency=0.3) as standin, standin.patch():
+        with pytest.raises(srt.SRTTimeoutError):
+            asyncio.run(run())
+
+
+def test_korail_netfunnel_deadline_stays_typed():
+    with StandIn() as standin, standin.patch():
+        helper = ktx.NetFunnelHelper()
+        with deadline(0), pytest.raises(ktx.KorailTimeoutError) as info:
+            helper.run()
+    assert classify(info.value) is ErrorKind.TIMEOUT
+    assert str(info.value) == "netfunnel 요청 전 기한 초과"
+
+
+def test_netfunnel_key_is_cached():
+    with StandIn() as standin, standin.patch():
+        helper = srt.NetFunnelHelper()
+        assert helper.run() == helper.run()
+        assert helper.stats()["misses"] == 1
+
+
+# KeyCache
+def test_key_expires_after_ttl():
+    cache = KeyCache(ttl=50)
+    cache.put("KEY", fetched_at=100, latency=0.1)
+    assert cache.get(now=149) == "KEY"
+    assert cache.get(now=150) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_rejection_learns_shorter_ttl():
+    cache = KeyCache(ttl=50)
+    cache.put("KEY", fetched_at=100, latency=0.1)
+    cache.invalidate(now=130)
+    assert cache.ttl == 29
+    assert cache.peek(now=100) is None
+
+    cache.put("KEY2", fetched_at=200, latency=0.1)
+    cache.invalidate(now=202)
+    assert cache.ttl == MIN_TTL
+
+
+def test_ttl_grows_back_without_rejections():
+    cache = KeyCache(ttl=50)
+    cache.put("KEY", fetched_at=0, latency=0.1)
+    cache.invalidate(now=30)
+    for i in range(TTL_GROW_AFTER + 1):
+        cache.put(f"KEY{i}", fetched_at=i, latency=0.1)
+    assert cache.ttl == 30
+
+
+def test_only_used_keys_are_refreshed():
+    cache = KeyCache(ttl=50)
+    cache.put("KEY", fetched_at=100, latency=0.1)
+    assert cache.refresh_in(now=110) is None
+    cache.get(now=110)
+    assert cache.refresh_in(now=110) == 50 - REFRESH_LEAD - 10
+    assert cache.refresh_in(now=151) is None
+
+
+def test_refresher_renews_before_expiry():
+    cache = KeyCache(ttl=REFRESH_LEAD + 0.2)
+    cache.put("KEY", fetched_at=time.time(), latency=0.1)
+    cache.get()
+
+    def acquire():
+        cache.put("NEW", fetched_at=time.time(), latency=0.1, background=True)
+
+    refresher = KeyRefresher(cache, acquire, interval=0.05)
+    refresher.start()
+    try:
+        time.sleep(0.5)
+    finally:
+        refresher.stop()
+        refresher.join()
+    assert cache.peek() == "NEW"
+    assert cache.refreshes == 1
+
+
+# SingleFlight
+def test_single_flight_shares_one_call():
+    flight = SingleFlight()
+    calls = []
+    entered = threading.Event()
+    release = threading.Event()
+
+    def acquire():
+        calls.append(1)
+        entered.set()
+        release.wait(1)
+        return "KEY"
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        leader = pool.submit(flight.do, acquire)
+        entered.wait(1)
+        followers = [pool.submit(flight.do, acquire) for _ in range(7)]
+        time.sleep(0.05)
+        release.set()
+        results = [leader.result()] + [f.result() for f in followers]
+    assert results == ["KEY"] * 8
+    assert len(calls) == 1
+    # 끝난 뒤의 호출은 새로 실행
+    assert flight.do(lambda: "NEXT") == "NEXT"
+
+
+def test_single_flight_shares_errors():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def fail():
+        release.wait(1)
+        raise ValueError("queue failed")
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(flight.do, fail) for _ in range(4)]
+        time.sleep(0.05)
+        release.set()
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result()
+
+
+def test_async_single_flight_shares_one_call():
+    calls = []
+
+    async def acquire():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "KEY"
+
+    async def run():
+        flight = AsyncSingleFlight()
+        return await asyncio.gather(*(flight.do(acquire) for _ in range(8)))
+
+    assert asyncio.run(run()) == ["KEY"] * 8
+    assert len(calls) == 1
+
+
+def test_concurrent_callers_queue_once():
+    with StandIn(latency=0.05, queue=[3, 2]) as standin, standin.patch():
+        helper = srt.NetFunnelHelper()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            keys = list(pool.map(lambda _: helper.run(), range(8)))
+    assert len(set(keys)) == 1
+    assert helper.stats()["acquisitions"] == 1
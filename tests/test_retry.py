@@ -0,0 +1,104 @@
+import datetime
+import json
+
+import pytest
+
+from srtgo.ktx import KorailError, NeedToLoginError, NoResultsError, SoldOutError
+from srtgo.retry import Action, CircuitBreaker, ErrorKind, RetryPolicy, classify
+from srtgo.scheduler import PollScheduler
+from srtgo.srt import (
+    SRT,
+    SRTBusyError,
+    SRTError,
+    SRTNetFunnelError,
+    SRTNotLoggedInError,
+    SRTSoldOutError,
+    SRTTimeoutError,
+    response_error,
+)
+from srtgo.standin import BUSY, NOT_LOGGED_IN, SOLD_OUT, StandIn
+
+
+def json_error():
+    try:
+        json.loads("<html>")
+    except json.JSONDecodeError as ex:
+        return ex
+
+
+@pytest.mark.parametrize(
+    "ex, kind",
+    [
+        (SRTSoldOutError(SOLD_OUT), ErrorKind.SOLD_OUT),
+        (SRTBusyError(BUSY), ErrorKind.BUSY),
+        (SRTNotLoggedInError(), ErrorKind.LOGIN),
+        (SRTNetFunnelError("rejected"), ErrorKind.NETFUNNEL),
+        (SRTTimeoutError("search_schedule", 5.0), ErrorKind.TIMEOUT),
+        (SRTError(BUSY), ErrorKind.BUSY),
+        (SRTError("unknown"), ErrorKind.FATAL),
+        (SoldOutError(), ErrorKind.SOLD_OUT),
+        (NoResultsError(), ErrorKind.EMPTY),
+        (NeedToLoginError(), ErrorKind.LOGIN),
+        (KorailError("unknown"), ErrorKind.FATAL),
+        (json_error(), ErrorKind.BAD_RESPONSE),
+        (ConnectionResetError(), ErrorKind.CONNECTION),
+        (ValueError("Date cannot be before today"), ErrorKind.FATAL),
+        (RuntimeError(), ErrorKind.FATAL),
+    ],
+)
+def test_classify(ex, kind):
+    assert classify(ex) is kind
+
+
+def test_response_error_types():
+    assert isinstance(response_error(SOLD_OUT), SRTSoldOutError)
+    assert isinstance(response_error(BUSY), SRTBusyError)
+    assert classify(response_error(NOT_LOGGED_IN)) is ErrorKind.LOGIN
+
+
+def test_decide_actions():
+    policy = RetryPolicy(PollScheduler(0.01))
+    assert policy.decide(SRTSoldOutError(SOLD_OUT)).action is Action.RETRY
+    assert policy.decide(SRTNotLoggedInError()).action is Action.RELOGIN
+    assert policy.decide(SRTNetFunnelError("x")).action is Action.REKEY
+    assert policy.decide(json_error()).action is Action.RELOGIN
+    assert policy.decide(ValueError("x")).action is Action.RAISE
+
+
+def test_answered_errors_do_not_count_as_failures():
+    policy = RetryPolicy(PollScheduler(0.01), CircuitBreaker(threshold=2))
+    for _ in range(5):
+        policy.decide(SRTSoldOutError(SOLD_OUT))
+    assert not policy.breaker.is_open
+    assert policy.scheduler.streak == 0
+
+
+def test_breaker_opens_after_threshold():
+    policy = RetryPolicy(PollScheduler(0.01), CircuitBreaker(threshold=3, cooldown=60))
+    policy.decide(ConnectionResetError())
+    policy.decide(ConnectionResetError())
+    assert not policy.tripped
+    policy.decide(ConnectionResetError())
+    assert policy.tripped and policy.breaker.is_open
+    assert policy.delay() > 50
+    policy.success()
+    assert not policy.breaker.is_open
+
+
+def test_breaker_remaining():
+    breaker = CircuitBreaker(threshold=1, cooldown=10)
+    assert breaker.failure(now=100.0)
+    assert breaker.remaining(now=104.0) == 6.0
+    assert breaker.remaining(now=111.0) == 0.0
+
+
+def test_watch_stops_on_a_past_date():
+    with StandIn() as standin, standin.patch():
+        srt = SRT("standin", "standin", auto_login=False)
+        # 자정을 넘긴 조회: 준비할 때는 오늘이던 날짜가 지남
+        yesterday = datetime.date.today() - datetime.timedelta(days=1)
+        search = srt.prepare_search("수서", "부산")._replace(
+            date=yesterday.strftime("%Y%m%d")
+        )
+        with pytest.raises(ValueError):
+            next(srt.watch(search, interval=0.01))
@@ -0,0 +1,44 @@
+from srtgo.scheduler import BUSY_RETRY, SLOW_CAP, STREAK_FREE, PollScheduler
+
+
+def test_load_backs_off_after_answers():
+    scheduler = PollScheduler()
+    for _ in range(20):
+        scheduler.success(0.15)
+    scheduler.success(5.0)
+    scheduler.success(5.0)
+    assert 1 < scheduler.level <= SLOW_CAP
+    scheduler.queue(1000)
+    assert scheduler.level == 11
+
+
+def test_overload_response_is_retried_soon():
+    scheduler = PollScheduler()
+    for _ in range(5):
+        scheduler.failure(busy=True)
+    assert scheduler.level == BUSY_RETRY
+    assert scheduler.streak == 0
+    # 다음 응답 뒤에는 누적된 오류율만큼 늦춤
+    scheduler.success(0.15)
+    assert scheduler.level > 3
+
+
+def test_silent_server_backs_off():
+    scheduler = PollScheduler(base=1.0, ceiling=30.0)
+    for _ in range(STREAK_FREE + 1):
+        scheduler.failure()
+    level = scheduler.level
+    scheduler.failure()
+    assert scheduler.level >= 2 * level
+    for _ in range(10):
+        scheduler.failure()
+    assert scheduler.interval() == 30.0
+
+
+def test_healthy_server_returns_to_base_rate():
+    scheduler = PollScheduler()
+    scheduler.failure(busy=True)
+    scheduler.queue(400)
+    for _ in range(40):
+        scheduler.success(0.15)
+    assert scheduler.level < 1.01
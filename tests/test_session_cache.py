@@ -0,0 +1,54 @@
+import os
+
+from srtgo.session_cache import SessionCache, new_key
+from srtgo.srt import SRT
+from srtgo.standin import NOT_LOGGED_IN, StandIn
+
+STATE = {"cookies": [{"name": "JSESSIONID", "value": "abc"}], "membership_number": "1"}
+
+
+def test_round_trip_is_encrypted(tmp_path):
+    cache = SessionCache(new_key(), tmp_path)
+    cache.save("SRT", "user", STATE)
+    assert cache.load("SRT", "user") == STATE
+    assert cache.load("KTX", "user") is None
+
+    (path,) = tmp_path.iterdir()
+    assert b"JSESSIONID" not in path.read_bytes()
+    assert path.stat().st_mode & 0o777 == 0o600
+
+
+def test_wrong_key_or_tampered_file_is_ignored(tmp_path):
+    key = new_key()
+    SessionCache(key, tmp_path).save("SRT", "user", STATE)
+    assert SessionCache(new_key(), tmp_path).load("SRT", "user") is None
+
+    (path,) = tmp_path.iterdir()
+    blob = bytearray(path.read_bytes())
+    blob[-1] ^= 1
+    path.write_bytes(bytes(blob))
+    assert SessionCache(key, tmp_path).load("SRT", "user") is None
+
+
+def test_stale_session_is_deleted(tmp_path):
+    cache = SessionCache(new_key(), tmp_path, ttl=-1)
+    cache.save("SRT", "user", STATE)
+    assert cache.load("SRT", "user") is None
+    assert not os.listdir(tmp_path)
+
+
+def test_srt_resumes_exported_session(tmp_path):
+    cache = SessionCache(new_key(), tmp_path)
+    with StandIn() as standin, standin.patch():
+        srt = SRT("standin", "standin")
+        cache.save("SRT", "standin", srt.export_session())
+
+        resumed = SRT("standin", "standin", auto_login=False)
+        assert resumed.resume_session(cache.load("SRT", "standin"))
+        assert resumed.is_login
+        assert resumed.membership_number == srt.membership_number
+
+        standin.errors["tickets"] = [NOT_LOGGED_IN]
+        expired = SRT("standin", "standin", auto_login=False)
+        assert not expired.resume_session(cache.load("SRT", "standin"))
+        assert not expired.is_login
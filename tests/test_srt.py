@@ -0,0 +1,200 @@
+import json
+import time
+from datetime import datetime
+from urllib.parse import urlparse
+
+import pytest
+
+from srtgo import srt as srt_module
+from srtgo.recorder import Replay
+from srtgo.srt import SRT, SeatType, SRTReservation, SRTTrain, TrainTable, _select_rows
+from srtgo.standin import StandIn, train_row
+
+RESERVE_PATH = urlparse(srt_module.API_ENDPOINTS["reserve"]).path
+
+
+def hits(standin, endpoint):
+    return standin.hits[urlparse(srt_module.API_ENDPOINTS[endpoint]).path]
+
+
+@pytest.fixture
+def standin():
+    with StandIn(rows=5, opens={1: 0}, reservations=1) as standin, standin.patch():
+        yield standin
+
+
+# prepared search
+def test_select_rows_filters():
+    rows = [train_row(i, available=i == 2) for i in range(5)]
+    selected = _select_rows(
+        rows, time="062000", time_limit="064000", train_numbers={"00301", "00302", "00304"}
+    )
+    assert [row["trnNo"] for row in selected] == ["00302", "00304"]
+    assert [row["trnNo"] for row in _select_rows(rows, available_only=True)] == ["00302"]
+    assert [
+        row["trnNo"] for row in _select_rows(rows, seat_type=SeatType.SPECIAL_ONLY)
+    ] == []
+
+
+def test_prepared_form_moves_start_time_for_today():
+    search = SRT("id", "pw", auto_login=False).prepare_search(
+        "수서", "부산", datetime.now().strftime("%Y%m%d"), "000000"
+    )
+    form = search.form("KEY", now=datetime.now().replace(hour=13, minute=5, second=0))
+    assert form["netfunnelKey"] == "KEY"
+    assert form["dptTm"] == "130500"
+    assert form["dptTm1"] == "130000"
+    assert search.body["dptTm"] == "000000"  # 준비된 검색은 그대로
+
+
+def test_search_rows_match_find_trains(standin):
+    srt = SRT("standin", "standin", auto_login=False)
+    search = srt.prepare_search("수서", "부산", "20301231", train_numbers={"00301", "00303"})
+    rows = srt.search_rows(search)
+    assert [row["trnNo"] for row in rows] == ["00301", "00303"]
+    trains = srt.find_trains("수서", "부산", "20301231", train_numbers={"00301", "00303"})
+    assert trains.keys() == srt.search_prepared(search).keys()
+    assert isinstance(trains["00301"], SRTTrain)
+
+
+# reserve
+def test_reserve_builds_reservation_from_response(standin):
+    srt = SRT("standin", "standin")
+    train = srt.find_trains("수서", "부산", "20301231")["00301"]
+    reservation = srt.reserve(train)
+
+    assert hits(standin, "tickets") == 0  # 예약 목록을 읽지 않음
+    assert reservation.reservation_number == f"{2:014d}"
+    assert reservation.total_cost == 52900
+    assert reservation.payment_date == "20301231"
+    assert reservation.payment_time == "235900"
+    assert not reservation.is_waiting
+    assert len(reservation.tickets) == 1
+
+
+def test_reserve_falls_back_without_deadline_in_response():
+    # 실제 서버 응답에 금액·결제기한이 없으면 예약 목록에서 찾음
+    body = json.dumps(
+        {
+            "resultMap": [{"strResult": "SUCC", "msgTxt": ""}],
+            "reservListMap": [{"pnrNo": f"{1:014d}"}],
+        }
+    )
+    replay = Replay([{"path": RESERVE_PATH, "status": 200, "body": body}])
+    with StandIn(rows=5, reservations=1, replay=replay) as standin, standin.patch():
+        srt = SRT("standin", "standin")
+        train = SRTTrain(train_row(0, available=True))
+        reservation = srt.reserve(train)
+
+        assert hits(standin, "tickets") == 1
+        assert reservation.reservation_number == f"{1:014d}"
+        assert reservation.payment_time == "235900"
+
+
+def test_has_reservation_fields():
+    full = {"pnrNo": "1", "rcvdAmt": "52900", "iseLmtDt": "20301231", "iseLmtTm": "235900"}
+    assert SRTReservation.has_reservation_fields(full, is_waiting=False)
+    assert not SRTReservation.has_reservation_fields({"pnrNo": "1"}, is_waiting=False)
+    assert SRTReservation.has_reservation_fields(
+        {"pnrNo": "1", "rcvdAmt": "52900"}, is_waiting=True
+    )
+
+
+# reservation tickets
+def test_reservation_tickets_are_loaded_lazily():
+    with StandIn(reservations=3) as standin, standin.patch():
+        srt = SRT("standin", "standin")
+        reservations = srt.get_reservations()
+        assert len(reservations) == 3
+        assert hits(standin, "ticket_info") == 0
+        assert not reservations[0].tickets_loaded
+
+        assert len(reservations[0].tickets) == 1
+        assert hits(standin, "ticket_info") == 1
+        assert reservations[0].tickets_loaded
+
+
+def test_load_tickets_fetches_only_pending_reservations():
+    with StandIn(reservations=4) as standin, standin.patch():
+        srt = SRT("standin", "standin")
+        reservations = srt.get_reservations()
+        reservations[0].tickets
+        srt.load_tickets(reservations)
+        assert hits(standin, "ticket_info") == 4
+        assert all(r.tickets_loaded for r in reservations)
+
+        srt.get_reservations(with_tickets=True)
+        assert hits(standin, "ticket_info") == 8
+
+
+def test_with_tickets_loads_concurrently():
+    with StandIn(latency=0.1, reservations=6) as standin, standin.patch():
+        srt = SRT("standin", "standin")
+        started = time.monotonic()
+        srt.get_reservations(with_tickets=True)
+        # 목록 1회 + 승차권 6건 동시 조회: 순차(0.7 s)보다 빨라야 함
+        assert time.monotonic() - started < 0.5
+
+
+# TrainTable
+def table_rows():
+    rows = [train_row(i, available=i in (1, 3)) for i in range(5)]
+    rows[4]["dptTm"] = "055000"  # 출발 시각 순서와 행 순서가 다름
+    rows.append({**train_row(5), "stlbTrnClsfCd": "00"})  # SRT 외 열차
+    return rows
+
+
+def test_train_table_matches_srt_trains():
+    rows = table_rows()
+    table = TrainTable.from_rows(rows)
+    trains = [SRTTrain(row) for row in rows[:5]]
+    assert len(table) == 5
+    for train, expected in zip(table, trains):
+        assert str(train) == str(expected)
+        assert train.reserve_wait_possible_code == expected.reserve_wait_possible_code
+    assert table.column("train_number") == tuple(t.train_number for t in trains)
+    assert not hasattr(trains[0], "__dict__")
+
+
+def test_train_table_filters_are_views():
+    table = TrainTable.from_rows(table_rows())
+    assert table.find("00303").train_number == "00303"
+    assert table.find("00305") is None
+
+    early = table.departing_by("061000")
+    assert early.column("train_number") == ("00300", "00301", "00304")
+    available = early.available()
+    assert available.column("train_number") == ("00301",)
+    assert available.find("00303") is None
+    assert [t.train_number for t in table.available()] == ["00301", "00303"]
+
+
+# filter pushdown
+def test_seat_type_filter_counts_open_standby():
+    rows = [train_row(i) for i in range(4)]
+    rows[0]["gnrmRsvPsbStr"] = "예약가능"
+    rows[1]["sprmRsvPsbStr"] = "예약가능"
+    rows[2]["rsvWaitPsbCd"] = "9"  # 매진, 예약대기 가능
+
+    def numbers(seat_type):
+        return [row["trnNo"] for row in _select_rows(rows, seat_type=seat_type)]
+
+    assert numbers(SeatType.GENERAL_ONLY) == ["00300", "00302"]
+    assert numbers(SeatType.SPECIAL_ONLY) == ["00301", "00302"]
+    assert numbers(SeatType.GENERAL_FIRST) == ["00300", "00301", "00302"]
+
+
+def test_search_train_filters_match_building_every_train(standin):
+    srt = SRT("standin", "standin", auto_login=False)
+    every = srt.search_train("수서", "부산", "20301231", available_only=False)
+    assert len(every) == 5
+
+    limited = srt.search_train(
+        "수서", "부산", "20301231", time_limit="062000", available_only=False
+    )
+    assert [str(t) for t in limited] == [str(t) for t in every if t.dep_time <= "062000"]
+
+    available = srt.search_train("수서", "부산", "20301231")
+    table = srt.search_train("수서", "부산", "20301231", as_table=True)
+    assert [t.train_number for t in available] == ["00301"]
+    assert table.column("train_number") == ("00301",)
@@ -0,0 +1,25 @@
+from srtgo.ktx import Korail, Train as KorailTrain
+from srtgo.srt import SRT, SRTTrain
+from srtgo.srtgo import _held_reservation
+from srtgo.standin import StandIn, korail_train_row, train_row
+
+
+def test_held_srt_reservation_is_found_after_a_timeout():
+    with StandIn(rows=5, opens={1: 0}) as standin, standin.patch():
+        srt = SRT("standin", "standin")
+        train = SRTTrain(train_row(1, available=True))
+        assert _held_reservation(srt, train) is None
+        reservation = srt.reserve(train)
+        held = _held_reservation(srt, train)
+        assert held.reservation_number == reservation.reservation_number
+        assert _held_reservation(srt, SRTTrain(train_row(2))) is None
+
+
+def test_held_korail_reservation_is_found_after_a_timeout():
+    with StandIn(rows=5, opens={1: 0}) as standin, standin.patch():
+        korail = Korail("standin", "standin")
+        train = KorailTrain(korail_train_row(1, available=True))
+        assert _held_reservation(korail, train) is None
+        reservation = korail.reserve(train)
+        assert _held_reservation(korail, train).rsv_id == reservation.rsv_id
+        assert _held_reservation(korail, KorailTrain(korail_train_row(2))) is None